@@ -8,8 +8,8 @@ def clean_abi_item(item):
     if isinstance(item, dict):
         cleaned = {}
         for key, value in item.items():
-            # Skip null/None values and internal fields
-            if value is None or key in ['components', 'internal_type']:
+            # Skip null/None values and internal fields (struct components are kept)
+            if value is None or key == 'internal_type':
                 continue
             # Recursively clean nested items
             if isinstance(value, (dict, list)):
@@ -54,6 +54,21 @@ event BatchRecalled:
     reasonHash: bytes32
 
 
+struct BatchView:
+    id: uint256
+    owner: address
+    status: uint256
+    uri: String[256]
+
+struct RoleAssignment:
+    role: bytes32
+    account: address
+
+struct CallResult:
+    success: bool
+    returnData: Bytes[MULTICALL_RETURN_BUFFER]
+
+
 interface ERC721Receiver:
     def onERC721Received(
         _operator: address,
@@ -71,6 +86,7 @@ interface ERC721Receiver:
 INTERFACE_ID_ERC165: constant(bytes4) = 0x01ffc9a7
 INTERFACE_ID_ERC721: constant(bytes4) = 0x80ac58cd
 INTERFACE_ID_ERC721_METADATA: constant(bytes4) = 0x5b5e139f
+INTERFACE_ID_ERC721_ENUMERABLE: constant(bytes4) = 0x780e9d63
 
 # ERC721 receiver magic value
 ERC721_RECEIVED: constant(bytes4) = 0x150b7a02
@@ -85,10 +101,48 @@ RETAILED: constant(uint256) = 5
 CONSUMED: constant(uint256) = 6
 RECALLED: constant(uint256) = 7
 
+# Packed batch state: owner in bits 0-159, status in bits 160-167,
+# position in the owner's list in bits 168-211, position in the status list in bits 212+
+STATUS_SHIFT: constant(uint256) = 160
+OWNER_INDEX_SHIFT: constant(uint256) = 168
+STATUS_INDEX_SHIFT: constant(uint256) = 212
+OWNER_MASK: constant(uint256) = 2**160 - 1
+STATUS_MASK: constant(uint256) = 255
+INDEX_MASK: constant(uint256) = 2**44 - 1
+# Owner + owner index bits; everything else is status + status index
+OWNER_FIELDS_MASK: constant(uint256) = 2**212 - 1 - 255 * 2**160
+
+# Status set sizes packed 32 bits per status into statusCounts, so a transition
+# updates both counts with one warm SSTORE and a set emptying/refilling never
+# pays a 0 -> nonzero write
+COUNT_BITS: constant(uint256) = 32
+COUNT_MASK: constant(uint256) = 2**32 - 1
+
 # Special vaults
 ARCHIVE_VAULT: constant(address) = 0x000000000000000000000000000000000000aaaa
 QUARANTINE_VAULT: constant(address) = 0x000000000000000000000000000000000000dEaD
 
+# Max batches returned by one getBatchesInRange call
+MAX_BATCH_PAGE: constant(uint256) = 100
+
+# Max lots registered by one mintBatches call
+MAX_MINT_BATCH: constant(uint256) = 50
+
+# Max batches moved by one batchTransferFrom / advanceBatchRetailStatusMany call
+MAX_BULK_BATCHES: constant(uint256) = 100
+
+# Max role changes applied by one grantRoles / revokeRoles call
+MAX_ROLE_BATCH: constant(uint256) = 100
+
+# multicall bounds: calls per eth_call, calldata per call, return data per call
+# (512 bytes fits a one-batch getBatchesInRange page with a full 256-byte URI,
+# and so every single-value getter). The buffer holds one spare byte so a
+# longer return is detected instead of silently truncated
+MAX_MULTICALL: constant(uint256) = 100
+MAX_MULTICALL_CALLDATA: constant(uint256) = 260
+MAX_MULTICALL_RETURN: constant(uint256) = 512
+MULTICALL_RETURN_BUFFER: constant(uint256) = MAX_MULTICALL_RETURN + 1
+
 # Roles
 ADMIN_ROLE: constant(bytes32) = keccak256("ADMIN_ROLE")
 FARMER_ROLE: constant(bytes32) = keccak256("FARMER_ROLE")
@@ -96,6 +150,14 @@ INSPECTOR_ROLE: constant(bytes32) = keccak256("INSPECTOR_ROLE")
 LOGISTICS_ROLE: constant(bytes32) = keccak256("LOGISTICS_ROLE")
 RETAILER_ROLE: constant(bytes32) = keccak256("RETAILER_ROLE")
 
+# Role bits in roleMask (one storage read answers every role question)
+FARMER_BIT: constant(uint256) = 1
+INSPECTOR_BIT: constant(uint256) = 2
+LOGISTICS_BIT: constant(uint256) = 4
+RETAILER_BIT: constant(uint256) = 8
+ADMIN_BIT: constant(uint256) = 16
+SUPPLY_CHAIN_BITS: constant(uint256) = 15
+
 
 # =========================
 # STATE VARIABLES
@@ -105,20 +167,29 @@ RETAILER_ROLE: constant(bytes32) = keccak256("RETAILER_ROLE")
 name: public(String[32])
 symbol: public(String[32])
 
-# ERC721 ownership
-tokenOwner: public(HashMap[uint256, address])
+# ERC721 ownership (per-token owner lives in batchState)
 ownedTokensCount: HashMap[address, uint256]
 tokenApprovals: HashMap[uint256, address]
 operatorApprovals: public(HashMap[address, HashMap[address, bool]])
 
+# ERC721 enumeration: owner -> index -> token (each token's index lives in batchState)
+ownedTokens: HashMap[address, HashMap[uint256, uint256]]
+
+# Status sets: status -> index -> batch (each batch's index lives in batchState)
+statusBatches: HashMap[uint256, HashMap[uint256, uint256]]
+statusCounts: uint256
+
 # Per-batch URI (IPFS CID or URL)
 tokenURIs: public(HashMap[uint256, String[256]])
 
 # Agri-chain state
 tokenCounter: public(uint256)
 contractOwner: public(address)
-batchStatus: public(HashMap[uint256, uint256])
+# Owner, status and both list indexes packed into one slot, so transitions touch a single cold slot
+batchState: HashMap[uint256, uint256]
 roles: public(HashMap[bytes32, HashMap[address, bool]])
+# Bitmask mirror of the built-in roles, kept in sync by _grantRole/_revokeRole
+roleMask: public(HashMap[address, uint256])
 
 
 # =========================
@@ -138,36 +209,184 @@ def __init__():
 # INTERNAL ROLE HELPERS
 # =========================
 
+@pure
+@internal
+def _roleBit(_role: bytes32) -> uint256:
+    # 0 for roles outside the built-in set; those only live in `roles`
+    if _role == FARMER_ROLE:
+        return FARMER_BIT
+    if _role == INSPECTOR_ROLE:
+        return INSPECTOR_BIT
+    if _role == LOGISTICS_ROLE:
+        return LOGISTICS_BIT
+    if _role == RETAILER_ROLE:
+        return RETAILER_BIT
+    if _role == ADMIN_ROLE:
+        return ADMIN_BIT
+    return 0
+
+@view
+@internal
+def _hasRoleBit(_account: address, _bit: uint256) -> bool:
+    return self.roleMask[_account] & _bit != 0
+
 @view
 @internal
 def _checkRole(_role: bytes32, _account: address):
-    assert self.roles[_role][_account], "Missing required role"
+    bit: uint256 = self._roleBit(_role)
+    if bit != 0:
+        assert self._hasRoleBit(_account, bit), "Missing required role"
+    else:
+        assert self.roles[_role][_account], "Missing required role"
 
 @internal
 def _grantRole(_role: bytes32, _account: address):
     self.roles[_role][_account] = True
+    bit: uint256 = self._roleBit(_role)
+    if bit != 0:
+        self.roleMask[_account] |= bit
     log RoleGranted(_role, _account, msg.sender)
 
 @internal
 def _revokeRole(_role: bytes32, _account: address):
     self.roles[_role][_account] = False
+    bit: uint256 = self._roleBit(_role)
+    if bit != 0:
+        self.roleMask[_account] &= ~bit
     log RoleRevoked(_role, _account, msg.sender)
 
+@view
+@internal
+def _roleFlags(_account: address) -> uint256:
+    return self.roleMask[_account] & SUPPLY_CHAIN_BITS
+
 @view
 @internal
 def _checkExists(_batchId: uint256):
-    assert len(self.tokenURIs[_batchId]) > 0, "Unknown batch"
+    # Every minted batch has a non-zero status, so its packed state is never empty
+    assert self.batchState[_batchId] != 0, "Unknown batch"
+
+
+# =========================
+# INTERNAL BATCH STATE HELPERS
+# =========================
+
+@pure
+@internal
+def _stateOwner(_state: uint256) -> address:
+    return convert(_state & OWNER_MASK, address)
+
+@pure
+@internal
+def _stateStatus(_state: uint256) -> uint256:
+    return (_state >> STATUS_SHIFT) & STATUS_MASK
+
+@pure
+@internal
+def _stateOwnerIndex(_state: uint256) -> uint256:
+    return (_state >> OWNER_INDEX_SHIFT) & INDEX_MASK
+
+@pure
+@internal
+def _stateStatusIndex(_state: uint256) -> uint256:
+    return _state >> STATUS_INDEX_SHIFT
+
+@pure
+@internal
+def _withOwner(_state: uint256, _owner: address, _ownerIndex: uint256) -> uint256:
+    return (_state & ~OWNER_FIELDS_MASK) | convert(_owner, uint256) | (_ownerIndex << OWNER_INDEX_SHIFT)
+
+@pure
+@internal
+def _withStatus(_state: uint256, _status: uint256, _statusIndex: uint256) -> uint256:
+    return (_state & OWNER_FIELDS_MASK) | (_status << STATUS_SHIFT) | (_statusIndex << STATUS_INDEX_SHIFT)
+
+@pure
+@internal
+def _countOf(_counts: uint256, _status: uint256) -> uint256:
+    return (_counts >> (_status * COUNT_BITS)) & COUNT_MASK
+
+@view
+@internal
+def _statusBatchCount(_status: uint256) -> uint256:
+    if _status > RECALLED:
+        return 0
+    return self._countOf(self.statusCounts, _status)
+
+@internal
+def _removeFromStatusSet(_status: uint256, _index: uint256, _lastIndex: uint256):
+    # Swap-and-pop, mirroring _removeTokenFromOwnerEnumeration (popped slot left
+    # stale; the set's count bounds getBatchesByStatus)
+    if _index != _lastIndex:
+        lastBatchId: uint256 = self.statusBatches[_status][_lastIndex]
+        self.statusBatches[_status][_index] = lastBatchId
+        self.batchState[lastBatchId] = self._withStatus(self.batchState[lastBatchId], _status, _index)
+
+@internal
+def _setStatus(_batchId: uint256, _state: uint256, _newStatus: uint256) -> uint256:
+    # Moves the batch between status sets; the caller stores the returned state
+    counts: uint256 = self.statusCounts
+    oldStatus: uint256 = self._stateStatus(_state)
+    if oldStatus != NOT_EXIST:
+        self._removeFromStatusSet(oldStatus, self._stateStatusIndex(_state), self._countOf(counts, oldStatus) - 1)
+        counts -= 1 << (oldStatus * COUNT_BITS)
+
+    index: uint256 = self._countOf(counts, _newStatus)
+    self.statusBatches[_newStatus][index] = _batchId
+    self.statusCounts = counts + (1 << (_newStatus * COUNT_BITS))
+    return self._withStatus(_state, _newStatus, index)
+
+
+@view
+@internal
+def _batchView(_batchId: uint256) -> BatchView:
+    state: uint256 = self.batchState[_batchId]
+    return BatchView(
+        id=_batchId,
+        owner=self._stateOwner(state),
+        status=self._stateStatus(state),
+        uri=self.tokenURIs[_batchId]
+    )
+
+
+# =========================
+# INTERNAL MINT HELPER
+# =========================
+
+@internal
+def _mintBatch(_farmer: address, _batchId: uint256, _uri: String[256], _ownerIndex: uint256):
+    # Caller is responsible for tokenCounter and ownedTokensCount
+    assert len(_uri) > 0, "URI required"
+
+    self.tokenURIs[_batchId] = _uri
+    self.batchState[_batchId] = self._setStatus(_batchId, self._withOwner(0, _farmer, _ownerIndex), HARVESTED)
+    self.ownedTokens[_farmer][_ownerIndex] = _batchId
+
+    log URI(_uri, _batchId)
+    log StatusUpdated(_batchId, _farmer, NOT_EXIST, HARVESTED)
+    log BatchMinted(_batchId, _farmer)
+    log Transfer(empty(address), _farmer, _batchId)
 
 
 # =========================
 # INTERNAL ERC721 HELPERS
 # =========================
 
+@internal
+def _removeTokenFromOwnerEnumeration(_from: address, _tokenIndex: uint256, _lastIndex: uint256):
+    # Swap-and-pop: the owner's last token takes the freed slot. The popped slot
+    # is left stale (ownedTokensCount bounds every read), so refilling it later
+    # is a nonzero -> nonzero write instead of a fresh 20k SSTORE
+    if _tokenIndex != _lastIndex:
+        lastTokenId: uint256 = self.ownedTokens[_from][_lastIndex]
+        self.ownedTokens[_from][_tokenIndex] = lastTokenId
+        self.batchState[lastTokenId] = self._withOwner(self.batchState[lastTokenId], _from, _tokenIndex)
+
 @view
 @internal
 def _isApprovedOrOwner(_spender: address, _tokenId: uint256) -> bool:
     self._checkExists(_tokenId)
-    owner: address = self.tokenOwner[_tokenId]
+    owner: address = self._stateOwner(self.batchState[_tokenId])
     return (
         _spender == owner or
         self.tokenApprovals[_tokenId] == _spender or
@@ -180,15 +399,26 @@ def _clearApproval(_tokenId: uint256):
         self.tokenApprovals[_tokenId] = empty(address)
 
 @internal
-def _transfer(_from: address, _to: address, _tokenId: uint256):
-    assert self.tokenOwner[_tokenId] == _from, "From is not owner"
+def _transfer(_from: address, _to: address, _tokenId: uint256, _status: uint256):
+    state: uint256 = self.batchState[_tokenId]
+    assert self._stateOwner(state) == _from, "From is not owner"
 
     self._clearApproval(_tokenId)
 
-    self.ownedTokensCount[_from] -= 1
-    self.ownedTokensCount[_to] += 1
+    fromBalance: uint256 = self.ownedTokensCount[_from]
+    self._removeTokenFromOwnerEnumeration(_from, self._stateOwnerIndex(state), fromBalance - 1)
+    self.ownedTokensCount[_from] = fromBalance - 1
+
+    # Read after the removal: a multi-role account may transfer to itself
+    toBalance: uint256 = self.ownedTokensCount[_to]
+    self.ownedTokens[_to][toBalance] = _tokenId
+    self.ownedTokensCount[_to] = toBalance + 1
 
-    self.tokenOwner[_tokenId] = _to
+    if _status != self._stateStatus(state):
+        state = self._setStatus(_tokenId, state, _status)
+
+    # New owner, (possibly advanced) status and both indexes land in a single SSTORE
+    self.batchState[_tokenId] = self._withOwner(state, _to, toBalance)
 
     log Transfer(_from, _to, _tokenId)
 
@@ -208,8 +438,17 @@ def _checkOnERC721Received(_from: address, _to: address, _tokenId: uint256, _dat
 # INTERNAL BUSINESS HELPERS
 # =========================
 
+@view
+@internal
+def _recipientFlags(_to: address, _tokenId: uint256) -> uint256:
+    # RECALLED / CONSUMED batches go to vaults; recipient roles are never consulted
+    _status: uint256 = self._stateStatus(self.batchState[_tokenId])
+    if _status == RECALLED or _status == CONSUMED:
+        return 0
+    return self._roleFlags(_to)
+
 @internal
-def _recipient_allowed_for_status(_to: address, _status: uint256):
+def _recipient_allowed_for_status(_to: address, _toFlags: uint256, _status: uint256):
     if _status == RECALLED:
         assert _to == QUARANTINE_VAULT, "Can only transfer RECALLED to QUARANTINE_VAULT"
         return
@@ -218,39 +457,33 @@ def _recipient_allowed_for_status(_to: address, _status: uint256):
         assert _to == ARCHIVE_VAULT, "Can only transfer CONSUMED to ARCHIVE_VAULT"
         return
 
-    has_any: bool = (
-        self.roles[FARMER_ROLE][_to] or
-        self.roles[INSPECTOR_ROLE][_to] or
-        self.roles[LOGISTICS_ROLE][_to] or
-        self.roles[RETAILER_ROLE][_to]
-    )
-
-    assert has_any, "Recipient has no valid supply-chain role"
+    assert _toFlags != 0, "Recipient has no valid supply-chain role"
 
     if _status == HARVESTED:
         assert False, "Cannot transfer in HARVESTED state"
 
     elif _status == INSPECTING:
-        assert self.roles[LOGISTICS_ROLE][_to], "Recipient must be logistics"
+        assert _toFlags & LOGISTICS_BIT != 0, "Recipient must be logistics"
 
     elif _status == IN_TRANSIT:
-        assert self.roles[RETAILER_ROLE][_to], "Recipient must be retailer"
+        assert _toFlags & RETAILER_BIT != 0, "Recipient must be retailer"
 
     elif _status == DELIVERED or _status == RETAILED:
         assert False, "Token in DELIVERED/RETAILED state cannot be transferred"
 
 @internal
-def _agri_transfer(_from: address, _to: address, _tokenId: uint256, _data: Bytes[1024]):
-    self._checkExists(_tokenId)
-    assert _from == self.tokenOwner[_tokenId], "From is not owner"
+def _agri_transfer(_from: address, _to: address, _tokenId: uint256, _data: Bytes[1024], _toFlags: uint256):
+    state: uint256 = self.batchState[_tokenId]
+    assert state != 0, "Unknown batch"
+    assert _from == self._stateOwner(state), "From is not owner"
 
-    _status: uint256 = self.batchStatus[_tokenId]
-    self._recipient_allowed_for_status(_to, _status)
+    _status: uint256 = self._stateStatus(state)
+    self._recipient_allowed_for_status(_to, _toFlags, _status)
 
     if _status == RECALLED and _to == QUARANTINE_VAULT:
         assert (msg.sender == _from), \
             "Only holder can transfer recalled batch"
-        self._transfer(_from, _to, _tokenId)
+        self._transfer(_from, _to, _tokenId, _status)
         return
 
     assert _to != empty(address), "ERC721: transfer to zero address"
@@ -258,26 +491,43 @@ def _agri_transfer(_from: address, _to: address, _tokenId: uint256, _data: Bytes
     if _status == CONSUMED and _to == ARCHIVE_VAULT:
         assert (msg.sender == _from), \
             "Only holder can archive consumed batch"
-        self._transfer(_from, _to, _tokenId)
+        self._transfer(_from, _to, _tokenId, _status)
         log BatchArchived(_tokenId, _from, _to)
         return
 
     # Status transitions along the logistics route
-    if _status == INSPECTING and self.roles[LOGISTICS_ROLE][_to]:
-        assert self.roles[FARMER_ROLE][_from], "Logistics must receive batch from farmer holder"
-        assert self.roles[FARMER_ROLE][msg.sender], \
+    _newStatus: uint256 = _status
+    if _status == INSPECTING and _toFlags & LOGISTICS_BIT != 0:
+        assert self._hasRoleBit(_from, FARMER_BIT), "Logistics must receive batch from farmer holder"
+        assert self._hasRoleBit(msg.sender, FARMER_BIT), \
             "Actor must be farmer to transfer batch to logistics (delegation allowed only within FARMER role)"
-        self.batchStatus[_tokenId] = IN_TRANSIT
+        _newStatus = IN_TRANSIT
         log StatusUpdated(_tokenId, msg.sender, INSPECTING, IN_TRANSIT)
 
-    elif _status == IN_TRANSIT and self.roles[RETAILER_ROLE][_to]:
-        assert self.roles[LOGISTICS_ROLE][_from], "Retailer must receive batch from logistics holder"
-        assert self.roles[LOGISTICS_ROLE][msg.sender], \
+    elif _status == IN_TRANSIT and _toFlags & RETAILER_BIT != 0:
+        assert self._hasRoleBit(_from, LOGISTICS_BIT), "Retailer must receive batch from logistics holder"
+        assert self._hasRoleBit(msg.sender, LOGISTICS_BIT), \
             "Actor must be logistics to transfer batch to retailer (delegation allowed only within LOGISTICS role)"
-        self.batchStatus[_tokenId] = DELIVERED
+        _newStatus = DELIVERED
         log StatusUpdated(_tokenId, msg.sender, IN_TRANSIT, DELIVERED)
 
-    self._transfer(_from, _to, _tokenId)
+    self._transfer(_from, _to, _tokenId, _newStatus)
+
+@internal
+def _advanceRetailStatus(_batchId: uint256):
+    state: uint256 = self.batchState[_batchId]
+    assert self._stateOwner(state) == msg.sender, "Not current holder"
+
+    _currentStatus: uint256 = self._stateStatus(state)
+
+    if _currentStatus == DELIVERED:
+        self.batchState[_batchId] = self._setStatus(_batchId, state, RETAILED)
+        log StatusUpdated(_batchId, msg.sender, DELIVERED, RETAILED)
+    elif _currentStatus == RETAILED:
+        self.batchState[_batchId] = self._setStatus(_batchId, state, CONSUMED)
+        log StatusUpdated(_batchId, msg.sender, RETAILED, CONSUMED)
+    else:
+        assert False, "Invalid state for retail progress"
 
 
 # =========================
@@ -294,6 +544,21 @@ def revokeRole(_role: bytes32, _account: address):
     self._checkRole(ADMIN_ROLE, msg.sender)
     self._revokeRole(_role, _account)
 
+@external
+def grantRoles(_assignments: DynArray[RoleAssignment, MAX_ROLE_BATCH]):
+    # Admin check paid once for a whole onboarding roster; one RoleGranted per entry
+    self._checkRole(ADMIN_ROLE, msg.sender)
+    assert len(_assignments) > 0, "No role assignments given"
+    for _assignment: RoleAssignment in _assignments:
+        self._grantRole(_assignment.role, _assignment.account)
+
+@external
+def revokeRoles(_assignments: DynArray[RoleAssignment, MAX_ROLE_BATCH]):
+    self._checkRole(ADMIN_ROLE, msg.sender)
+    assert len(_assignments) > 0, "No role assignments given"
+    for _assignment: RoleAssignment in _assignments:
+        self._revokeRole(_assignment.role, _assignment.account)
+
 @view
 @external
 def hasRole(_role: bytes32, _account: address) -> bool:
@@ -307,24 +572,36 @@ def hasRole(_role: bytes32, _account: address) -> bool:
 @external
 def mintBatch(_uri: String[256]) -> uint256:
     self._checkRole(FARMER_ROLE, msg.sender)
-    assert len(_uri) > 0, "URI required"
 
     batchId: uint256 = self.tokenCounter + 1
+    balance: uint256 = self.ownedTokensCount[msg.sender]
     self.tokenCounter = batchId
+    self.ownedTokensCount[msg.sender] = balance + 1
 
-    self.tokenURIs[batchId] = _uri
+    self._mintBatch(msg.sender, batchId, _uri, balance)
 
-    self.tokenOwner[batchId] = msg.sender
-    self.ownedTokensCount[msg.sender] += 1
+    return batchId
 
-    self.batchStatus[batchId] = HARVESTED
 
-    log URI(_uri, batchId)
-    log StatusUpdated(batchId, msg.sender, NOT_EXIST, HARVESTED)
-    log BatchMinted(batchId, msg.sender)
-    log Transfer(empty(address), msg.sender, batchId)
+@external
+def mintBatches(_uris: DynArray[String[256], MAX_MINT_BATCH]) -> DynArray[uint256, MAX_MINT_BATCH]:
+    # Role check, counter and balance writes are paid once for the whole harvest
+    self._checkRole(FARMER_ROLE, msg.sender)
+    assert len(_uris) > 0, "No URIs given"
 
-    return batchId
+    batchIds: DynArray[uint256, MAX_MINT_BATCH] = []
+    batchId: uint256 = self.tokenCounter
+    balance: uint256 = self.ownedTokensCount[msg.sender]
+    for _uri: String[256] in _uris:
+        self._mintBatch(msg.sender, batchId + 1, _uri, balance)
+        batchId += 1
+        balance += 1
+        batchIds.append(batchId)
+
+    self.tokenCounter = batchId
+    self.ownedTokensCount[msg.sender] = balance
+
+    return batchIds
 
 
 @external
@@ -333,14 +610,15 @@ def markBatchInspected(_batchId: uint256, _newURI: String[256]):
     self._checkRole(INSPECTOR_ROLE, msg.sender)
     assert len(_newURI) > 0, "New URI required for attestation"
 
-    _currentStatus: uint256 = self.batchStatus[_batchId]
+    state: uint256 = self.batchState[_batchId]
+    _currentStatus: uint256 = self._stateStatus(state)
     assert _currentStatus == HARVESTED, "Must be in HARVESTED state"
 
-    owner: address = self.tokenOwner[_batchId]
-    assert self.roles[FARMER_ROLE][owner], "Batch must be held by a farmer"
+    owner: address = self._stateOwner(state)
+    assert self._hasRoleBit(owner, FARMER_BIT), "Batch must be held by a farmer"
 
     # Update status
-    self.batchStatus[_batchId] = INSPECTING
+    self.batchState[_batchId] = self._setStatus(_batchId, state, INSPECTING)
     log StatusUpdated(_batchId, msg.sender, HARVESTED, INSPECTING)
     log BatchInspected(_batchId, msg.sender)
     
@@ -353,18 +631,18 @@ def markBatchInspected(_batchId: uint256, _newURI: String[256]):
 def advanceBatchRetailStatus(_batchId: uint256):
     self._checkExists(_batchId)
     self._checkRole(RETAILER_ROLE, msg.sender)
-    assert self.tokenOwner[_batchId] == msg.sender, "Not current holder"
+    self._advanceRetailStatus(_batchId)
 
-    _currentStatus: uint256 = self.batchStatus[_batchId]
 
-    if _currentStatus == DELIVERED:
-        self.batchStatus[_batchId] = RETAILED
-        log StatusUpdated(_batchId, msg.sender, DELIVERED, RETAILED)
-    elif _currentStatus == RETAILED:
-        self.batchStatus[_batchId] = CONSUMED
-        log StatusUpdated(_batchId, msg.sender, RETAILED, CONSUMED)
-    else:
-        assert False, "Invalid state for retail progress"
+@external
+def advanceBatchRetailStatusMany(_batchIds: DynArray[uint256, MAX_BULK_BATCHES]):
+    # Retailer role checked once; every batch gets the same transition as advanceBatchRetailStatus
+    self._checkRole(RETAILER_ROLE, msg.sender)
+    assert len(_batchIds) > 0, "No batches given"
+
+    for _batchId: uint256 in _batchIds:
+        self._checkExists(_batchId)
+        self._advanceRetailStatus(_batchId)
 
 
 @external
@@ -372,11 +650,12 @@ def markBatchRecalled(_batchId: uint256, _reasonHash: bytes32):
     self._checkRole(ADMIN_ROLE, msg.sender)
     self._checkExists(_batchId)
 
-    _oldStatus: uint256 = self.batchStatus[_batchId]
+    state: uint256 = self.batchState[_batchId]
+    _oldStatus: uint256 = self._stateStatus(state)
     assert _oldStatus != RECALLED, "Already recalled"
     assert _oldStatus != CONSUMED, "Cannot recall consumed token"
 
-    self.batchStatus[_batchId] = RECALLED
+    self.batchState[_batchId] = self._setStatus(_batchId, state, RECALLED)
     log StatusUpdated(_batchId, msg.sender, _oldStatus, RECALLED)
     log BatchRecalled(_batchId, msg.sender, _reasonHash)
 
@@ -397,16 +676,31 @@ def updateBatchURI(_batchId: uint256, _newURI: String[256]):
 @external
 def transferFrom(_from: address, _to: address, _tokenId: uint256):
     assert self._isApprovedOrOwner(msg.sender, _tokenId), "Not owner nor approved"
-    self._agri_transfer(_from, _to, _tokenId, b"")
+    self._agri_transfer(_from, _to, _tokenId, b"", self._recipientFlags(_to, _tokenId))
 
 
 @external
 def safeTransferFrom(_from: address, _to: address, _tokenId: uint256, _data: Bytes[1024] = b""):
     assert self._isApprovedOrOwner(msg.sender, _tokenId), "Not owner nor approved"
-    self._agri_transfer(_from, _to, _tokenId, _data)
+    self._agri_transfer(_from, _to, _tokenId, _data, self._recipientFlags(_to, _tokenId))
     self._checkOnERC721Received(_from, _to, _tokenId, _data)
 
 
+@external
+def batchTransferFrom(_from: address, _to: address, _tokenIds: DynArray[uint256, MAX_BULK_BATCHES]):
+    # All-or-nothing: any batch failing the state machine reverts the whole call
+    assert len(_tokenIds) > 0, "No batches given"
+
+    # Caller authority and recipient roles are resolved once for the whole load
+    isOwnerOrOperator: bool = msg.sender == _from or self.operatorApprovals[_from][msg.sender]
+    toFlags: uint256 = self._roleFlags(_to)
+
+    for _tokenId: uint256 in _tokenIds:
+        if not isOwnerOrOperator:
+            assert self._isApprovedOrOwner(msg.sender, _tokenId), "Not owner nor approved"
+        self._agri_transfer(_from, _to, _tokenId, b"", toFlags)
+
+
 # =========================
 # ERC721: APPROVALS
 # =========================
@@ -414,7 +708,7 @@ def safeTransferFrom(_from: address, _to: address, _tokenId: uint256, _data: Byt
 @external
 def approve(_to: address, _tokenId: uint256):
     self._checkExists(_tokenId)
-    owner: address = self.tokenOwner[_tokenId]
+    owner: address = self._stateOwner(self.batchState[_tokenId])
     assert _to != owner, "Approval to current owner"
     assert (
         msg.sender == owner or
@@ -459,11 +753,39 @@ def balanceOf(_owner: address) -> uint256:
 @view
 @external
 def ownerOf(_tokenId: uint256) -> address:
-    owner: address = self.tokenOwner[_tokenId]
+    owner: address = self._stateOwner(self.batchState[_tokenId])
     assert owner != empty(address), "Token does not exist or archived"
     return owner
 
 
+@view
+@external
+def tokenOwner(_tokenId: uint256) -> address:
+    # Former public storage getter, kept for ABI compatibility
+    return self._stateOwner(self.batchState[_tokenId])
+
+
+@view
+@external
+def totalSupply() -> uint256:
+    # Batches are never burned (recalled / consumed ones sit in vaults)
+    return self.tokenCounter
+
+
+@view
+@external
+def tokenByIndex(_index: uint256) -> uint256:
+    assert _index < self.tokenCounter, "Index out of bounds"
+    return _index + 1
+
+
+@view
+@external
+def tokenOfOwnerByIndex(_owner: address, _index: uint256) -> uint256:
+    assert _index < self.ownedTokensCount[_owner], "Owner index out of bounds"
+    return self.ownedTokens[_owner][_index]
+
+
 @view
 @external
 def tokenURI(_tokenId: uint256) -> String[256]:
@@ -537,10 +859,118 @@ def get_RECALLED_STATE() -> uint256:
     return RECALLED
 
 
+@view
+@external
+def batchStatus(_batchId: uint256) -> uint256:
+    # Former public storage getter, kept for ABI compatibility
+    return self._stateStatus(self.batchState[_batchId])
+
+
 @view
 @external
 def getBatchStatus(_batchId: uint256) -> uint256:
-    return self.batchStatus[_batchId]
+    return self._stateStatus(self.batchState[_batchId])
+
+
+@view
+@external
+def get_MAX_BATCH_PAGE() -> uint256:
+    return MAX_BATCH_PAGE
+
+@view
+@external
+def get_MAX_MINT_BATCH() -> uint256:
+    return MAX_MINT_BATCH
+
+@view
+@external
+def get_MAX_BULK_BATCHES() -> uint256:
+    return MAX_BULK_BATCHES
+
+@view
+@external
+def get_MAX_MULTICALL() -> uint256:
+    return MAX_MULTICALL
+
+@view
+@external
+def get_MAX_ROLE_BATCH() -> uint256:
+    return MAX_ROLE_BATCH
+
+
+@view
+@external
+def getBatchesInRange(_start: uint256, _count: uint256) -> DynArray[BatchView, MAX_BATCH_PAGE]:
+    # One eth_call per page instead of ownerOf + getBatchStatus + tokenURI per batch
+    assert _start > 0, "Batch ids start at 1"
+    assert _count <= MAX_BATCH_PAGE, "Page too large"
+
+    result: DynArray[BatchView, MAX_BATCH_PAGE] = []
+    lastId: uint256 = self.tokenCounter
+    if _start > lastId:
+        return result
+
+    n: uint256 = min(_count, lastId - _start + 1)
+    for i: uint256 in range(n, bound=MAX_BATCH_PAGE):
+        result.append(self._batchView(_start + i))
+
+    return result
+
+
+@view
+@external
+def statusBatchCount(_status: uint256) -> uint256:
+    return self._statusBatchCount(_status)
+
+
+@view
+@external
+def getBatchesByStatus(_status: uint256, _offset: uint256, _count: uint256) -> DynArray[BatchView, MAX_BATCH_PAGE]:
+    # Work queues (e.g. HARVESTED awaiting inspection) in k reads instead of a full scan.
+    # Set order is not stable across status changes (swap-and-pop).
+    # Quarantining does not change status: the RECALLED set also holds batches already
+    # in QUARANTINE_VAULT, so the "awaiting quarantine" queue is the ones owned elsewhere.
+    assert _count <= MAX_BATCH_PAGE, "Page too large"
+
+    result: DynArray[BatchView, MAX_BATCH_PAGE] = []
+    total: uint256 = self._statusBatchCount(_status)
+    if _offset >= total:
+        return result
+
+    n: uint256 = min(_count, total - _offset)
+    for i: uint256 in range(n, bound=MAX_BATCH_PAGE):
+        result.append(self._batchView(self.statusBatches[_status][_offset + i]))
+
+    return result
+
+
+# =========================
+# MULTICALL
+# =========================
+
+@view
+@external
+def multicall(_calls: DynArray[Bytes[MAX_MULTICALL_CALLDATA], MAX_MULTICALL]) -> DynArray[CallResult, MAX_MULTICALL]:
+    # Any mix of this contract's getters (hasRole, balanceOf, getApproved, tokenURI, ...)
+    # in one eth_call. Failed calls are reported, not bubbled, so one unknown id
+    # does not sink the whole page. Return data over MAX_MULTICALL_RETURN is
+    # reported as a failed call, never handed back truncated.
+    results: DynArray[CallResult, MAX_MULTICALL] = []
+    for _call: Bytes[MAX_MULTICALL_CALLDATA] in _calls:
+        success: bool = False
+        response: Bytes[MULTICALL_RETURN_BUFFER] = b""
+        success, response = raw_call(
+            self,
+            _call,
+            max_outsize=MULTICALL_RETURN_BUFFER,
+            is_static_call=True,
+            revert_on_failure=False
+        )
+        if len(response) > MAX_MULTICALL_RETURN:
+            success = False
+            response = abi_encode("Return data too large", method_id=method_id("Error(string)"))
+        results.append(CallResult(success=success, returnData=response))
+    return results
 
 
 # =========================
@@ -553,5 +983,6 @@ def supportsInterface(_interfaceId: bytes4) -> bool:
     return (
         _interfaceId == INTERFACE_ID_ERC165 or
         _interfaceId == INTERFACE_ID_ERC721 or
-        _interfaceId == INTERFACE_ID_ERC721_METADATA
+        _interfaceId == INTERFACE_ID_ERC721_METADATA or
+        _interfaceId == INTERFACE_ID_ERC721_ENUMERABLE
     )
@@ -4,19 +4,17 @@
 from ape import project
 import json
 
+def serialize_abi_value(value):
+    """Recursively convert Ape ABI objects (incl. struct components) to plain JSON"""
+    if isinstance(value, list):
+        return [serialize_abi_value(v) for v in value]
+    if hasattr(value, '__iter__') and not isinstance(value, (str, dict)):
+        return {key: serialize_abi_value(v) for key, v in value}
+    return value
+
 def serialize_abi(abi_list):
     """Convert Ape ABI objects to JSON-serializable format"""
-    result = []
-    for item in abi_list:
-        # Convert to dict and handle nested objects
-        item_dict = {}
-        for key, value in item:
-            if isinstance(value, list):
-                item_dict[key] = [dict(v) if hasattr(v, '__iter__') and not isinstance(v, str) else v for v in value]
-            else:
-                item_dict[key] = value
-        result.append(item_dict)
-    return result
+    return [serialize_abi_value(item) for item in abi_list]
 
 if __name__ == "__main__":
     try:
@@ -10,6 +10,34 @@ INSPECTOR_ADDR = "0x28c92AF6F35c19cDf729CaB77A24f24D3DadB89C"
 LOGISTICS_ADDR = "0x02972D92efB79e3c7BDa58cBAAC316493F328D5a"
 RETAILER_ADDR = "0xa96ff1610e474ca054ba849c902141eba191d8ec"
 
+# Contract getter for each supply-chain role
+ROLE_GETTERS = {
+    "FARMER": "get_FARMER_ROLE",
+    "INSPECTOR": "get_INSPECTOR_ROLE",
+    "LOGISTICS": "get_LOGISTICS_ROLE",
+    "RETAILER": "get_RETAILER_ROLE",
+}
+
+
+def grant_roles(agri, admin, assignments, verbose=True):
+    """Grant (role name, address) pairs through grantRoles, MAX_ROLE_BATCH per
+    transaction; returns how many were granted"""
+    role_ids = {name: getattr(agri, getter)() for name, getter in ROLE_GETTERS.items()}
+    chunk_size = agri.get_MAX_ROLE_BATCH()
+    granted = 0
+    for start in range(0, len(assignments), chunk_size):
+        chunk = assignments[start : start + chunk_size]
+        try:
+            agri.grantRoles([(role_ids[role], address) for role, address in chunk], sender=admin)
+        except Exception as e:
+            print(f"  ❌ Failed to grant {len(chunk)} roles: {e}")
+            continue
+        if verbose:
+            for role, address in chunk:
+                print(f"  ✅ {role}_ROLE → {address}")
+        granted += len(chunk)
+    return granted
+
 
 def main():
     """Deploy AgriChain ERC721 contract and initialize roles"""
@@ -43,53 +71,19 @@ def main():
     
     print("\n" + "=" * 60)
 
-    # 3. Get role identifiers from contract
-    print("\n🔑 Reading role identifiers...")
-    farmer_role = agri.get_FARMER_ROLE()
-    inspector_role = agri.get_INSPECTOR_ROLE()
-    logistics_role = agri.get_LOGISTICS_ROLE()
-    retailer_role = agri.get_RETAILER_ROLE()
-    print("✅ Role identifiers retrieved")
-
-    # 4. Grant roles to test accounts
+    # 3. Grant roles to test accounts
     print("\n👥 Granting roles to test accounts...")
-    
-    roles_granted = 0
-    if FARMER_ADDR:
-        try:
-            agri.grantRole(farmer_role, FARMER_ADDR, sender=admin)
-            print(f"  ✅ FARMER_ROLE → {FARMER_ADDR}")
-            roles_granted += 1
-        except Exception as e:
-            print(f"  ❌ Failed to grant FARMER_ROLE: {e}")
-
-    if INSPECTOR_ADDR:
-        try:
-            agri.grantRole(inspector_role, INSPECTOR_ADDR, sender=admin)
-            print(f"  ✅ INSPECTOR_ROLE → {INSPECTOR_ADDR}")
-            roles_granted += 1
-        except Exception as e:
-            print(f"  ❌ Failed to grant INSPECTOR_ROLE: {e}")
-
-    if LOGISTICS_ADDR:
-        try:
-            agri.grantRole(logistics_role, LOGISTICS_ADDR, sender=admin)
-            print(f"  ✅ LOGISTICS_ROLE → {LOGISTICS_ADDR}")
-            roles_granted += 1
-        except Exception as e:
-            print(f"  ❌ Failed to grant LOGISTICS_ROLE: {e}")
-
-    if RETAILER_ADDR:
-        try:
-            agri.grantRole(retailer_role, RETAILER_ADDR, sender=admin)
-            print(f"  ✅ RETAILER_ROLE → {RETAILER_ADDR}")
-            roles_granted += 1
-        except Exception as e:
-            print(f"  ❌ Failed to grant RETAILER_ROLE: {e}")
+    assignments = [
+        ("FARMER", FARMER_ADDR),
+        ("INSPECTOR", INSPECTOR_ADDR),
+        ("LOGISTICS", LOGISTICS_ADDR),
+        ("RETAILER", RETAILER_ADDR),
+    ]
+    roles_granted = grant_roles(agri, admin, [(role, addr) for role, addr in assignments if addr])
 
     print(f"\n✅ Roles granted: {roles_granted}/4")
     
-    # 5. Verify deployment
+    # 4. Verify deployment
     print("\n" + "=" * 60)
     print("🔍 Verifying deployment...")
     try:
@@ -97,7 +91,7 @@ def main():
         print(f"  ✅ Token Counter: {token_counter}")
         
         # Test role verification
-        has_farmer = agri.hasRole(farmer_role, FARMER_ADDR)
+        has_farmer = agri.hasRole(agri.get_FARMER_ROLE(), FARMER_ADDR)
         print(f"  ✅ Farmer role verified: {has_farmer}")
         
         # Display vault addresses (constants, not getter functions)
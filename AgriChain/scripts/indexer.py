@@ -0,0 +1,348 @@
+"""Index AgriChain events into a local SQLite store.
+
+Instead of calling ownerOf/getBatchStatus/tokenURI once per token, the
+indexer walks the contract logs once (one eth_getLogs per block page) and
+materializes owner/status/URI/timeline tables. The last processed block is
+stored with the data, so a restart only fetches the delta.
+
+Usage:
+    ape run indexer --address 0x... --network ethereum:local:http://127.0.0.1:8545
+"""
+
+import json
+import sqlite3
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import click
+from ape import chain, project
+from ape.cli import ConnectedProviderCommand
+from ape.types import LogFilter
+from eth_utils import encode_hex, keccak
+
+DEFAULT_DB_PATH = "agrichain_index.db"
+DEFAULT_PAGE_SIZE = 5000
+DEFAULT_TIMESTAMP_CACHE_SIZE = 4096
+DEFAULT_TIMESTAMP_WORKERS = 8
+
+# Events that change batch state or belong on the timeline
+INDEXED_EVENTS = (
+    "URI",
+    "StatusUpdated",
+    "BatchMinted",
+    "BatchInspected",
+    "BatchRecalled",
+    "Transfer",
+)
+
+# Event argument holding the batch id / the acting address
+BATCH_ID_ARG = {
+    "URI": "tokenId",
+    "StatusUpdated": "batchId",
+    "BatchMinted": "batchId",
+    "BatchInspected": "batchId",
+    "BatchRecalled": "batchId",
+    "Transfer": "tokenId",
+}
+ACTOR_ARG = {
+    "URI": None,
+    "StatusUpdated": "updater",
+    "BatchMinted": "farmer",
+    "BatchInspected": "inspector",
+    "BatchRecalled": "caller",
+    "Transfer": "_to",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sync_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    contract TEXT NOT NULL,
+    last_block INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS batches (
+    batch_id INTEGER PRIMARY KEY,
+    owner TEXT,
+    status INTEGER NOT NULL DEFAULT 0,
+    uri TEXT,
+    farmer TEXT,
+    updated_block INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS batches_owner ON batches (owner);
+CREATE INDEX IF NOT EXISTS batches_status ON batches (status);
+CREATE TABLE IF NOT EXISTS timeline (
+    tx_hash TEXT NOT NULL,
+    log_index INTEGER NOT NULL,
+    batch_id INTEGER NOT NULL,
+    block_number INTEGER NOT NULL,
+    timestamp INTEGER NOT NULL,
+    event TEXT NOT NULL,
+    actor TEXT,
+    args TEXT NOT NULL,
+    PRIMARY KEY (tx_hash, log_index)
+);
+CREATE INDEX IF NOT EXISTS timeline_batch ON timeline (batch_id, block_number, log_index);
+CREATE TABLE IF NOT EXISTS block_timestamps (
+    block_number INTEGER PRIMARY KEY,
+    timestamp INTEGER NOT NULL
+);
+"""
+
+
+def _to_json(value):
+    if isinstance(value, bytes):
+        return encode_hex(value)
+    return value
+
+
+class BlockTimestampCache:
+    """Block number -> timestamp: bounded LRU in memory, persisted in SQLite.
+
+    prefetch() resolves the distinct blocks of a log page up front, reading
+    persisted rows first and fetching the rest concurrently, so a page costs
+    one RPC call per new block rather than one per log.
+    """
+
+    def __init__(
+        self,
+        conn,
+        max_size=DEFAULT_TIMESTAMP_CACHE_SIZE,
+        workers=DEFAULT_TIMESTAMP_WORKERS,
+        fetch=None,
+    ):
+        self.conn = conn
+        self.max_size = max_size
+        self.workers = workers
+        self._fetch = fetch or (lambda number: chain.blocks[number].timestamp)
+        self._lru = OrderedDict()
+        self.fetches = 0
+
+    def _remember(self, number, timestamp):
+        self._lru[number] = timestamp
+        self._lru.move_to_end(number)
+        while len(self._lru) > self.max_size:
+            self._lru.popitem(last=False)
+
+    def prefetch(self, block_numbers):
+        missing = sorted({int(n) for n in block_numbers} - self._lru.keys())
+        if not missing:
+            return
+
+        persisted = set()
+        for start in range(0, len(missing), 500):
+            chunk = missing[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT block_number, timestamp FROM block_timestamps WHERE block_number IN ({placeholders})",
+                chunk,
+            )
+            for number, timestamp in rows:
+                persisted.add(number)
+                self._remember(number, timestamp)
+
+        # Not against the LRU: a page wider than max_size evicts rows just read
+        to_fetch = [n for n in missing if n not in persisted]
+        if not to_fetch:
+            return
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            fetched = list(zip(to_fetch, pool.map(self._fetch, to_fetch)))
+        self.fetches += len(fetched)
+
+        # Join the caller's page transaction if there is one, else commit right away
+        in_transaction = self.conn.in_transaction
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO block_timestamps (block_number, timestamp) VALUES (?, ?)", fetched
+        )
+        if not in_transaction:
+            self.conn.commit()
+        for number, timestamp in fetched:
+            self._remember(number, timestamp)
+
+    def get(self, number):
+        if number not in self._lru:
+            self.prefetch([number])
+        self._lru.move_to_end(number)
+        return self._lru[number]
+
+
+class BatchIndexer:
+    """Materialize batch state from AgriChain logs into SQLite"""
+
+    def __init__(self, contract, db_path=DEFAULT_DB_PATH, page_size=DEFAULT_PAGE_SIZE):
+        self.contract = contract
+        self.address = str(contract.address).lower()
+        self.page_size = page_size
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript(SCHEMA)
+
+        self._events = [getattr(contract, name).abi for name in INDEXED_EVENTS]
+        self._topics = [encode_hex(keccak(text=abi.selector)) for abi in self._events]
+        self._address_args = {
+            abi.name: {item.name for item in abi.inputs if item.type == "address"}
+            for abi in self._events
+        }
+        self.timestamps = BlockTimestampCache(self.conn)
+
+        row = self.conn.execute("SELECT contract FROM sync_state").fetchone()
+        if row and row[0] != self.address:
+            raise ValueError(f"Database already indexes contract {row[0]}, not {self.address}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    @property
+    def last_block(self):
+        """Last fully processed block, or -1 if nothing was indexed yet"""
+        row = self.conn.execute("SELECT last_block FROM sync_state").fetchone()
+        return row[0] if row else -1
+
+    def sync(self, start_block=0, stop_block=None):
+        """Index all logs after the checkpoint up to stop_block (default: chain head).
+
+        Each block page is applied in a single SQLite transaction together with
+        the checkpoint update, so an interrupted sync resumes at a page boundary.
+        Returns the number of logs processed.
+        """
+        head = chain.blocks.height
+        stop_block = head if stop_block is None else min(stop_block, head)
+        start_block = max(start_block, self.last_block + 1)
+
+        processed = 0
+        for page_start in range(start_block, stop_block + 1, self.page_size):
+            page_stop = min(stop_block, page_start + self.page_size - 1)
+            log_filter = LogFilter(
+                addresses=[self.contract.address],
+                events=self._events,
+                topic_filter=[self._topics],
+                start_block=page_start,
+                stop_block=page_stop,
+            )
+            logs = sorted(
+                chain.provider.get_contract_logs(log_filter),
+                key=lambda log: (log.block_number, log.log_index),
+            )
+            self.timestamps.prefetch(log.block_number for log in logs)
+
+            with self.conn:
+                for log in logs:
+                    self._apply(log)
+                self.conn.execute(
+                    "INSERT INTO sync_state (id, contract, last_block) VALUES (1, ?, ?) "
+                    "ON CONFLICT(id) DO UPDATE SET last_block = excluded.last_block",
+                    (self.address, page_stop),
+                )
+            processed += len(logs)
+
+        return processed
+
+    def _apply(self, log):
+        name = log.event_name
+        args = {key: _to_json(value) for key, value in log.event_arguments.items()}
+        for key in self._address_args[name]:
+            args[key] = args[key].lower()
+        batch_id = int(args[BATCH_ID_ARG[name]])
+        actor = args[ACTOR_ARG[name]] if ACTOR_ARG[name] else None
+        block_number = log.block_number
+
+        self.conn.execute(
+            "INSERT INTO batches (batch_id, updated_block) VALUES (?, ?) "
+            "ON CONFLICT(batch_id) DO UPDATE SET updated_block = excluded.updated_block",
+            (batch_id, block_number),
+        )
+        if name == "URI":
+            self.conn.execute(
+                "UPDATE batches SET uri = ? WHERE batch_id = ?", (args["value"], batch_id)
+            )
+        elif name == "StatusUpdated":
+            self.conn.execute(
+                "UPDATE batches SET status = ? WHERE batch_id = ?", (args["newStatus"], batch_id)
+            )
+        elif name == "BatchMinted":
+            self.conn.execute(
+                "UPDATE batches SET farmer = ? WHERE batch_id = ?", (args["farmer"], batch_id)
+            )
+        elif name == "Transfer":
+            self.conn.execute(
+                "UPDATE batches SET owner = ? WHERE batch_id = ?", (args["_to"], batch_id)
+            )
+
+        self.conn.execute(
+            "INSERT OR IGNORE INTO timeline "
+            "(tx_hash, log_index, batch_id, block_number, timestamp, event, actor, args) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                _to_json(log.transaction_hash),
+                log.log_index,
+                batch_id,
+                block_number,
+                self.timestamps.get(block_number),
+                name,
+                actor,
+                json.dumps(args),
+            ),
+        )
+
+    # =========================
+    # READ HELPERS
+    # =========================
+
+    def get_batch(self, batch_id):
+        row = self.conn.execute(
+            "SELECT batch_id, owner, status, uri, farmer FROM batches WHERE batch_id = ?",
+            (batch_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(("id", "owner", "status", "uri", "farmer"), row))
+
+    def batches_by_owner(self, owner):
+        rows = self.conn.execute(
+            "SELECT batch_id FROM batches WHERE owner = ? ORDER BY batch_id",
+            (str(owner).lower(),),
+        )
+        return [row[0] for row in rows]
+
+    def batches_by_status(self, status):
+        rows = self.conn.execute(
+            "SELECT batch_id FROM batches WHERE status = ? ORDER BY batch_id", (status,)
+        )
+        return [row[0] for row in rows]
+
+    def timeline(self, batch_id):
+        rows = self.conn.execute(
+            "SELECT event, actor, block_number, timestamp, args FROM timeline "
+            "WHERE batch_id = ? ORDER BY block_number, log_index",
+            (batch_id,),
+        )
+        return [
+            {
+                "event": event,
+                "actor": actor,
+                "block": block,
+                "timestamp": timestamp,
+                "args": json.loads(args),
+            }
+            for event, actor, block, timestamp, args in rows
+        ]
+
+
+@click.command(cls=ConnectedProviderCommand)
+@click.option("--address", required=True, help="Deployed AgriChain contract address")
+@click.option("--db", "db_path", default=DEFAULT_DB_PATH, show_default=True, help="SQLite file")
+@click.option("--start-block", default=0, show_default=True, help="Deployment block (first run)")
+@click.option("--page-size", default=DEFAULT_PAGE_SIZE, show_default=True, help="Blocks per eth_getLogs")
+def cli(address, db_path, start_block, page_size):
+    """Index AgriChain batches into a local SQLite store"""
+    contract = project.AgriChain.at(address)
+
+    with BatchIndexer(contract, db_path, page_size) as indexer:
+        resume_from = max(start_block, indexer.last_block + 1)
+        print(f"🔍 Indexing {address} from block {resume_from}...")
+        processed = indexer.sync(start_block=start_block)
+        print(f"✅ Processed {processed} logs, checkpoint at block {indexer.last_block}")
+        print(f"📄 Database: {db_path}")
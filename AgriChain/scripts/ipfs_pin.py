@@ -0,0 +1,329 @@
+"""Bulk-pin batch metadata to IPFS and audit the tokenURIs stored on chain.
+
+Metadata documents are serialized exactly like the browser does
+(JSON.stringify) and their CIDs are computed locally, so a whole harvest can
+be prepared, pinned concurrently and checked without trusting the pinning
+service's answer. The audit reads every tokenURI through the multicall view,
+fetches the documents in parallel and re-hashes them against their CID.
+
+CIDs are CIDv1 / raw / sha2-256 (bafkrei...), which is what Pinata returns
+for single-block uploads with cidVersion 1. Documents larger than one block
+would be chunked by IPFS and are rejected here.
+
+Usage:
+    ape run ipfs_pin pin --count 10000 --store ./ipfs_store
+    ape run ipfs_pin audit --address 0x... --store ./ipfs_store --network ethereum:local:http://127.0.0.1:8545
+"""
+
+import base64
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import click
+from ape import project
+from ape.cli import ConnectedProviderCommand
+
+from scripts.multicall import Multicall
+
+DEFAULT_WORKERS = 16
+MAX_BLOCK_SIZE = 256 * 1024  # IPFS default chunk size
+
+# CIDv1 prefix: version 1, raw codec (0x55), sha2-256 multihash (0x12, 32 bytes)
+RAW_SHA256_PREFIX = bytes([0x01, 0x55, 0x12, 0x20])
+
+PINATA_PIN_FILE_URL = "https://api.pinata.cloud/pinning/pinFileToIPFS"
+DEFAULT_GATEWAY = "https://gateway.pinata.cloud"
+
+# Audit outcomes
+OK = "ok"
+UNRESOLVABLE = "unresolvable"  # no backend could return the content
+MISMATCHED = "mismatched"  # content does not hash to its CID
+UNVERIFIED = "unverified"  # resolved, but the URI is not a bare raw CID
+
+
+# =========================
+# CIDs
+# =========================
+
+def encode_metadata(metadata):
+    """Serialize metadata the way the frontend's JSON.stringify does"""
+    return json.dumps(metadata, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def compute_cid(data):
+    """CIDv1 (raw, sha2-256, base32) of a single-block document"""
+    if len(data) > MAX_BLOCK_SIZE:
+        raise ValueError(f"Document is {len(data)} bytes, larger than one IPFS block")
+    digest = hashlib.sha256(data).digest()
+    encoded = base64.b32encode(RAW_SHA256_PREFIX + digest).decode().lower().rstrip("=")
+    return "b" + encoded
+
+
+def raw_cid_digest(cid):
+    """sha2-256 digest of a raw CIDv1, or None for any other kind of CID"""
+    if not cid.startswith("b"):
+        return None
+    body = cid[1:].upper()
+    try:
+        decoded = base64.b32decode(body + "=" * (-len(body) % 8))
+    except ValueError:
+        return None
+    if len(decoded) != 36 or not decoded.startswith(RAW_SHA256_PREFIX):
+        return None
+    return decoded[4:]
+
+
+def build_metadata(
+    name,
+    product_type="other",
+    harvest_date=None,
+    farm_name="Chưa xác định",
+    address="Chưa xác định",
+    description="",
+    created_by="Unknown",
+    timestamp=None,
+):
+    """Batch metadata with the same fields as FarmerCreateBatchForm.vue"""
+    if timestamp is None:
+        timestamp = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+    return {
+        "name": name,
+        "productType": product_type,
+        "harvestDate": harvest_date,
+        "farmName": farm_name,
+        "address": address,
+        "description": description,
+        "timestamp": timestamp.replace("+00:00", "Z"),
+        "createdBy": created_by,
+    }
+
+
+def prepare_documents(metadata_list):
+    """Encode metadata and compute CIDs: returns [(cid, bytes)] in input order"""
+    documents = []
+    for metadata in metadata_list:
+        data = encode_metadata(metadata)
+        documents.append((compute_cid(data), data))
+    return documents
+
+
+# =========================
+# BACKENDS
+# =========================
+
+class LocalPinBackend:
+    """Filesystem stand-in for a pinning service: one file per CID"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._resolved_root = self.root.resolve()
+
+    def pin(self, cid, data):
+        path = self.root / cid
+        if not path.exists():
+            tmp = path.with_name(f".{cid}.{os.getpid()}.{time.monotonic_ns()}")
+            tmp.write_bytes(data)
+            tmp.replace(path)
+        return cid
+
+    def fetch(self, path):
+        # `path` comes from on-chain tokenURIs: never follow it out of the store
+        target = (self.root / path).resolve()
+        if not target.is_relative_to(self._resolved_root):
+            raise ValueError(f"{path!r} escapes the pin store")
+        try:
+            return target.read_bytes()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+
+class PinataBackend:
+    """Pin through Pinata's pinFileToIPFS and read back through a gateway.
+
+    Pinning the exact bytes (rather than pinJSONToIPFS, which re-serializes)
+    keeps the returned CID equal to the locally computed one.
+    """
+
+    def __init__(self, jwt, gateway=DEFAULT_GATEWAY, timeout=30):
+        import requests
+
+        self.session = requests.Session()
+        self.session.headers["Authorization"] = f"Bearer {jwt}"
+        self.gateway = gateway.rstrip("/")
+        self.timeout = timeout
+
+    def pin(self, cid, data):
+        response = self.session.post(
+            PINATA_PIN_FILE_URL,
+            files={"file": (f"{cid}.json", data, "application/json")},
+            data={"pinataOptions": json.dumps({"cidVersion": 1})},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return response.json()["IpfsHash"]
+
+    def fetch(self, path):
+        response = self.session.get(f"{self.gateway}/ipfs/{path}", timeout=self.timeout)
+        return response.content if response.ok else None
+
+
+# =========================
+# PIN / AUDIT
+# =========================
+
+def pin_documents(backend, documents, workers=DEFAULT_WORKERS):
+    """Pin [(cid, bytes)] concurrently.
+
+    Returns {"pinned", "failed", "seconds"}; a pin whose returned CID differs
+    from the local one counts as failed.
+    """
+    def pin_one(document):
+        cid, data = document
+        try:
+            return cid, backend.pin(cid, data) == cid
+        except Exception as error:
+            print(f"⚠️  Pin failed for {cid}: {error}")
+            return cid, False
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(pin_one, documents))
+
+    return {
+        "pinned": [cid for cid, ok in results if ok],
+        "failed": [cid for cid, ok in results if not ok],
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def _check_uri(backend, uri):
+    if not uri.startswith("ipfs://"):
+        return UNRESOLVABLE
+    path = uri[len("ipfs://"):]
+    data = backend.fetch(path)
+    if data is None:
+        return UNRESOLVABLE
+
+    digest = raw_cid_digest(path)
+    if digest is None:
+        return UNVERIFIED
+    return OK if hashlib.sha256(data).digest() == digest else MISMATCHED
+
+
+def audit_uris(backend, uris, workers=DEFAULT_WORKERS):
+    """Resolve and re-hash {batch_id: uri} in parallel.
+
+    Returns {"results": {batch_id: outcome}, "seconds"}.
+    """
+    def check(item):
+        batch_id, uri = item
+        try:
+            return batch_id, _check_uri(backend, uri)
+        except Exception as error:
+            print(f"⚠️  Fetch failed for #{batch_id} ({uri}): {error}")
+            return batch_id, UNRESOLVABLE
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = dict(pool.map(check, uris.items()))
+    return {"results": results, "seconds": time.perf_counter() - start}
+
+
+def read_token_uris(contract):
+    """{batch_id: tokenURI} for every minted batch, via multicall"""
+    count = contract.tokenCounter()
+    calls = Multicall(contract)
+    for batch_id in range(1, count + 1):
+        calls.add("tokenURI", batch_id)
+    return dict(zip(range(1, count + 1), calls.execute()))
+
+
+def audit_token_uris(contract, backend, workers=DEFAULT_WORKERS):
+    """Audit every tokenURI of contract against backend"""
+    return audit_uris(backend, read_token_uris(contract), workers)
+
+
+# =========================
+# CLI
+# =========================
+
+def _backend(store, pinata_jwt, gateway):
+    if pinata_jwt:
+        return PinataBackend(pinata_jwt, gateway)
+    return LocalPinBackend(store)
+
+
+def _sample_metadata(count):
+    harvest = date(2025, 1, 1)
+    return [
+        build_metadata(
+            f"Lô #{i}",
+            product_type="vegetable",
+            harvest_date=(harvest + timedelta(days=i % 365)).isoformat(),
+            farm_name=f"Farm {i % 50}",
+            description=f"Synthetic batch {i}",
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+@click.group()
+def cli():
+    """Pin batch metadata and audit on-chain tokenURIs"""
+
+
+@cli.command()
+@click.option("--count", default=1000, show_default=True, help="Synthetic documents to build")
+@click.option("--input", "input_path", type=click.Path(exists=True), help="JSON list of metadata objects instead")
+@click.option("--store", default="ipfs_store", show_default=True, help="Local pin directory")
+@click.option("--pinata-jwt", envvar="PINATA_JWT", help="Pin to Pinata instead of --store")
+@click.option("--gateway", default=DEFAULT_GATEWAY, show_default=True)
+@click.option("--workers", default=DEFAULT_WORKERS, show_default=True)
+@click.option("--uris-out", type=click.Path(), help="Write the ipfs:// URIs here, one per line")
+def pin(count, input_path, store, pinata_jwt, gateway, workers, uris_out):
+    """Build, hash and pin metadata documents"""
+    if input_path:
+        metadata_list = json.loads(Path(input_path).read_text())
+    else:
+        metadata_list = _sample_metadata(count)
+
+    start = time.perf_counter()
+    documents = prepare_documents(metadata_list)
+    build_seconds = time.perf_counter() - start
+    print(f"🧱 Built {len(documents)} documents in {build_seconds:.2f}s")
+
+    report = pin_documents(_backend(store, pinata_jwt, gateway), documents, workers)
+    rate = len(documents) / report["seconds"] if report["seconds"] else float("inf")
+    print(f"📌 Pinned {len(report['pinned'])} in {report['seconds']:.2f}s ({rate:.0f} docs/s)")
+    if report["failed"]:
+        print(f"❌ {len(report['failed'])} failed")
+
+    if uris_out:
+        Path(uris_out).write_text("".join(f"ipfs://{cid}\n" for cid, _ in documents))
+
+
+@cli.command(cls=ConnectedProviderCommand)
+@click.option("--address", required=True, help="Deployed AgriChain contract address")
+@click.option("--store", default="ipfs_store", show_default=True, help="Local pin directory")
+@click.option("--pinata-jwt", envvar="PINATA_JWT", help="Resolve through --gateway instead of --store")
+@click.option("--gateway", default=DEFAULT_GATEWAY, show_default=True)
+@click.option("--workers", default=DEFAULT_WORKERS, show_default=True)
+def audit(address, store, pinata_jwt, gateway, workers):
+    """Check that every tokenURI resolves and matches its CID"""
+    contract = project.AgriChain.at(address)
+    report = audit_token_uris(contract, _backend(store, pinata_jwt, gateway), workers)
+    results = report["results"]
+
+    for batch_id, outcome in sorted(results.items()):
+        if outcome in (UNRESOLVABLE, MISMATCHED):
+            print(f"❌ #{batch_id} {outcome}")
+    for outcome in (OK, UNVERIFIED, UNRESOLVABLE, MISMATCHED):
+        print(f"{outcome}: {sum(1 for value in results.values() if value == outcome)}")
+    rate = len(results) / report["seconds"] if report["seconds"] else float("inf")
+    print(f"✅ Audited {len(results)} URIs in {report['seconds']:.2f}s ({rate:.0f} URIs/s)")
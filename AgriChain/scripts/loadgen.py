@@ -0,0 +1,245 @@
+"""Drive concurrent end-to-end batch lifecycles and report throughput.
+
+Spins up --crews crews of farmer/inspector/logistics/retailer accounts
+(funded and granted through deploy.grant_roles), then runs --lifecycles
+lifecycles drawn from --mix, one worker thread per crew. The in-process
+test chain is not thread-safe, so there the crews' lifecycles interleave but
+each transaction is sent under a lock; against an HTTP node (anvil, geth)
+crews really send in parallel. Every transaction's
+wall-clock latency and gas is recorded; the report has tx/s, lifecycles/s,
+latency percentiles per method and gas per lifecycle kind.
+
+Lifecycle kinds:
+    retail   mint → inspect → logistics → retailer → RETAILED → CONSUMED
+    archive  retail, then the consumed batch goes to ARCHIVE_VAULT
+    recall   mint → inspect → logistics → admin recall → QUARANTINE_VAULT
+
+Usage:
+    ape run loadgen --lifecycles 200 --crews 4 --mix retail=6,archive=3,recall=1 --json report.json
+"""
+
+import csv
+import json
+import math
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+import click
+from ape import accounts, chain, project
+from ape.cli import ConnectedProviderCommand
+
+from scripts.deploy import grant_roles
+
+QUARANTINE_VAULT = "0x000000000000000000000000000000000000dEaD"
+ARCHIVE_VAULT = "0x000000000000000000000000000000000000aaaa"
+
+CREW_ROLES = ("FARMER", "INSPECTOR", "LOGISTICS", "RETAILER")
+LIFECYCLE_KINDS = ("retail", "archive", "recall")
+DEFAULT_MIX = "retail=6,archive=3,recall=1"
+CREW_FUNDING = 10**18  # wei per generated account
+
+
+def parse_mix(text):
+    """"retail=6,archive=3,recall=1" -> {kind: weight}"""
+    mix = {}
+    for part in text.split(","):
+        kind, _, weight = part.partition("=")
+        kind = kind.strip()
+        if kind not in LIFECYCLE_KINDS:
+            raise ValueError(f"Unknown lifecycle kind {kind!r}, expected one of {LIFECYCLE_KINDS}")
+        mix[kind] = float(weight or 1)
+    if sum(mix.values()) <= 0:
+        raise ValueError("Mix weights must add up to more than zero")
+    return mix
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an unsorted list"""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _latency_summary(seconds):
+    millis = [value * 1000 for value in seconds]
+    return {
+        "p50": percentile(millis, 50),
+        "p95": percentile(millis, 95),
+        "p99": percentile(millis, 99),
+        "max": max(millis) if millis else None,
+    }
+
+
+def _format_ms(value):
+    return "n/a" if value is None else f"{value:.1f}ms"
+
+
+class LoadGenerator:
+    """Run lifecycle traffic against a deployed AgriChain from several crews"""
+
+    def __init__(self, contract, admin, crews, seed=None, serialize=False):
+        self.contract = contract
+        self.admin = admin
+        self.crews = crews  # [(farmer, inspector, logistics, retailer)]
+        self.random = random.Random(seed)
+        self.transactions = []  # (method, seconds, gas_used)
+        self.lifecycles = []  # {kind, batch_id, txs, gas, seconds, ok}
+        self._lock = threading.Lock()
+        # Recalls from every crew share the admin account and its nonce
+        self._admin_lock = threading.Lock()
+        self._chain_lock = threading.Lock() if serialize else nullcontext()
+
+    def _send(self, method, *args, sender, record):
+        with self._chain_lock:
+            start = time.perf_counter()
+            receipt = getattr(self.contract, method)(*args, sender=sender)
+            elapsed = time.perf_counter() - start
+        record["txs"] += 1
+        record["gas"] += receipt.gas_used
+        with self._lock:
+            self.transactions.append((method, elapsed, receipt.gas_used))
+        return receipt
+
+    def _run_lifecycle(self, kind, crew, index):
+        farmer, inspector, logistics, retailer = crew
+        record = {"kind": kind, "batch_id": None, "txs": 0, "gas": 0, "seconds": 0.0, "ok": False}
+        start = time.perf_counter()
+        try:
+            receipt = self._send("mintBatch", f"ipfs://loadgen/{index}.json", sender=farmer, record=record)
+            batch_id = receipt.decode_logs(self.contract.BatchMinted)[0].batchId
+            record["batch_id"] = batch_id
+
+            self._send("markBatchInspected", batch_id, f"ipfs://loadgen/{index}-qc.json", sender=inspector, record=record)
+            self._send("transferFrom", farmer, logistics, batch_id, sender=farmer, record=record)
+
+            if kind == "recall":
+                with self._admin_lock:
+                    self._send("markBatchRecalled", batch_id, b"loadgen", sender=self.admin, record=record)
+                self._send("transferFrom", logistics, QUARANTINE_VAULT, batch_id, sender=logistics, record=record)
+            else:
+                self._send("transferFrom", logistics, retailer, batch_id, sender=logistics, record=record)
+                self._send("advanceBatchRetailStatus", batch_id, sender=retailer, record=record)
+                self._send("advanceBatchRetailStatus", batch_id, sender=retailer, record=record)
+                if kind == "archive":
+                    self._send("transferFrom", retailer, ARCHIVE_VAULT, batch_id, sender=retailer, record=record)
+            record["ok"] = True
+        except Exception as error:
+            print(f"❌ {kind} lifecycle #{index} failed: {error}")
+        record["seconds"] = time.perf_counter() - start
+        with self._lock:
+            self.lifecycles.append(record)
+
+    def _run_crew(self, crew, jobs):
+        for index, kind in jobs:
+            self._run_lifecycle(kind, crew, index)
+
+    def run(self, count, mix):
+        """Run count lifecycles drawn from mix; returns the report dict"""
+        kinds = self.random.choices(list(mix), weights=list(mix.values()), k=count)
+        # Each crew works through its own queue so no account is used by two threads
+        queues = [[] for _ in self.crews]
+        for index, kind in enumerate(kinds):
+            queues[index % len(self.crews)].append((index, kind))
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(self.crews)) as pool:
+            list(pool.map(self._run_crew, self.crews, queues))
+        return self.report(time.perf_counter() - start, mix)
+
+    def report(self, seconds, mix):
+        completed = [record for record in self.lifecycles if record["ok"]]
+        by_method = defaultdict(list)
+        for method, elapsed, gas_used in self.transactions:
+            by_method[method].append((elapsed, gas_used))
+        gas_by_kind = defaultdict(list)
+        for record in completed:
+            gas_by_kind[record["kind"]].append(record["gas"])
+
+        return {
+            "crews": len(self.crews),
+            "mix": mix,
+            "seconds": seconds,
+            "lifecycles": len(self.lifecycles),
+            "completed": len(completed),
+            "failed": len(self.lifecycles) - len(completed),
+            "transactions": len(self.transactions),
+            "tx_per_second": len(self.transactions) / seconds if seconds else None,
+            "lifecycles_per_second": len(completed) / seconds if seconds else None,
+            "latency_ms": _latency_summary([elapsed for _, elapsed, _ in self.transactions]),
+            "lifecycle_latency_ms": _latency_summary([record["seconds"] for record in completed]),
+            "methods": {
+                method: {
+                    "count": len(samples),
+                    "latency_ms": _latency_summary([elapsed for elapsed, _ in samples]),
+                    "gas_mean": sum(gas for _, gas in samples) / len(samples),
+                }
+                for method, samples in sorted(by_method.items())
+            },
+            "gas_per_lifecycle": {
+                kind: sum(values) / len(values) for kind, values in sorted(gas_by_kind.items())
+            },
+        }
+
+    def write_csv(self, path):
+        """One row per lifecycle"""
+        with open(path, "w", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=["kind", "batch_id", "txs", "gas", "seconds", "ok"])
+            writer.writeheader()
+            writer.writerows(self.lifecycles)
+
+
+def setup_crews(contract, admin, count, funding=CREW_FUNDING):
+    """Create count funded crews and grant their roles in one pass"""
+    crews = []
+    assignments = []
+    for _ in range(count):
+        crew = tuple(accounts.test_accounts.generate_test_account() for _ in CREW_ROLES)
+        for account in crew:
+            admin.transfer(account, funding)
+        assignments.extend(zip(CREW_ROLES, (account.address for account in crew)))
+        crews.append(crew)
+    grant_roles(contract, admin, assignments, verbose=False)
+    return crews
+
+
+@click.command(cls=ConnectedProviderCommand)
+@click.option("--address", help="Existing AgriChain contract (deploys a fresh one if omitted)")
+@click.option("--lifecycles", default=100, show_default=True, help="Lifecycles to run")
+@click.option("--crews", default=4, show_default=True, help="Concurrent farmer/inspector/logistics/retailer crews")
+@click.option("--mix", default=DEFAULT_MIX, show_default=True, help="Relative weights per lifecycle kind")
+@click.option("--seed", type=int, help="Seed for the lifecycle mix")
+@click.option("--json", "json_path", type=click.Path(), help="Write the summary report here")
+@click.option("--csv", "csv_path", type=click.Path(), help="Write one row per lifecycle here")
+def cli(address, lifecycles, crews, mix, seed, json_path, csv_path):
+    """Load-test full batch lifecycles on a local chain"""
+    admin = accounts.test_accounts[0]
+    contract = project.AgriChain.at(address) if address else admin.deploy(project.AgriChain)
+    print(f"📍 Contract: {contract.address}")
+
+    print(f"👥 Setting up {crews} crews...")
+    serialize = chain.provider.http_uri is None
+    generator = LoadGenerator(contract, admin, setup_crews(contract, admin, crews), seed, serialize)
+
+    print(f"🚚 Running {lifecycles} lifecycles ({mix})...")
+    report = generator.run(lifecycles, parse_mix(mix))
+
+    latency = report["latency_ms"]
+    print(f"✅ {report['completed']}/{report['lifecycles']} lifecycles, {report['transactions']} txs in {report['seconds']:.2f}s")
+    print(f"   {report['tx_per_second']:.1f} tx/s, {report['lifecycles_per_second']:.2f} lifecycles/s")
+    print("   latency " + "  ".join(f"{key} {_format_ms(latency[key])}" for key in ("p50", "p95", "p99")))
+    for kind, gas in report["gas_per_lifecycle"].items():
+        print(f"   gas/{kind}: {gas:,.0f}")
+
+    if json_path:
+        with open(json_path, "w") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"📄 Report: {json_path}")
+    if csv_path:
+        generator.write_csv(csv_path)
+        print(f"📄 Lifecycles: {csv_path}")
@@ -0,0 +1,90 @@
+"""Batch AgriChain read calls through the contract's multicall view.
+
+A page render needs a mix of hasRole/balanceOf/getApproved/tokenURI reads;
+queueing them here turns dozens of eth_calls into one per MAX_MULTICALL calls.
+
+Usage:
+    ape run multicall --address 0x... --start 1 --count 100 --network ethereum:local:http://127.0.0.1:8545
+"""
+
+import click
+from ape import chain, project
+from ape.cli import ConnectedProviderCommand
+from eth_abi import encode
+
+# What multicall returns (as a failed call) for return data over its cap
+RETURN_TOO_LARGE = bytes.fromhex("08c379a0") + encode(["string"], ["Return data too large"])
+
+
+class Multicall:
+    """Queue read calls against an AgriChain contract and run them in chunks"""
+
+    def __init__(self, contract):
+        self.contract = contract
+        self.round_trips = 0
+        self._calls = []
+        self._chunk_size = None
+
+    def __len__(self):
+        return len(self._calls)
+
+    def add(self, method, *args):
+        """Queue contract.<method>(*args); returns the result's position"""
+        handler = getattr(self.contract, method)
+        abi = next((abi for abi in handler.abis if len(abi.inputs) == len(args)), None)
+        if abi is None:
+            raise ValueError(f"{method} takes no overload with {len(args)} argument(s)")
+        self._calls.append((abi, handler.encode_input(*args)))
+        return len(self._calls) - 1
+
+    def execute(self):
+        """Run every queued call and return decoded results in queue order.
+
+        A call that reverted comes back as None. Single-value outputs are
+        unwrapped; the queue is cleared afterwards. Raises ValueError if a
+        call returned more than the contract's MAX_MULTICALL_RETURN bytes
+        (e.g. a long page or string) rather than decode a partial value.
+        """
+        if self._chunk_size is None:
+            self._chunk_size = self.contract.get_MAX_MULTICALL()
+        ecosystem = chain.provider.network.ecosystem
+
+        results = []
+        for start in range(0, len(self._calls), self._chunk_size):
+            chunk = self._calls[start : start + self._chunk_size]
+            responses = self.contract.multicall([calldata for _, calldata in chunk])
+            self.round_trips += 1
+            for (abi, _), response in zip(chunk, responses):
+                if not response.success:
+                    if response.returnData == RETURN_TOO_LARGE:
+                        self._calls = []
+                        raise ValueError(f"{abi.name} returned more data than multicall allows")
+                    results.append(None)
+                    continue
+                decoded = ecosystem.decode_returndata(abi, response.returnData)
+                results.append(decoded[0] if len(decoded) == 1 else decoded)
+
+        self._calls = []
+        return results
+
+
+@click.command(cls=ConnectedProviderCommand)
+@click.option("--address", required=True, help="Deployed AgriChain contract address")
+@click.option("--start", default=1, show_default=True, help="First batch id")
+@click.option("--count", default=100, show_default=True, help="Batches to read")
+def cli(address, start, count):
+    """Read owner, approval and URI for a page of batches in as few eth_calls as possible"""
+    contract = project.AgriChain.at(address)
+    last = min(start + count - 1, contract.tokenCounter())
+
+    calls = Multicall(contract)
+    for batch_id in range(start, last + 1):
+        calls.add("ownerOf", batch_id)
+        calls.add("getApproved", batch_id)
+        calls.add("tokenURI", batch_id)
+    results = calls.execute()
+
+    for offset, batch_id in enumerate(range(start, last + 1)):
+        owner, approved, uri = results[3 * offset : 3 * offset + 3]
+        print(f"#{batch_id} owner={owner} approved={approved} uri={uri}")
+    print(f"✅ {len(results)} reads in {calls.round_trips} eth_call(s)")
@@ -0,0 +1,206 @@
+"""Provision supply-chain roles from a manifest, sending only what is missing.
+
+The manifest (CSV or YAML) lists accounts and the supply-chain roles each one
+should hold. Current roles come from one roleMask multicall per 100 accounts;
+the difference becomes grantRoles / revokeRoles calls of up to MAX_ROLE_BATCH
+changes each, signed with consecutive nonces and all sent before waiting on
+any receipt. Running it twice against the same manifest sends nothing.
+
+Only FARMER / INSPECTOR / LOGISTICS / RETAILER are managed. ADMIN and accounts
+missing from the manifest are never touched; an account listed with no roles
+has all four revoked.
+
+CSV:                                YAML:
+    address,roles                       accounts:
+    0xabc...,FARMER                       - address: 0xabc...
+    0xdef...,LOGISTICS;RETAILER             roles: [FARMER]
+
+Usage:
+    ape run provision --address 0x... --manifest roles.csv --account admin_1 --dry-run --network ethereum:local:http://127.0.0.1:8545
+"""
+
+import csv
+import time
+from pathlib import Path
+
+import click
+import yaml
+from ape import accounts, chain, project
+from ape.cli import ConnectedProviderCommand
+from eth_utils import to_checksum_address, to_hex
+
+from scripts.deploy import ROLE_GETTERS
+from scripts.multicall import Multicall
+
+# Same bits as the contract's roleMask
+ROLE_BITS = {"FARMER": 1, "INSPECTOR": 2, "LOGISTICS": 4, "RETAILER": 8}
+
+
+# =========================
+# MANIFEST
+# =========================
+
+def _parse_roles(value):
+    if value is None:
+        return []
+    if isinstance(value, str):
+        value = value.replace(",", ";").split(";")
+    roles = [str(role).strip().upper().removesuffix("_ROLE") for role in value]
+    roles = [role for role in roles if role]
+    unknown = sorted(set(roles) - set(ROLE_BITS))
+    if unknown:
+        raise ValueError(f"Unknown role(s) {unknown}, expected some of {list(ROLE_BITS)}")
+    return roles
+
+
+def load_manifest(path):
+    """{checksum address: set of role names} from a .csv or .yaml manifest.
+
+    An address listed more than once gets the union of its rows.
+    """
+    path = Path(path)
+    if path.suffix.lower() in (".yaml", ".yml"):
+        document = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        rows = [(entry["address"], entry.get("roles")) for entry in document.get("accounts", [])]
+    else:
+        with open(path, newline="", encoding="utf-8") as handle:
+            rows = [(row["address"], row.get("roles")) for row in csv.DictReader(handle)]
+
+    desired = {}
+    for address, roles in rows:
+        desired.setdefault(to_checksum_address(str(address).strip()), set()).update(_parse_roles(roles))
+    return desired
+
+
+# =========================
+# PLAN
+# =========================
+
+def read_role_masks(contract, addresses):
+    """{address: roleMask} for every address, via multicall"""
+    calls = Multicall(contract)
+    for address in addresses:
+        calls.add("roleMask", address)
+    return dict(zip(addresses, calls.execute()))
+
+
+def plan_changes(desired, masks):
+    """(grants, revokes) as [(role name, address)] turning masks into desired"""
+    grants, revokes = [], []
+    for address, roles in desired.items():
+        mask = masks[address]
+        for role, bit in ROLE_BITS.items():
+            held = mask & bit != 0
+            if role in roles and not held:
+                grants.append((role, address))
+            elif role not in roles and held:
+                revokes.append((role, address))
+    return grants, revokes
+
+
+# =========================
+# SEND
+# =========================
+
+def _sign_chunks(contract, admin, method, changes, role_ids, chunk_size, nonce):
+    signed = []
+    handler = getattr(contract, method)
+    for start in range(0, len(changes), chunk_size):
+        chunk = [(role_ids[role], address) for role, address in changes[start : start + chunk_size]]
+        txn = handler.as_transaction(chunk, sender=admin, nonce=nonce + len(signed))
+        signed.append(admin.sign_transaction(txn))
+    return signed
+
+
+def provision(contract, admin, desired, dry_run=False, chunk_size=None):
+    """Bring the roles of every manifest account in line with desired.
+
+    Returns a report with the planned grants / revokes, transactions sent,
+    gas used, failures and the seconds spent reading, sending and confirming.
+    """
+    start = time.perf_counter()
+    masks = read_role_masks(contract, list(desired))
+    grants, revokes = plan_changes(desired, masks)
+    report = {
+        "accounts": len(desired),
+        "grants": grants,
+        "revokes": revokes,
+        "transactions": 0,
+        "failed": 0,
+        "gas": 0,
+        "read_seconds": time.perf_counter() - start,
+        "send_seconds": 0.0,
+        "confirm_seconds": 0.0,
+    }
+    if dry_run or not (grants or revokes):
+        report["seconds"] = time.perf_counter() - start
+        return report
+
+    chunk_size = chunk_size or contract.get_MAX_ROLE_BATCH()
+    role_ids = {name: getattr(contract, getter)() for name, getter in ROLE_GETTERS.items()}
+
+    # Sign everything with explicit nonces, then push it all before waiting on any receipt
+    sending = time.perf_counter()
+    nonce = admin.nonce
+    signed = _sign_chunks(contract, admin, "grantRoles", grants, role_ids, chunk_size, nonce)
+    signed += _sign_chunks(contract, admin, "revokeRoles", revokes, role_ids, chunk_size, nonce + len(signed))
+    web3 = chain.provider.web3
+    hashes = [web3.eth.send_raw_transaction(txn.serialize_transaction()) for txn in signed]
+    confirming = time.perf_counter()
+    report["send_seconds"] = confirming - sending
+
+    for txn_hash in hashes:
+        try:
+            receipt = chain.provider.get_receipt(to_hex(txn_hash))
+        except Exception as error:
+            print(f"❌ {to_hex(txn_hash)} failed: {error}")
+            report["failed"] += 1
+            continue
+        report["gas"] += receipt.gas_used
+        if receipt.failed:
+            report["failed"] += 1
+
+    report["transactions"] = len(hashes)
+    report["confirm_seconds"] = time.perf_counter() - confirming
+    report["seconds"] = time.perf_counter() - start
+    return report
+
+
+# =========================
+# CLI
+# =========================
+
+@click.command(cls=ConnectedProviderCommand)
+@click.option("--address", required=True, help="Deployed AgriChain contract address")
+@click.option("--manifest", required=True, type=click.Path(exists=True), help="CSV or YAML roles manifest")
+@click.option("--account", "alias", help="Admin account alias (first test account if omitted)")
+@click.option("--passphrase", envvar="AGRICHAIN_ADMIN_PASSPHRASE", help="Unlock --account for unattended signing")
+@click.option("--chunk-size", type=int, help="Role changes per transaction (default MAX_ROLE_BATCH)")
+@click.option("--dry-run", is_flag=True, help="Print the plan without sending anything")
+def cli(address, manifest, alias, passphrase, chunk_size, dry_run):
+    """Grant and revoke roles so the chain matches a manifest"""
+    contract = project.AgriChain.at(address)
+    admin = accounts.load(alias) if alias else accounts.test_accounts[0]
+    if alias and passphrase:
+        admin.set_autosign(True, passphrase=passphrase)
+
+    desired = load_manifest(manifest)
+    print(f"📋 {len(desired)} accounts in {manifest}")
+    report = provision(contract, admin, desired, dry_run=dry_run, chunk_size=chunk_size)
+
+    for role, account in report["grants"]:
+        print(f"  ➕ {role}_ROLE → {account}")
+    for role, account in report["revokes"]:
+        print(f"  ➖ {role}_ROLE ✕ {account}")
+    print(f"🔍 {len(report['grants'])} grants, {len(report['revokes'])} revokes (read in {report['read_seconds']:.2f}s)")
+
+    if dry_run:
+        print("💡 Dry run: nothing sent")
+        return
+    if report["failed"]:
+        print(f"❌ {report['failed']}/{report['transactions']} transactions failed")
+    print(
+        f"✅ {report['transactions']} txs, {report['gas']:,} gas: "
+        f"sent in {report['send_seconds']:.2f}s, confirmed in {report['confirm_seconds']:.2f}s, "
+        f"total {report['seconds']:.2f}s"
+    )
@@ -1,39 +1,189 @@
+import sys
+from pathlib import Path
+
 import pytest
 from ape import project
 
-@pytest.fixture
+try:
+    from hypothesis import HealthCheck, settings
+except ImportError:  # optional: only test_fuzz_state_machine.py needs it
+    settings = None
+
+# Make `scripts.*` importable so tooling can be tested against the local chain
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# Stateful fuzzing budget: "dev" (~500 steps) by default, `--hypothesis-profile=ci`
+# for ~10k steps (about 22 minutes). Registered here, not in the fuzz module:
+# Hypothesis loads the --hypothesis-profile before test modules are collected.
+if settings is not None:
+    settings.register_profile(
+        "dev", max_examples=10, stateful_step_count=50, deadline=None,
+        suppress_health_check=[HealthCheck.too_slow],
+    )
+    settings.register_profile("ci", parent=settings.get_profile("dev"), max_examples=200, stateful_step_count=50)
+    settings.load_profile("dev")
+
+# Deployments are built once per session (once per xdist worker) and every
+# test runs against them inside Ape's snapshot/revert isolation, so state
+# changes made by one test never leak into the next.
+
+@pytest.fixture(scope="session")
 def admin(accounts):
     return accounts[0]
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def farmer(accounts):
     return accounts[1]
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def inspector(accounts):
     return accounts[2]
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def logistics(accounts):
     return accounts[3]
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def retailer(accounts):
     return accounts[4]
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def consumer(accounts):
     return accounts[5]
 
-@pytest.fixture
-def contract(admin):
+@pytest.fixture(scope="session")
+def quarantine_vault():
+    return "0x000000000000000000000000000000000000dEaD"
+
+@pytest.fixture(scope="session")
+def archive_vault():
+    return "0x000000000000000000000000000000000000aaaa"
+
+def _deploy_with_roles(admin, farmer, inspector, logistics, retailer):
     deployed = admin.deploy(project.AgriChain)
+    deployed.grantRole(deployed.get_FARMER_ROLE(), farmer, sender=admin)
+    deployed.grantRole(deployed.get_INSPECTOR_ROLE(), inspector, sender=admin)
+    deployed.grantRole(deployed.get_LOGISTICS_ROLE(), logistics, sender=admin)
+    deployed.grantRole(deployed.get_RETAILER_ROLE(), retailer, sender=admin)
     return deployed
 
+@pytest.fixture(scope="session")
+def contract(admin):
+    """Fresh deployment, no roles granted"""
+    return admin.deploy(project.AgriChain)
+
+@pytest.fixture(scope="session")
+def deployed_contract(admin, farmer, inspector, logistics, retailer):
+    """Fresh deployment with the four supply-chain roles granted"""
+    return _deploy_with_roles(admin, farmer, inspector, logistics, retailer)
+
+@pytest.fixture(scope="session")
+def lifecycle(admin, farmer, inspector, logistics, retailer):
+    """Deployment with one batch parked in each lifecycle state.
+
+    Returns (contract, {state: batch_id}).
+    """
+    sc = _deploy_with_roles(admin, farmer, inspector, logistics, retailer)
+    sc.mintBatches([f"ipfs://cid-lifecycle/{i}.json" for i in range(5)], sender=farmer)
+    harvested, inspecting, in_transit, delivered, recalled = range(1, 6)
+
+    for batch_id in (inspecting, in_transit, delivered, recalled):
+        sc.markBatchInspected(batch_id, "ipfs://cid-lifecycle/inspected.json", sender=inspector)
+    sc.batchTransferFrom(farmer, logistics, [in_transit, delivered, recalled], sender=farmer)
+    sc.batchTransferFrom(logistics, retailer, [delivered, recalled], sender=logistics)
+    sc.markBatchRecalled(recalled, b"lifecycle", sender=admin)
+
+    return sc, {
+        "harvested": harvested,
+        "inspecting": inspecting,
+        "in_transit": in_transit,
+        "delivered": delivered,
+        "recalled": recalled,
+    }
+
+@pytest.fixture(scope="session", autouse=True)
+def _session_deployments(contract, deployed_contract, lifecycle):
+    # Build every shared deployment before the first module snapshot is taken;
+    # a session fixture first created mid-module would be reverted with it.
+    pass
+
+@pytest.fixture
+def lifecycle_contract(lifecycle):
+    return lifecycle[0]
+
+@pytest.fixture
+def harvested_batch(lifecycle):
+    return lifecycle[1]["harvested"]
+
+@pytest.fixture
+def inspecting_batch(lifecycle):
+    return lifecycle[1]["inspecting"]
+
+@pytest.fixture
+def in_transit_batch(lifecycle):
+    return lifecycle[1]["in_transit"]
+
+@pytest.fixture
+def delivered_batch(lifecycle):
+    return lifecycle[1]["delivered"]
+
 @pytest.fixture
-def deployed_contract(admin, contract, farmer, inspector, logistics, retailer):
-    contract.grantRole(contract.get_FARMER_ROLE(), farmer, sender=admin)
-    contract.grantRole(contract.get_INSPECTOR_ROLE(), inspector, sender=admin)
-    contract.grantRole(contract.get_LOGISTICS_ROLE(), logistics, sender=admin)
-    contract.grantRole(contract.get_RETAILER_ROLE(), retailer, sender=admin)
-    return contract
\ No newline at end of file
+def recalled_batch(lifecycle):
+    return lifecycle[1]["recalled"]
+
+@pytest.fixture
+def mint_attested(deployed_contract, farmer, inspector):
+    """mint_attested(n): mint n lots on deployed_contract and inspect them.
+
+    Returns their ids, all INSPECTING and held by the farmer.
+    """
+    def mint(n):
+        sc = deployed_contract
+        sc.mintBatches([f"ipfs://lot-{i}/meta.json" for i in range(n)], sender=farmer)
+        last = sc.tokenCounter()
+        batch_ids = list(range(last - n + 1, last + 1))
+        for batch_id in batch_ids:
+            sc.markBatchInspected(batch_id, "ipfs://lot/inspected.json", sender=inspector)
+        return batch_ids
+    return mint
+
+@pytest.fixture
+def deliver(deployed_contract, mint_attested, farmer, logistics, retailer):
+    """deliver(n): mint_attested(n), then ship them farmer -> logistics -> retailer.
+
+    Returns their ids, all DELIVERED and held by the retailer.
+    """
+    def ship(n):
+        sc = deployed_contract
+        batch_ids = mint_attested(n)
+        sc.batchTransferFrom(farmer, logistics, batch_ids, sender=farmer)
+        sc.batchTransferFrom(logistics, retailer, batch_ids, sender=logistics)
+        return batch_ids
+    return ship
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench", action="store_true", default=False, help="Run slow benchmark tests"
+    )
+    parser.addoption(
+        "--gas-threshold", type=float, default=0.05,
+        help="Allowed gas increase over tests/gas_baseline.json (0.05 = 5%%)"
+    )
+    parser.addoption(
+        "--update-gas-baseline", action="store_true", default=False,
+        help="Rewrite tests/gas_baseline.json with the measured gas"
+    )
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: slow benchmark, only runs with --bench")
+    if config.getoption("--update-gas-baseline") and getattr(config.option, "numprocesses", None):
+        raise pytest.UsageError("--update-gas-baseline rewrites one file, run it without -n")
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--bench"):
+        return
+
+    skip_bench = pytest.mark.skip(reason="benchmark, run with --bench")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_bench)
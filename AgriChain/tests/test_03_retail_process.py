@@ -2,90 +2,71 @@ import pytest
 from ape.exceptions import ContractLogicError
 
 
-def _mint_attest_and_to_retailer(sc, farmer, inspector, logistics, retailer):
-    """Full flow: mint -> inspect -> logistics -> retailer (DELIVERED)"""
-    sc.mintBatch("ipfs://cid-demo/meta.json", sender=farmer)
-    batch_id = sc.tokenCounter()
+def test_retailer_advance_to_retailed(lifecycle_contract, delivered_batch, retailer):
+    sc = lifecycle_contract
 
-    sc.markBatchInspected(batch_id, "ipfs://cid-demo/inspected.json", sender=inspector)
-    sc.transferFrom(farmer, logistics, batch_id, sender=farmer)
-    sc.transferFrom(logistics, retailer, batch_id, sender=logistics)
+    assert sc.ownerOf(delivered_batch) == retailer.address
+    assert sc.getBatchStatus(delivered_batch) == sc.get_DELIVERED_STATE()
 
-    return batch_id
+    sc.advanceBatchRetailStatus(delivered_batch, sender=retailer)
+    assert sc.getBatchStatus(delivered_batch) == sc.get_RETAILED_STATE()
 
 
-def test_retailer_advance_to_retailed(deployed_contract, farmer, inspector, logistics, retailer):
-    sc = deployed_contract
-    batch_id = _mint_attest_and_to_retailer(sc, farmer, inspector, logistics, retailer)
+def test_retailer_advance_to_consumed(lifecycle_contract, delivered_batch, retailer):
+    sc = lifecycle_contract
 
-    assert sc.ownerOf(batch_id) == retailer.address
-    assert sc.getBatchStatus(batch_id) == sc.get_DELIVERED_STATE()
+    sc.advanceBatchRetailStatus(delivered_batch, sender=retailer)
+    assert sc.getBatchStatus(delivered_batch) == sc.get_RETAILED_STATE()
 
-    sc.advanceBatchRetailStatus(batch_id, sender=retailer)
-    assert sc.getBatchStatus(batch_id) == sc.get_RETAILED_STATE()
+    sc.advanceBatchRetailStatus(delivered_batch, sender=retailer)
+    assert sc.getBatchStatus(delivered_batch) == sc.get_CONSUMED_STATE()
 
 
-def test_retailer_advance_to_consumed(deployed_contract, farmer, inspector, logistics, retailer):
-    sc = deployed_contract
-    batch_id = _mint_attest_and_to_retailer(sc, farmer, inspector, logistics, retailer)
-
-    sc.advanceBatchRetailStatus(batch_id, sender=retailer)
-    assert sc.getBatchStatus(batch_id) == sc.get_RETAILED_STATE()
-
-    sc.advanceBatchRetailStatus(batch_id, sender=retailer)
-    assert sc.getBatchStatus(batch_id) == sc.get_CONSUMED_STATE()
-
-
-def test_only_retailer_holder_can_advance(deployed_contract, admin, farmer, inspector, logistics, retailer, consumer):
-    sc = deployed_contract
-    batch_id = _mint_attest_and_to_retailer(sc, farmer, inspector, logistics, retailer)
+def test_only_retailer_holder_can_advance(lifecycle_contract, delivered_batch, admin, farmer, retailer, consumer):
+    sc = lifecycle_contract
 
     with pytest.raises(ContractLogicError, match="Missing required role"):
-        sc.advanceBatchRetailStatus(batch_id, sender=farmer)
+        sc.advanceBatchRetailStatus(delivered_batch, sender=farmer)
 
     sc.grantRole(sc.get_RETAILER_ROLE(), consumer, sender=admin)
     with pytest.raises(ContractLogicError, match="Not current holder"):
-        sc.advanceBatchRetailStatus(batch_id, sender=consumer)
+        sc.advanceBatchRetailStatus(delivered_batch, sender=consumer)
 
-    sc.advanceBatchRetailStatus(batch_id, sender=retailer)
-    assert sc.getBatchStatus(batch_id) == sc.get_RETAILED_STATE()
+    sc.advanceBatchRetailStatus(delivered_batch, sender=retailer)
+    assert sc.getBatchStatus(delivered_batch) == sc.get_RETAILED_STATE()
 
 
-def test_delivered_transfer_to_non_role_blocked(deployed_contract, farmer, inspector, logistics, retailer, consumer):
-    sc = deployed_contract
-    batch_id = _mint_attest_and_to_retailer(sc, farmer, inspector, logistics, retailer)
-    
-    assert sc.getBatchStatus(batch_id) == sc.get_DELIVERED_STATE()
+def test_delivered_transfer_to_non_role_blocked(lifecycle_contract, delivered_batch, retailer, consumer):
+    sc = lifecycle_contract
+
+    assert sc.getBatchStatus(delivered_batch) == sc.get_DELIVERED_STATE()
     
     with pytest.raises(ContractLogicError, match="Recipient has no valid supply-chain role"):
-        sc.transferFrom(retailer, consumer, batch_id, sender=retailer)
+        sc.transferFrom(retailer, consumer, delivered_batch, sender=retailer)
 
 
-def test_transfer_blocked_after_retailed(deployed_contract, farmer, inspector, logistics, retailer):
-    sc = deployed_contract
-    batch_id = _mint_attest_and_to_retailer(sc, farmer, inspector, logistics, retailer)
+def test_transfer_blocked_after_retailed(lifecycle_contract, delivered_batch, logistics, retailer):
+    sc = lifecycle_contract
 
-    sc.advanceBatchRetailStatus(batch_id, sender=retailer)
-    assert sc.getBatchStatus(batch_id) == sc.get_RETAILED_STATE()
+    sc.advanceBatchRetailStatus(delivered_batch, sender=retailer)
+    assert sc.getBatchStatus(delivered_batch) == sc.get_RETAILED_STATE()
 
     with pytest.raises(ContractLogicError, match="Token in DELIVERED/RETAILED state cannot be transferred"):
-        sc.transferFrom(retailer, logistics, batch_id, sender=retailer)
+        sc.transferFrom(retailer, logistics, delivered_batch, sender=retailer)
 
 
-def test_archive_transfer_only_when_consumed(deployed_contract, farmer, inspector, logistics, retailer):
-    sc = deployed_contract
-    batch_id = _mint_attest_and_to_retailer(sc, farmer, inspector, logistics, retailer)
+def test_archive_transfer_only_when_consumed(lifecycle_contract, delivered_batch, logistics, retailer, archive_vault):
+    sc = lifecycle_contract
 
-    sc.advanceBatchRetailStatus(batch_id, sender=retailer)
-    assert sc.getBatchStatus(batch_id) == sc.get_RETAILED_STATE()
+    sc.advanceBatchRetailStatus(delivered_batch, sender=retailer)
+    assert sc.getBatchStatus(delivered_batch) == sc.get_RETAILED_STATE()
 
     with pytest.raises(ContractLogicError, match="Token in DELIVERED/RETAILED state cannot be transferred"):
-        sc.transferFrom(retailer, logistics, batch_id, sender=retailer)
+        sc.transferFrom(retailer, logistics, delivered_batch, sender=retailer)
 
-    sc.advanceBatchRetailStatus(batch_id, sender=retailer)
-    assert sc.getBatchStatus(batch_id) == sc.get_CONSUMED_STATE()
+    sc.advanceBatchRetailStatus(delivered_batch, sender=retailer)
+    assert sc.getBatchStatus(delivered_batch) == sc.get_CONSUMED_STATE()
 
-    ARCHIVE = "0x000000000000000000000000000000000000aaaa"
-    sc.transferFrom(retailer, ARCHIVE, batch_id, sender=retailer)
+    sc.transferFrom(retailer, archive_vault, delivered_batch, sender=retailer)
 
-    assert sc.ownerOf(batch_id) == ARCHIVE
+    assert sc.ownerOf(delivered_batch) == archive_vault
@@ -1,11 +1,8 @@
 import pytest
 from ape.exceptions import ContractLogicError
 
-ARCHIVE_VAULT = "0x000000000000000000000000000000000000aaaa"
-QUARANTINE_VAULT = "0x000000000000000000000000000000000000dEaD"
 
-
-def test_happy_path_full_lifecycle(deployed_contract, farmer, inspector, logistics, retailer):
+def test_happy_path_full_lifecycle(deployed_contract, farmer, inspector, logistics, retailer, archive_vault):
     sc = deployed_contract
     
     # Farmer mints batch
@@ -41,11 +38,11 @@ def test_happy_path_full_lifecycle(deployed_contract, farmer, inspector, logisti
     assert sc.getBatchStatus(batch_id) == sc.get_CONSUMED_STATE()
     
     # Retailer archives to ARCHIVE_VAULT
-    sc.transferFrom(retailer, ARCHIVE_VAULT, batch_id, sender=retailer)
-    assert sc.ownerOf(batch_id) == ARCHIVE_VAULT
+    sc.transferFrom(retailer, archive_vault, batch_id, sender=retailer)
+    assert sc.ownerOf(batch_id) == archive_vault
 
 
-def test_recall_path_full_lifecycle(deployed_contract, admin, farmer, inspector, logistics, retailer):
+def test_recall_path_full_lifecycle(deployed_contract, admin, farmer, inspector, logistics, retailer, quarantine_vault):
     sc = deployed_contract
     
     # Normal flow to DELIVERED
@@ -65,6 +62,6 @@ def test_recall_path_full_lifecycle(deployed_contract, admin, farmer, inspector,
     assert sc.ownerOf(batch_id) == retailer.address  # Still with retailer
     
     # Retailer sends to quarantine
-    sc.transferFrom(retailer, QUARANTINE_VAULT, batch_id, sender=retailer)
-    assert sc.ownerOf(batch_id) == QUARANTINE_VAULT
+    sc.transferFrom(retailer, quarantine_vault, batch_id, sender=retailer)
+    assert sc.ownerOf(batch_id) == quarantine_vault
     assert sc.getBatchStatus(batch_id) == sc.get_RECALLED_STATE()
@@ -0,0 +1,86 @@
+import pytest
+from ape.exceptions import ContractLogicError
+
+
+def _mint_many(sc, farmer, n):
+    for i in range(n):
+        sc.mintBatch(f"ipfs://cid-{i}/meta.json", sender=farmer)
+
+
+def test_range_returns_owner_status_uri(deployed_contract, farmer):
+    sc = deployed_contract
+    _mint_many(sc, farmer, 3)
+
+    page = sc.getBatchesInRange(1, 3)
+
+    assert [b.id for b in page] == [1, 2, 3]
+    for b in page:
+        assert b.owner == sc.ownerOf(b.id)
+        assert b.status == sc.getBatchStatus(b.id)
+        assert b.uri == sc.tokenURI(b.id)
+
+
+def test_range_reflects_transfers(deployed_contract, farmer, inspector, logistics):
+    sc = deployed_contract
+    _mint_many(sc, farmer, 2)
+    sc.markBatchInspected(2, "ipfs://cid-1/inspected.json", sender=inspector)
+    sc.transferFrom(farmer, logistics, 2, sender=farmer)
+
+    first, second = sc.getBatchesInRange(1, 2)
+
+    assert first.owner == farmer.address
+    assert first.status == sc.get_HARVESTED_STATE()
+    assert second.owner == logistics.address
+    assert second.status == sc.get_IN_TRANSIT_STATE()
+    assert second.uri == "ipfs://cid-1/inspected.json"
+
+
+def test_range_is_clamped_to_token_counter(deployed_contract, farmer):
+    sc = deployed_contract
+    _mint_many(sc, farmer, 5)
+
+    assert [b.id for b in sc.getBatchesInRange(4, 10)] == [4, 5]
+    assert len(sc.getBatchesInRange(6, 10)) == 0
+    assert len(sc.getBatchesInRange(1, 0)) == 0
+
+
+def test_range_on_empty_contract(deployed_contract):
+    assert len(deployed_contract.getBatchesInRange(1, 10)) == 0
+
+
+def test_range_pages_cover_all_batches(deployed_contract, farmer):
+    sc = deployed_contract
+    _mint_many(sc, farmer, 7)
+
+    seen = []
+    for start in range(1, sc.tokenCounter() + 1, 3):
+        seen.extend(b.id for b in sc.getBatchesInRange(start, 3))
+
+    assert seen == list(range(1, 8))
+
+
+def test_range_bounds_are_enforced(deployed_contract, farmer):
+    sc = deployed_contract
+    _mint_many(sc, farmer, 1)
+    max_page = sc.get_MAX_BATCH_PAGE()
+
+    with pytest.raises(ContractLogicError, match="Batch ids start at 1"):
+        sc.getBatchesInRange(0, 1)
+
+    with pytest.raises(ContractLogicError, match="Page too large"):
+        sc.getBatchesInRange(1, max_page + 1)
+
+    assert len(sc.getBatchesInRange(1, max_page)) == 1
+
+
+def test_storage_getters_match_packed_state(deployed_contract, farmer, inspector, logistics, retailer):
+    sc = deployed_contract
+    _mint_many(sc, farmer, 1)
+    sc.markBatchInspected(1, "ipfs://cid-0/inspected.json", sender=inspector)
+    sc.transferFrom(farmer, logistics, 1, sender=farmer)
+    sc.transferFrom(logistics, retailer, 1, sender=logistics)
+
+    assert sc.tokenOwner(1) == retailer.address == sc.ownerOf(1)
+    assert sc.batchStatus(1) == sc.get_DELIVERED_STATE() == sc.getBatchStatus(1)
+    assert sc.tokenOwner(2) == "0x0000000000000000000000000000000000000000"
+    assert sc.batchStatus(2) == 0
@@ -0,0 +1,84 @@
+import pytest
+from ape.exceptions import ContractLogicError
+
+
+def _uris(n, prefix="lot"):
+    return [f"ipfs://{prefix}-{i}/meta.json" for i in range(n)]
+
+
+def test_farmer_mints_many_batches(deployed_contract, farmer):
+    sc = deployed_contract
+    sc.mintBatch("ipfs://single/meta.json", sender=farmer)
+    uris = _uris(5)
+
+    sc.mintBatches(uris, sender=farmer)
+
+    assert sc.tokenCounter() == 6
+    assert sc.balanceOf(farmer) == 6
+    for batch_id, uri in zip(range(2, 7), uris):
+        assert sc.ownerOf(batch_id) == farmer.address
+        assert sc.tokenURI(batch_id) == uri
+        assert sc.getBatchStatus(batch_id) == sc.get_HARVESTED_STATE()
+
+
+def test_bulk_mint_emits_same_events_per_token(deployed_contract, farmer):
+    sc = deployed_contract
+    uris = _uris(3)
+
+    tx = sc.mintBatches(uris, sender=farmer)
+
+    uri_events = tx.decode_logs(sc.URI)
+    status_events = tx.decode_logs(sc.StatusUpdated)
+    minted_events = tx.decode_logs(sc.BatchMinted)
+    transfer_events = tx.decode_logs(sc.Transfer)
+
+    assert [e.tokenId for e in uri_events] == [1, 2, 3]
+    assert [e.value for e in uri_events] == uris
+    assert [(e.batchId, e.oldStatus, e.newStatus) for e in status_events] == [
+        (1, 0, 1), (2, 0, 1), (3, 0, 1)
+    ]
+    assert [(e.batchId, e.farmer) for e in minted_events] == [(i, farmer.address) for i in (1, 2, 3)]
+    assert [(e._from, e._to, e.tokenId) for e in transfer_events] == [
+        ("0x0000000000000000000000000000000000000000", farmer.address, i) for i in (1, 2, 3)
+    ]
+
+
+def test_bulk_minted_batches_follow_lifecycle(deployed_contract, farmer, inspector, logistics):
+    sc = deployed_contract
+    sc.mintBatches(_uris(2), sender=farmer)
+
+    sc.markBatchInspected(2, "ipfs://lot-1/inspected.json", sender=inspector)
+    sc.transferFrom(farmer, logistics, 2, sender=farmer)
+
+    assert sc.ownerOf(2) == logistics.address
+    assert sc.getBatchStatus(2) == sc.get_IN_TRANSIT_STATE()
+    assert sc.getBatchStatus(1) == sc.get_HARVESTED_STATE()
+
+
+def test_only_farmer_can_bulk_mint(deployed_contract, logistics):
+    with pytest.raises(ContractLogicError, match="Missing required role"):
+        deployed_contract.mintBatches(_uris(2), sender=logistics)
+
+
+def test_bulk_mint_is_all_or_nothing(deployed_contract, farmer):
+    sc = deployed_contract
+    uris = _uris(3)
+    uris[1] = ""
+
+    with pytest.raises(ContractLogicError, match="URI required"):
+        sc.mintBatches(uris, sender=farmer)
+
+    assert sc.tokenCounter() == 0
+    assert sc.balanceOf(farmer) == 0
+
+
+def test_bulk_mint_rejects_empty_and_oversized(deployed_contract, farmer):
+    sc = deployed_contract
+
+    with pytest.raises(ContractLogicError, match="No URIs given"):
+        sc.mintBatches([], sender=farmer)
+
+    with pytest.raises(ContractLogicError):
+        sc.mintBatches(_uris(sc.get_MAX_MINT_BATCH() + 1), sender=farmer)
+
+    assert sc.tokenCounter() == 0
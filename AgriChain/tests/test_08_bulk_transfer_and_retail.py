@@ -0,0 +1,132 @@
+import pytest
+from ape.exceptions import ContractLogicError
+
+
+def test_farmer_batch_transfer_to_logistics(deployed_contract, farmer, logistics, mint_attested):
+    sc = deployed_contract
+    batch_ids = mint_attested(3)
+
+    tx = sc.batchTransferFrom(farmer, logistics, batch_ids, sender=farmer)
+
+    for batch_id in batch_ids:
+        assert sc.ownerOf(batch_id) == logistics.address
+        assert sc.getBatchStatus(batch_id) == sc.get_IN_TRANSIT_STATE()
+    assert sc.balanceOf(farmer) == 0
+    assert sc.balanceOf(logistics) == 3
+    assert [e.tokenId for e in tx.decode_logs(sc.Transfer)] == batch_ids
+    assert [e.newStatus for e in tx.decode_logs(sc.StatusUpdated)] == [sc.get_IN_TRANSIT_STATE()] * 3
+
+
+def test_logistics_batch_transfer_to_retailer(deployed_contract, retailer, deliver):
+    sc = deployed_contract
+    batch_ids = deliver(3)
+
+    for batch_id in batch_ids:
+        assert sc.ownerOf(batch_id) == retailer.address
+        assert sc.getBatchStatus(batch_id) == sc.get_DELIVERED_STATE()
+
+
+def test_batch_transfer_is_all_or_nothing(deployed_contract, farmer, logistics, mint_attested):
+    sc = deployed_contract
+    batch_ids = mint_attested(2)
+    sc.mintBatch("ipfs://not-inspected/meta.json", sender=farmer)
+    batch_ids.append(sc.tokenCounter())
+
+    with pytest.raises(ContractLogicError, match="Cannot transfer in HARVESTED state"):
+        sc.batchTransferFrom(farmer, logistics, batch_ids, sender=farmer)
+
+    for batch_id in batch_ids:
+        assert sc.ownerOf(batch_id) == farmer.address
+    assert sc.getBatchStatus(batch_ids[0]) == sc.get_INSPECTING_STATE()
+
+
+def test_batch_transfer_wrong_recipient_role(deployed_contract, farmer, retailer, mint_attested):
+    sc = deployed_contract
+    batch_ids = mint_attested(2)
+
+    with pytest.raises(ContractLogicError, match="Recipient must be logistics"):
+        sc.batchTransferFrom(farmer, retailer, batch_ids, sender=farmer)
+
+
+def test_batch_transfer_requires_approval(deployed_contract, admin, farmer, logistics, accounts, mint_attested):
+    sc = deployed_contract
+    batch_ids = mint_attested(2)
+
+    with pytest.raises(ContractLogicError, match="Not owner nor approved"):
+        sc.batchTransferFrom(farmer, logistics, batch_ids, sender=logistics)
+
+    # Operator delegation works for the whole load (actor must still be a farmer)
+    co_op = accounts[6]
+    sc.grantRole(sc.get_FARMER_ROLE(), co_op, sender=admin)
+    sc.setApprovalForAll(co_op, True, sender=farmer)
+    sc.batchTransferFrom(farmer, logistics, batch_ids, sender=co_op)
+
+    for batch_id in batch_ids:
+        assert sc.ownerOf(batch_id) == logistics.address
+
+
+def test_batch_transfer_rejects_empty_list(deployed_contract, farmer, logistics):
+    with pytest.raises(ContractLogicError, match="No batches given"):
+        deployed_contract.batchTransferFrom(farmer, logistics, [], sender=farmer)
+
+
+def test_batch_quarantine_of_recalled(deployed_contract, admin, logistics, retailer, deliver, quarantine_vault):
+    sc = deployed_contract
+    batch_ids = deliver(2)
+    for batch_id in batch_ids:
+        sc.markBatchRecalled(batch_id, b"qa", sender=admin)
+
+    with pytest.raises(ContractLogicError, match="Can only transfer RECALLED to QUARANTINE_VAULT"):
+        sc.batchTransferFrom(retailer, logistics, batch_ids, sender=retailer)
+
+    sc.batchTransferFrom(retailer, quarantine_vault, batch_ids, sender=retailer)
+    for batch_id in batch_ids:
+        assert sc.ownerOf(batch_id) == quarantine_vault
+        assert sc.getBatchStatus(batch_id) == sc.get_RECALLED_STATE()
+
+
+def test_retailer_advances_many(deployed_contract, retailer, deliver, archive_vault):
+    sc = deployed_contract
+    batch_ids = deliver(3)
+
+    sc.advanceBatchRetailStatusMany(batch_ids, sender=retailer)
+    for batch_id in batch_ids:
+        assert sc.getBatchStatus(batch_id) == sc.get_RETAILED_STATE()
+
+    tx = sc.advanceBatchRetailStatusMany(batch_ids, sender=retailer)
+    for batch_id in batch_ids:
+        assert sc.getBatchStatus(batch_id) == sc.get_CONSUMED_STATE()
+    assert [(e.batchId, e.oldStatus, e.newStatus) for e in tx.decode_logs(sc.StatusUpdated)] == [
+        (batch_id, sc.get_RETAILED_STATE(), sc.get_CONSUMED_STATE()) for batch_id in batch_ids
+    ]
+
+    tx = sc.batchTransferFrom(retailer, archive_vault, batch_ids, sender=retailer)
+    assert [e.batchId for e in tx.decode_logs(sc.BatchArchived)] == batch_ids
+    assert sc.balanceOf(archive_vault) == 3
+
+
+def test_only_retailer_holder_can_advance_many(deployed_contract, admin, farmer, consumer, deliver):
+    sc = deployed_contract
+    batch_ids = deliver(2)
+
+    with pytest.raises(ContractLogicError, match="Missing required role"):
+        sc.advanceBatchRetailStatusMany(batch_ids, sender=farmer)
+
+    sc.grantRole(sc.get_RETAILER_ROLE(), consumer, sender=admin)
+    with pytest.raises(ContractLogicError, match="Not current holder"):
+        sc.advanceBatchRetailStatusMany(batch_ids, sender=consumer)
+
+
+def test_advance_many_is_all_or_nothing(deployed_contract, retailer, deliver):
+    sc = deployed_contract
+    batch_ids = deliver(2)
+    sc.advanceBatchRetailStatus(batch_ids[1], sender=retailer)
+    sc.advanceBatchRetailStatus(batch_ids[1], sender=retailer)
+
+    with pytest.raises(ContractLogicError, match="Invalid state for retail progress"):
+        sc.advanceBatchRetailStatusMany(batch_ids, sender=retailer)
+
+    assert sc.getBatchStatus(batch_ids[0]) == sc.get_DELIVERED_STATE()
+
+    with pytest.raises(ContractLogicError, match="No batches given"):
+        sc.advanceBatchRetailStatusMany([], sender=retailer)
@@ -0,0 +1,115 @@
+import pytest
+from ape.exceptions import ContractLogicError
+
+FARMER_BIT = 1
+INSPECTOR_BIT = 2
+LOGISTICS_BIT = 4
+RETAILER_BIT = 8
+ADMIN_BIT = 16
+
+
+def _role_bits(sc):
+    return [
+        (sc.get_FARMER_ROLE(), FARMER_BIT),
+        (sc.get_INSPECTOR_ROLE(), INSPECTOR_BIT),
+        (sc.get_LOGISTICS_ROLE(), LOGISTICS_BIT),
+        (sc.get_RETAILER_ROLE(), RETAILER_BIT),
+        (sc.get_ADMIN_ROLE(), ADMIN_BIT),
+    ]
+
+
+def test_fixture_accounts_have_matching_masks(deployed_contract, admin, farmer, inspector, logistics, retailer, consumer):
+    sc = deployed_contract
+
+    assert sc.roleMask(admin) == ADMIN_BIT
+    assert sc.roleMask(farmer) == FARMER_BIT
+    assert sc.roleMask(inspector) == INSPECTOR_BIT
+    assert sc.roleMask(logistics) == LOGISTICS_BIT
+    assert sc.roleMask(retailer) == RETAILER_BIT
+    assert sc.roleMask(consumer) == 0
+
+
+def test_grant_and_revoke_keep_mask_in_sync(deployed_contract, admin, accounts):
+    sc = deployed_contract
+    account = accounts[7]
+
+    expected = 0
+    for role, bit in _role_bits(sc):
+        sc.grantRole(role, account, sender=admin)
+        expected |= bit
+        assert sc.hasRole(role, account)
+        assert sc.roles(role, account)
+        assert sc.roleMask(account) == expected
+
+    for role, bit in _role_bits(sc):
+        sc.revokeRole(role, account, sender=admin)
+        expected &= ~bit
+        assert not sc.hasRole(role, account)
+        assert not sc.roles(role, account)
+        assert sc.roleMask(account) == expected
+
+    assert expected == 0
+
+
+def test_repeated_grant_and_revoke_are_idempotent(deployed_contract, admin, accounts):
+    sc = deployed_contract
+    account = accounts[7]
+    role = sc.get_INSPECTOR_ROLE()
+
+    sc.grantRole(role, account, sender=admin)
+    sc.grantRole(role, account, sender=admin)
+    assert sc.roleMask(account) == INSPECTOR_BIT
+
+    sc.revokeRole(role, account, sender=admin)
+    sc.revokeRole(role, account, sender=admin)
+    assert sc.roleMask(account) == 0
+    assert not sc.hasRole(role, account)
+
+
+def test_revoking_one_role_keeps_the_others(deployed_contract, admin, farmer):
+    sc = deployed_contract
+    sc.grantRole(sc.get_RETAILER_ROLE(), farmer, sender=admin)
+    assert sc.roleMask(farmer) == FARMER_BIT | RETAILER_BIT
+
+    sc.revokeRole(sc.get_FARMER_ROLE(), farmer, sender=admin)
+
+    assert sc.roleMask(farmer) == RETAILER_BIT
+    assert sc.hasRole(sc.get_RETAILER_ROLE(), farmer)
+    with pytest.raises(ContractLogicError, match="Missing required role"):
+        sc.mintBatch("ipfs://lot/meta.json", sender=farmer)
+
+
+def test_custom_role_does_not_touch_mask(deployed_contract, admin, accounts):
+    sc = deployed_contract
+    account = accounts[7]
+    custom_role = b"\x42" * 32
+
+    sc.grantRole(custom_role, account, sender=admin)
+    assert sc.hasRole(custom_role, account)
+    assert sc.roleMask(account) == 0
+
+    sc.revokeRole(custom_role, account, sender=admin)
+    assert not sc.hasRole(custom_role, account)
+
+
+def test_revoked_logistics_cannot_receive(deployed_contract, admin, farmer, inspector, logistics):
+    sc = deployed_contract
+    sc.mintBatch("ipfs://lot/meta.json", sender=farmer)
+    batch_id = sc.tokenCounter()
+    sc.markBatchInspected(batch_id, "ipfs://lot/inspected.json", sender=inspector)
+
+    sc.revokeRole(sc.get_LOGISTICS_ROLE(), logistics, sender=admin)
+
+    with pytest.raises(ContractLogicError, match="Recipient has no valid supply-chain role"):
+        sc.transferFrom(farmer, logistics, batch_id, sender=farmer)
+
+
+def test_revoked_farmer_loses_inspection_and_transfer_rights(deployed_contract, admin, farmer, inspector, logistics):
+    sc = deployed_contract
+    sc.mintBatch("ipfs://lot/meta.json", sender=farmer)
+    batch_id = sc.tokenCounter()
+
+    sc.revokeRole(sc.get_FARMER_ROLE(), farmer, sender=admin)
+
+    with pytest.raises(ContractLogicError, match="Batch must be held by a farmer"):
+        sc.markBatchInspected(batch_id, "ipfs://lot/inspected.json", sender=inspector)
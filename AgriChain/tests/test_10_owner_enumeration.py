@@ -0,0 +1,115 @@
+import pytest
+from ape.exceptions import ContractLogicError
+
+
+def _owned_tokens(sc, owner):
+    return [sc.tokenOfOwnerByIndex(owner, i) for i in range(sc.balanceOf(owner))]
+
+
+def _assert_index_consistent(sc, owners):
+    # Every token appears exactly once, under its current owner
+    seen = []
+    for owner in owners:
+        tokens = _owned_tokens(sc, owner)
+        for token_id in tokens:
+            assert sc.ownerOf(token_id) == owner
+        seen.extend(tokens)
+    assert sorted(seen) == list(range(1, sc.totalSupply() + 1))
+
+
+def test_mint_appends_to_owner_list(deployed_contract, farmer):
+    sc = deployed_contract
+    sc.mintBatch("ipfs://a/meta.json", sender=farmer)
+    sc.mintBatches(["ipfs://b/meta.json", "ipfs://c/meta.json"], sender=farmer)
+
+    assert sc.totalSupply() == 3
+    assert [sc.tokenByIndex(i) for i in range(3)] == [1, 2, 3]
+    assert _owned_tokens(sc, farmer) == [1, 2, 3]
+
+
+def test_out_of_bounds_indexes_revert(deployed_contract, farmer, retailer):
+    sc = deployed_contract
+    sc.mintBatch("ipfs://a/meta.json", sender=farmer)
+
+    with pytest.raises(ContractLogicError, match="Index out of bounds"):
+        sc.tokenByIndex(1)
+    with pytest.raises(ContractLogicError, match="Owner index out of bounds"):
+        sc.tokenOfOwnerByIndex(farmer, 1)
+    with pytest.raises(ContractLogicError, match="Owner index out of bounds"):
+        sc.tokenOfOwnerByIndex(retailer, 0)
+
+
+def test_transfer_swaps_last_token_into_gap(deployed_contract, farmer, logistics, mint_attested):
+    sc = deployed_contract
+    batch_ids = mint_attested(4)
+
+    sc.transferFrom(farmer, logistics, batch_ids[1], sender=farmer)
+
+    assert _owned_tokens(sc, farmer) == [batch_ids[0], batch_ids[3], batch_ids[2]]
+    assert _owned_tokens(sc, logistics) == [batch_ids[1]]
+
+    # Removing the last entry needs no swap
+    sc.transferFrom(farmer, logistics, batch_ids[2], sender=farmer)
+    assert _owned_tokens(sc, farmer) == [batch_ids[0], batch_ids[3]]
+    assert _owned_tokens(sc, logistics) == [batch_ids[1], batch_ids[2]]
+
+
+def test_index_consistent_across_bulk_moves(deployed_contract, farmer, logistics, retailer, mint_attested):
+    sc = deployed_contract
+    batch_ids = mint_attested(6)
+    owners = [farmer.address, logistics.address, retailer.address]
+
+    sc.batchTransferFrom(farmer, logistics, batch_ids[::2], sender=farmer)
+    _assert_index_consistent(sc, owners)
+
+    sc.batchTransferFrom(logistics, retailer, [batch_ids[4], batch_ids[0]], sender=logistics)
+    _assert_index_consistent(sc, owners)
+    assert sorted(_owned_tokens(sc, retailer)) == [batch_ids[0], batch_ids[4]]
+    assert sorted(_owned_tokens(sc, logistics)) == [batch_ids[2]]
+
+
+def test_quarantine_and_archive_moves_update_index(
+    deployed_contract, admin, farmer, logistics, retailer, mint_attested, quarantine_vault, archive_vault
+):
+    sc = deployed_contract
+    batch_ids = mint_attested(3)
+    sc.batchTransferFrom(farmer, logistics, batch_ids, sender=farmer)
+    sc.batchTransferFrom(logistics, retailer, batch_ids, sender=logistics)
+
+    # Recalled batch leaves the retailer's list for the quarantine vault
+    sc.markBatchRecalled(batch_ids[0], b"recall", sender=admin)
+    sc.transferFrom(retailer, quarantine_vault, batch_ids[0], sender=retailer)
+
+    # Consumed batch leaves for the archive vault
+    sc.advanceBatchRetailStatus(batch_ids[1], sender=retailer)
+    sc.advanceBatchRetailStatus(batch_ids[1], sender=retailer)
+    assert sc.getBatchStatus(batch_ids[1]) == sc.get_CONSUMED_STATE()
+    sc.transferFrom(retailer, archive_vault, batch_ids[1], sender=retailer)
+
+    assert _owned_tokens(sc, retailer) == [batch_ids[2]]
+    assert _owned_tokens(sc, quarantine_vault) == [batch_ids[0]]
+    assert _owned_tokens(sc, archive_vault) == [batch_ids[1]]
+    assert sc.totalSupply() == 3
+    _assert_index_consistent(
+        sc, [farmer.address, logistics.address, retailer.address, quarantine_vault, archive_vault]
+    )
+
+
+def test_self_transfer_by_multi_role_account(deployed_contract, admin, farmer, retailer, mint_attested):
+    # A farmer that also holds LOGISTICS ships to itself: INSPECTING -> IN_TRANSIT
+    sc = deployed_contract
+    sc.grantRole(sc.get_LOGISTICS_ROLE(), farmer, sender=admin)
+    batch_ids = mint_attested(3)
+
+    sc.transferFrom(farmer, farmer, batch_ids[0], sender=farmer)
+
+    assert sc.getBatchStatus(batch_ids[0]) == sc.get_IN_TRANSIT_STATE()
+    assert sc.balanceOf(farmer) == 3
+    assert sorted(_owned_tokens(sc, farmer)) == batch_ids
+
+    sc.batchTransferFrom(farmer, farmer, batch_ids[1:], sender=farmer)
+    sc.transferFrom(farmer, retailer, batch_ids[0], sender=farmer)
+
+    assert sc.balanceOf(farmer) == 2
+    assert sorted(_owned_tokens(sc, farmer)) == batch_ids[1:]
+    _assert_index_consistent(sc, [farmer.address, retailer.address])
@@ -0,0 +1,113 @@
+import pytest
+from ape.exceptions import ContractLogicError
+
+
+# HARVESTED .. RECALLED
+STATUSES = range(1, 8)
+
+
+def _status_members(sc, status):
+    members = []
+    total = sc.statusBatchCount(status)
+    page_size = sc.get_MAX_BATCH_PAGE()
+    for offset in range(0, total, page_size):
+        members.extend(b.id for b in sc.getBatchesByStatus(status, offset, page_size))
+    return members
+
+
+def _assert_status_index_consistent(sc):
+    counts = [sc.statusBatchCount(status) for status in STATUSES]
+    assert sum(counts) == sc.tokenCounter()
+
+    seen = []
+    for status in STATUSES:
+        members = _status_members(sc, status)
+        assert len(members) == sc.statusBatchCount(status)
+        for batch_id in members:
+            assert sc.getBatchStatus(batch_id) == status
+        seen.extend(members)
+    assert sorted(seen) == list(range(1, sc.tokenCounter() + 1))
+
+
+def test_minted_batches_join_harvested_queue(deployed_contract, farmer):
+    sc = deployed_contract
+    sc.mintBatch("ipfs://a/meta.json", sender=farmer)
+    sc.mintBatches(["ipfs://b/meta.json", "ipfs://c/meta.json"], sender=farmer)
+
+    queue = sc.getBatchesByStatus(sc.get_HARVESTED_STATE(), 0, 10)
+
+    assert [b.id for b in queue] == [1, 2, 3]
+    assert [b.owner for b in queue] == [farmer.address] * 3
+    assert queue[1].uri == "ipfs://b/meta.json"
+    assert sc.statusBatchCount(sc.get_HARVESTED_STATE()) == 3
+    _assert_status_index_consistent(sc)
+
+
+def test_inspection_moves_batch_between_queues(deployed_contract, farmer, inspector):
+    sc = deployed_contract
+    sc.mintBatches([f"ipfs://lot-{i}/meta.json" for i in range(4)], sender=farmer)
+
+    sc.markBatchInspected(2, "ipfs://lot/inspected.json", sender=inspector)
+
+    harvested = [b.id for b in sc.getBatchesByStatus(sc.get_HARVESTED_STATE(), 0, 10)]
+    assert sorted(harvested) == [1, 3, 4]
+    assert [b.id for b in sc.getBatchesByStatus(sc.get_INSPECTING_STATE(), 0, 10)] == [2]
+    _assert_status_index_consistent(sc)
+
+
+def test_status_pagination(deployed_contract, farmer):
+    sc = deployed_contract
+    sc.mintBatches([f"ipfs://lot-{i}/meta.json" for i in range(5)], sender=farmer)
+    harvested = sc.get_HARVESTED_STATE()
+
+    first = sc.getBatchesByStatus(harvested, 0, 2)
+    second = sc.getBatchesByStatus(harvested, 2, 2)
+    last = sc.getBatchesByStatus(harvested, 4, 2)
+
+    assert [b.id for b in first + second + last] == [1, 2, 3, 4, 5]
+    assert sc.getBatchesByStatus(harvested, 5, 2) == []
+    assert sc.getBatchesByStatus(sc.get_RECALLED_STATE(), 0, 2) == []
+
+
+def test_status_page_size_is_bounded(deployed_contract):
+    sc = deployed_contract
+    with pytest.raises(ContractLogicError, match="Page too large"):
+        sc.getBatchesByStatus(sc.get_HARVESTED_STATE(), 0, sc.get_MAX_BATCH_PAGE() + 1)
+
+
+def test_counts_sum_to_token_counter_through_lifecycle(
+    deployed_contract, admin, farmer, logistics, retailer, mint_attested, quarantine_vault, archive_vault
+):
+    sc = deployed_contract
+    batch_ids = mint_attested(6)
+    sc.mintBatch("ipfs://late/meta.json", sender=farmer)
+    _assert_status_index_consistent(sc)
+
+    sc.batchTransferFrom(farmer, logistics, batch_ids, sender=farmer)
+    _assert_status_index_consistent(sc)
+
+    sc.batchTransferFrom(logistics, retailer, batch_ids[:4], sender=logistics)
+    _assert_status_index_consistent(sc)
+
+    sc.advanceBatchRetailStatusMany(batch_ids[:3], sender=retailer)
+    sc.advanceBatchRetailStatus(batch_ids[0], sender=retailer)
+    _assert_status_index_consistent(sc)
+
+    sc.transferFrom(retailer, archive_vault, batch_ids[0], sender=retailer)
+    sc.markBatchRecalled(batch_ids[4], b"recall", sender=admin)
+    sc.markBatchRecalled(batch_ids[1], b"recall", sender=admin)
+    _assert_status_index_consistent(sc)
+
+    # Every RECALLED batch, quarantined or not; none has reached the vault yet
+    recalled = sc.getBatchesByStatus(sc.get_RECALLED_STATE(), 0, 10)
+    assert sorted(b.id for b in recalled) == [batch_ids[1], batch_ids[4]]
+    assert {b.owner for b in recalled} == {retailer.address, logistics.address}
+
+    # Quarantine keeps the RECALLED status, so the batch stays in the set and
+    # the awaiting-quarantine queue is filtered on owner
+    sc.transferFrom(retailer, quarantine_vault, batch_ids[1], sender=retailer)
+    _assert_status_index_consistent(sc)
+    assert sc.statusBatchCount(sc.get_RECALLED_STATE()) == 2
+    recalled = sc.getBatchesByStatus(sc.get_RECALLED_STATE(), 0, 10)
+    assert [b.id for b in recalled if b.owner != quarantine_vault] == [batch_ids[4]]
+    assert sc.statusBatchCount(sc.get_CONSUMED_STATE()) == 1
@@ -0,0 +1,121 @@
+import pytest
+
+from scripts.multicall import Multicall
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+def test_multicall_matches_direct_calls(deployed_contract, farmer, inspector, logistics):
+    sc = deployed_contract
+    sc.mintBatches(["ipfs://a/meta.json", "ipfs://b/meta.json"], sender=farmer)
+    sc.approve(logistics, 2, sender=farmer)
+
+    calls = [
+        sc.hasRole.encode_input(sc.get_FARMER_ROLE(), farmer),
+        sc.hasRole.encode_input(sc.get_FARMER_ROLE(), inspector),
+        sc.balanceOf.encode_input(farmer),
+        sc.getApproved.encode_input(2),
+        sc.tokenURI.encode_input(1),
+    ]
+    results = sc.multicall(calls)
+
+    assert all(r.success for r in results)
+    assert int.from_bytes(results[0].returnData, "big") == 1
+    assert int.from_bytes(results[1].returnData, "big") == 0
+    assert int.from_bytes(results[2].returnData, "big") == 2
+    assert int.from_bytes(results[3].returnData, "big") == int(logistics.address, 16)
+    assert b"ipfs://a/meta.json" in results[4].returnData
+
+
+def test_one_batch_page_with_max_uri_fits(deployed_contract, farmer):
+    # getBatchesByIds in the frontend reads getBatchesInRange(id, 1) per id
+    sc = deployed_contract
+    uri = "ipfs://" + "x" * 249
+    sc.mintBatch(uri, sender=farmer)
+
+    calls = Multicall(sc)
+    calls.add("getBatchesInRange", 1, 1)
+    [page] = calls.execute()
+
+    assert page[0].uri == uri
+    assert page[0].owner == farmer.address
+
+
+def test_multicall_reports_failures_without_reverting(deployed_contract, farmer):
+    sc = deployed_contract
+    sc.mintBatch("ipfs://a/meta.json", sender=farmer)
+
+    results = sc.multicall([sc.ownerOf.encode_input(99), sc.ownerOf.encode_input(1)])
+
+    assert not results[0].success
+    assert b"Token does not exist" in results[0].returnData
+    assert results[1].success
+
+
+def test_helper_decodes_in_queue_order(deployed_contract, admin, farmer, retailer):
+    sc = deployed_contract
+    sc.mintBatch("ipfs://a/meta.json", sender=farmer)
+
+    calls = Multicall(sc)
+    calls.add("hasRole", sc.get_ADMIN_ROLE(), admin)
+    calls.add("balanceOf", farmer)
+    calls.add("ownerOf", 1)
+    calls.add("getApproved", 1)
+    calls.add("tokenURI", 1)
+    calls.add("getApproved", 42)
+    calls.add("getBatchStatus", 1)
+
+    assert calls.execute() == [
+        True,
+        1,
+        farmer.address,
+        ZERO_ADDRESS,
+        "ipfs://a/meta.json",
+        None,
+        sc.get_HARVESTED_STATE(),
+    ]
+    assert calls.round_trips == 1
+    assert len(calls) == 0
+
+
+def test_helper_chunks_by_max_multicall(deployed_contract, farmer):
+    sc = deployed_contract
+    sc.mintBatch("ipfs://a/meta.json", sender=farmer)
+    chunk = sc.get_MAX_MULTICALL()
+
+    calls = Multicall(sc)
+    for _ in range(chunk + 1):
+        calls.add("balanceOf", farmer)
+
+    assert calls.execute() == [1] * (chunk + 1)
+    assert calls.round_trips == 2
+
+
+def test_oversized_return_is_reported_as_failure(deployed_contract, farmer):
+    # Ten batches of BatchView are far over MAX_MULTICALL_RETURN
+    sc = deployed_contract
+    sc.mintBatches([f"ipfs://lot-{i}/meta.json" for i in range(10)], sender=farmer)
+
+    results = sc.multicall([sc.getBatchesInRange.encode_input(1, 10), sc.balanceOf.encode_input(farmer)])
+
+    assert not results[0].success
+    assert b"Return data too large" in results[0].returnData
+    assert results[1].success
+
+
+def test_helper_raises_on_oversized_return(deployed_contract, farmer):
+    sc = deployed_contract
+    sc.mintBatches([f"ipfs://lot-{i}/meta.json" for i in range(10)], sender=farmer)
+
+    calls = Multicall(sc)
+    calls.add("getBatchesInRange", 1, 10)
+
+    with pytest.raises(ValueError, match="getBatchesInRange"):
+        calls.execute()
+
+
+def test_helper_rejects_wrong_argument_count(deployed_contract):
+    calls = Multicall(deployed_contract)
+
+    with pytest.raises(ValueError, match="ownerOf takes no overload with 2 argument"):
+        calls.add("ownerOf", 1, 2)
@@ -0,0 +1,70 @@
+import pytest
+from ape.exceptions import ContractLogicError
+
+FARMER_BIT = 1
+INSPECTOR_BIT = 2
+LOGISTICS_BIT = 4
+RETAILER_BIT = 8
+
+
+def test_grant_roles_sets_every_assignment(deployed_contract, admin, accounts):
+    sc = deployed_contract
+    farmer_role, retailer_role = sc.get_FARMER_ROLE(), sc.get_RETAILER_ROLE()
+    custom_role = b"\x42" * 32
+
+    receipt = sc.grantRoles(
+        [
+            (farmer_role, accounts[6]),
+            (retailer_role, accounts[6]),
+            (farmer_role, accounts[7]),
+            (custom_role, accounts[8]),
+        ],
+        sender=admin,
+    )
+
+    assert sc.roleMask(accounts[6]) == FARMER_BIT | RETAILER_BIT
+    assert sc.roleMask(accounts[7]) == FARMER_BIT
+    assert sc.roleMask(accounts[8]) == 0
+    assert sc.hasRole(custom_role, accounts[8])
+    granted = [(log.role, log.account) for log in receipt.decode_logs(sc.RoleGranted)]
+    assert granted == [
+        (farmer_role, accounts[6].address),
+        (retailer_role, accounts[6].address),
+        (farmer_role, accounts[7].address),
+        (custom_role, accounts[8].address),
+    ]
+
+
+def test_revoke_roles_keeps_unlisted_roles(deployed_contract, admin, farmer, inspector):
+    sc = deployed_contract
+    sc.grantRoles([(sc.get_LOGISTICS_ROLE(), farmer), (sc.get_LOGISTICS_ROLE(), inspector)], sender=admin)
+
+    receipt = sc.revokeRoles([(sc.get_FARMER_ROLE(), farmer), (sc.get_LOGISTICS_ROLE(), inspector)], sender=admin)
+
+    assert sc.roleMask(farmer) == LOGISTICS_BIT
+    assert sc.roleMask(inspector) == INSPECTOR_BIT
+    assert not sc.hasRole(sc.get_FARMER_ROLE(), farmer)
+    assert len(receipt.decode_logs(sc.RoleRevoked)) == 2
+
+
+def test_role_batches_are_admin_only(deployed_contract, farmer, accounts):
+    sc = deployed_contract
+
+    with pytest.raises(ContractLogicError, match="Missing required role"):
+        sc.grantRoles([(sc.get_FARMER_ROLE(), accounts[7])], sender=farmer)
+    with pytest.raises(ContractLogicError, match="Missing required role"):
+        sc.revokeRoles([(sc.get_FARMER_ROLE(), farmer)], sender=farmer)
+    assert sc.roleMask(accounts[7]) == 0
+
+
+def test_role_batches_reject_empty_and_oversized_lists(deployed_contract, admin, accounts):
+    sc = deployed_contract
+    max_batch = sc.get_MAX_ROLE_BATCH()
+
+    with pytest.raises(ContractLogicError, match="No role assignments given"):
+        sc.grantRoles([], sender=admin)
+    with pytest.raises(ContractLogicError, match="No role assignments given"):
+        sc.revokeRoles([], sender=admin)
+    with pytest.raises(ContractLogicError):
+        sc.grantRoles([(sc.get_FARMER_ROLE(), accounts[7])] * (max_batch + 1), sender=admin)
+    assert sc.roleMask(accounts[7]) == 0
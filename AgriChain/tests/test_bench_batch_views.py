@@ -0,0 +1,42 @@
+import time
+
+import pytest
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("n_batches", [1_000, 10_000])
+def test_bench_range_view_vs_per_token_loop(deployed_contract, farmer, n_batches):
+    sc = deployed_contract
+    for i in range(n_batches):
+        sc.mintBatch(f"ipfs://cid-{i}/meta.json", sender=farmer)
+
+    # Current frontend pattern: ownerOf + getBatchStatus + tokenURI per token
+    start = time.perf_counter()
+    loop_calls = 0
+    loop_rows = []
+    for batch_id in range(1, n_batches + 1):
+        owner = sc.ownerOf(batch_id)
+        status = sc.getBatchStatus(batch_id)
+        uri = sc.tokenURI(batch_id)
+        loop_calls += 3
+        loop_rows.append((batch_id, owner, status, uri))
+    loop_time = time.perf_counter() - start
+
+    # Paginated view: one call per MAX_BATCH_PAGE batches
+    page_size = sc.get_MAX_BATCH_PAGE()
+    start = time.perf_counter()
+    range_calls = 0
+    range_rows = []
+    for first in range(1, n_batches + 1, page_size):
+        range_rows.extend((b.id, b.owner, b.status, b.uri) for b in sc.getBatchesInRange(first, page_size))
+        range_calls += 1
+    range_time = time.perf_counter() - start
+
+    print(
+        f"\n[{n_batches} batches] per-token: {loop_calls} calls, {loop_time:.2f}s | "
+        f"getBatchesInRange: {range_calls} calls, {range_time:.2f}s"
+    )
+
+    assert range_rows == loop_rows
+    assert range_calls * page_size * 3 >= loop_calls
+    assert range_calls < loop_calls
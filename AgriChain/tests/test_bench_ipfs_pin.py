@@ -0,0 +1,32 @@
+import time
+
+import pytest
+
+from scripts.ipfs_pin import OK, LocalPinBackend, audit_uris, build_metadata, pin_documents, prepare_documents
+
+
+@pytest.mark.benchmark
+def test_bench_pin_and_audit_10k(tmp_path):
+    n_docs = 10_000
+    metadata = [build_metadata(f"Lô #{i}", farm_name=f"Farm {i % 50}") for i in range(n_docs)]
+
+    start = time.perf_counter()
+    documents = prepare_documents(metadata)
+    build_time = time.perf_counter() - start
+
+    sequential = pin_documents(LocalPinBackend(tmp_path / "seq"), documents, workers=1)
+    backend = LocalPinBackend(tmp_path / "par")
+    parallel = pin_documents(backend, documents, workers=16)
+    assert len(parallel["pinned"]) == n_docs
+
+    uris = {i + 1: f"ipfs://{cid}" for i, (cid, _) in enumerate(documents)}
+    audit_seq = audit_uris(backend, uris, workers=1)
+    audit_par = audit_uris(backend, uris, workers=16)
+    assert set(audit_par["results"].values()) == {OK}
+
+    print(f"\n{n_docs} docs: build+CID {build_time:.2f}s ({n_docs / build_time:.0f}/s)")
+    for label, seq, par in (("pin", sequential, parallel), ("audit", audit_seq, audit_par)):
+        print(
+            f"{label}: 1 worker {seq['seconds']:.2f}s ({n_docs / seq['seconds']:.0f}/s), "
+            f"16 workers {par['seconds']:.2f}s ({n_docs / par['seconds']:.0f}/s)"
+        )
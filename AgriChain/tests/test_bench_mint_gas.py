@@ -0,0 +1,26 @@
+import pytest
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("n_lots", [1, 10, 50])
+def test_bulk_mint_gas_per_token(deployed_contract, farmer, n_lots):
+    sc = deployed_contract
+    uris = [f"ipfs://bafybeigdyrztharvest{i:04d}/meta.json" for i in range(n_lots)]
+
+    # Warm up so neither path pays the first zero -> non-zero counter/balance write
+    sc.mintBatch("ipfs://warmup/meta.json", sender=farmer)
+
+    single_gas = sum(sc.mintBatch(uri, sender=farmer).gas_used for uri in uris)
+    bulk_gas = sc.mintBatches(uris, sender=farmer).gas_used
+
+    single_per_token = single_gas / n_lots
+    bulk_per_token = bulk_gas / n_lots
+    print(
+        f"\n[N={n_lots}] mintBatch x{n_lots}: {single_per_token:,.0f} gas/token | "
+        f"mintBatches: {bulk_per_token:,.0f} gas/token "
+        f"({100 * (1 - bulk_per_token / single_per_token):.1f}% saved)"
+    )
+
+    assert sc.tokenCounter() == 2 * n_lots + 1
+    if n_lots > 1:
+        assert bulk_per_token < single_per_token
@@ -0,0 +1,54 @@
+import time
+
+import pytest
+
+from scripts.multicall import Multicall
+
+
+@pytest.mark.benchmark
+def test_bench_multicall_page_render(deployed_contract, admin, farmer, inspector, logistics, retailer):
+    sc = deployed_contract
+    n_batches = 500
+    mint_chunk = sc.get_MAX_MINT_BATCH()
+    for first in range(0, n_batches, mint_chunk):
+        sc.mintBatches([f"ipfs://cid-{i}/meta.json" for i in range(first, first + mint_chunk)], sender=farmer)
+
+    accounts_on_page = [admin, farmer, inspector, logistics, retailer]
+    role_ids = [sc.get_FARMER_ROLE(), sc.get_INSPECTOR_ROLE(), sc.get_LOGISTICS_ROLE(), sc.get_RETAILER_ROLE()]
+
+    # One eth_call per value: role badges, balances, then approval + URI per batch
+    start = time.perf_counter()
+    direct_calls = 0
+    direct = []
+    for account in accounts_on_page:
+        for role in role_ids:
+            direct.append(sc.hasRole(role, account))
+            direct_calls += 1
+        direct.append(sc.balanceOf(account))
+        direct_calls += 1
+    for batch_id in range(1, n_batches + 1):
+        direct.append(sc.getApproved(batch_id))
+        direct.append(sc.tokenURI(batch_id))
+        direct_calls += 2
+    direct_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    calls = Multicall(sc)
+    for account in accounts_on_page:
+        for role in role_ids:
+            calls.add("hasRole", role, account)
+        calls.add("balanceOf", account)
+    for batch_id in range(1, n_batches + 1):
+        calls.add("getApproved", batch_id)
+        calls.add("tokenURI", batch_id)
+    aggregated = calls.execute()
+    multicall_time = time.perf_counter() - start
+
+    print(
+        f"\n[{n_batches} batches] direct: {direct_calls} eth_calls, {direct_time:.2f}s | "
+        f"multicall: {calls.round_trips} eth_calls, {multicall_time:.2f}s "
+        f"({direct_calls - calls.round_trips} round trips saved)"
+    )
+
+    assert aggregated == direct
+    assert calls.round_trips == -(-direct_calls // sc.get_MAX_MULTICALL())
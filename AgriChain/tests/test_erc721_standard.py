@@ -95,5 +95,7 @@ def test_erc165_interface_support(deployed_contract):
     assert sc.supportsInterface(b"\x80\xac\x58\xcd") == True
     # ERC721Metadata
     assert sc.supportsInterface(b"\x5b\x5e\x13\x9f") == True
+    # ERC721Enumerable
+    assert sc.supportsInterface(b"\x78\x0e\x9d\x63") == True
     # random interface
     assert sc.supportsInterface(b"\xff\xff\xff\xff") == False
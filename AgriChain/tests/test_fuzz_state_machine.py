@@ -0,0 +1,372 @@
+"""Stateful fuzzing of the batch lifecycle against a pure-Python model.
+
+Hypothesis drives random mints, inspections, (bulk) transfers, retail steps,
+recalls and supply-chain role grants/revokes. Some accounts start with two
+roles (farmer + logistics, logistics + retailer), so self-transfers and role
+changes under held batches are reachable. Three in four draws pick the
+batch/actor/recipient the lifecycle expects so batches reach the late states;
+the rest pick anything. The model predicts whether each call must succeed;
+successful calls update the model, predicted failures must revert.
+
+Invariants are batched: every CHECK_EVERY steps and at the end of each
+example, owner/status of every batch (one getBatchesInRange page per 100
+batches) plus balances, status-index counts and roles (one multicall) are
+compared with the model. Every example starts from the same chain snapshot
+instead of a fresh deployment.
+
+The default profile runs ~500 steps; `ape test --hypothesis-profile=ci` runs
+~10k (profiles in conftest.py). Skipped when hypothesis is not installed.
+"""
+
+import pytest
+
+pytest.importorskip("hypothesis")
+
+from ape import chain
+from ape.exceptions import ContractLogicError
+from hypothesis import settings
+from hypothesis import strategies as st
+from hypothesis.stateful import RuleBasedStateMachine, initialize, invariant, rule, run_state_machine_as_test
+
+from scripts.multicall import Multicall
+
+HARVESTED, INSPECTING, IN_TRANSIT, DELIVERED, RETAILED, CONSUMED, RECALLED = range(1, 8)
+STATUSES = range(HARVESTED, RECALLED + 1)
+TRANSFERABLE = (INSPECTING, IN_TRANSIT, RECALLED, CONSUMED)
+RECALLABLE = (HARVESTED, INSPECTING, IN_TRANSIT, DELIVERED, RETAILED)
+
+SUPPLY_CHAIN_ROLES = ("farmer", "inspector", "logistics", "retailer")
+
+MAX_BULK = 3
+CHECK_EVERY = 5
+# Fixed gas for calls expected to succeed skips eth_estimateGas (a binary search in py-evm)
+GAS_LIMIT = 2_000_000
+
+
+class BatchLifecycleModel:
+    """Reference lifecycle: batch_id -> (owner, status) and address -> roles"""
+
+    def __init__(self, roles, quarantine_vault, archive_vault):
+        self.roles = {account: set(names) for account, names in roles.items()}
+        self.quarantine_vault = quarantine_vault
+        self.archive_vault = archive_vault
+        self.batches = {}
+
+    def has(self, account, role):
+        return role in self.roles.get(account, ())
+
+    def mint(self, sender, count):
+        if not self.has(sender, "farmer"):
+            return None
+        first = len(self.batches) + 1
+        ids = list(range(first, first + count))
+        for batch_id in ids:
+            self.batches[batch_id] = (sender, HARVESTED)
+        return ids
+
+    def inspect(self, sender, batch_id):
+        owner, status = self.batches[batch_id]
+        if not self.has(sender, "inspector") or status != HARVESTED or not self.has(owner, "farmer"):
+            return False
+        self.batches[batch_id] = (owner, INSPECTING)
+        return True
+
+    def transfer_result(self, sender, batch_id, to):
+        """New (owner, status) for a transfer, or None if it must revert"""
+        owner, status = self.batches[batch_id]
+        if sender != owner:
+            return None
+        if status == RECALLED:
+            return (to, status) if to == self.quarantine_vault else None
+        if status == CONSUMED:
+            return (to, status) if to == self.archive_vault else None
+        if status == INSPECTING and self.has(to, "logistics") and self.has(owner, "farmer"):
+            return to, IN_TRANSIT
+        if status == IN_TRANSIT and self.has(to, "retailer") and self.has(owner, "logistics"):
+            return to, DELIVERED
+        return None
+
+    def transfer(self, sender, batch_ids, to):
+        """All-or-nothing, like batchTransferFrom"""
+        results = [self.transfer_result(sender, batch_id, to) for batch_id in batch_ids]
+        if any(result is None for result in results):
+            return False
+        for batch_id, result in zip(batch_ids, results):
+            self.batches[batch_id] = result
+        return True
+
+    def advance(self, sender, batch_ids):
+        if not self.has(sender, "retailer"):
+            return False
+        updates = {}
+        for batch_id in batch_ids:
+            owner, status = updates.get(batch_id, self.batches[batch_id])
+            if owner != sender or status not in (DELIVERED, RETAILED):
+                return False
+            updates[batch_id] = (owner, RETAILED if status == DELIVERED else CONSUMED)
+        self.batches.update(updates)
+        return True
+
+    def set_role(self, sender, account, role, granted):
+        """grantRole / revokeRole: admin only, idempotent"""
+        if not self.has(sender, "admin"):
+            return False
+        names = self.roles.setdefault(account, set())
+        if granted:
+            names.add(role)
+        else:
+            names.discard(role)
+        return True
+
+    def recall(self, sender, batch_id):
+        owner, status = self.batches[batch_id]
+        if not self.has(sender, "admin") or status in (RECALLED, CONSUMED):
+            return False
+        self.batches[batch_id] = (owner, RECALLED)
+        return True
+
+    def next_hops(self, status):
+        """Recipients that move a batch in this status forward"""
+        if status == INSPECTING:
+            return [account for account in self.roles if self.has(account, "logistics")]
+        if status == IN_TRANSIT:
+            return [account for account in self.roles if self.has(account, "retailer")]
+        if status == RECALLED:
+            return [self.quarantine_vault]
+        if status == CONSUMED:
+            return [self.archive_vault]
+        return []
+
+    def balances(self, holders):
+        counts = dict.fromkeys(holders, 0)
+        for owner, _ in self.batches.values():
+            counts[owner] += 1
+        return counts
+
+
+class BatchLifecycleMachine(RuleBasedStateMachine):
+    # Injected by the test before the run
+    sc = None
+    actors = ()
+    roles = {}
+    role_ids = {}  # role name -> bytes32
+    vaults = ()
+    page_size = None
+    steps = 0
+
+    def __init__(self):
+        super().__init__()
+        self.snapshot = chain.snapshot()
+        self.model = BatchLifecycleModel(self.roles, *self.vaults)
+        self.holders = [actor.address for actor in self.actors] + list(self.vaults)
+        self.actor_by_address = {actor.address: actor for actor in self.actors}
+        self.unchecked_steps = 0
+
+    def teardown(self):
+        try:
+            self._check_chain()
+        finally:
+            chain.restore(self.snapshot)
+
+    def _send(self, expected_ok, method, *args, sender):
+        BatchLifecycleMachine.steps += 1
+        if expected_ok:
+            getattr(self.sc, method)(*args, sender=sender, gas=GAS_LIMIT)
+        else:
+            # No fixed gas here: the revert surfaces at estimation, nothing is mined
+            with pytest.raises(ContractLogicError):
+                getattr(self.sc, method)(*args, sender=sender)
+
+    def _expected(self, data):
+        return data.draw(st.integers(0, 3)) > 0
+
+    def _pick(self, data, expected, anyone):
+        """Mostly something the lifecycle expects, otherwise anything"""
+        pool = expected if expected and self._expected(data) else anyone
+        return data.draw(st.sampled_from(pool))
+
+    def _actor(self, data, role=None, address=None):
+        expected = [
+            actor for actor in self.actors
+            if (role and self.model.has(actor.address, role)) or actor.address == address
+        ]
+        return self._pick(data, expected, self.actors)
+
+    def _batch_pool(self, data, statuses):
+        movable = [batch_id for batch_id, (_, status) in self.model.batches.items() if status in statuses]
+        return movable if movable and self._expected(data) else list(self.model.batches)
+
+    def _batch(self, data, statuses):
+        return data.draw(st.sampled_from(self._batch_pool(data, statuses)))
+
+    def _recipient(self, data, batch_id):
+        return self._pick(data, self.model.next_hops(self.model.batches[batch_id][1]), self.holders)
+
+    # ---------- rules
+
+    @initialize(data=st.data(), count=st.integers(1, MAX_BULK))
+    def harvest(self, data, count):
+        farmers = [actor for actor in self.actors if self.model.has(actor.address, "farmer")]
+        sender = data.draw(st.sampled_from(farmers))
+        self.model.mint(sender.address, count)
+        self._send(True, "mintBatches", [f"ipfs://fuzz/{i}.json" for i in range(count)], sender=sender)
+
+    @rule(data=st.data())
+    def progress(self, data):
+        """Expected next lifecycle move for a batch, most advanced batches first"""
+        movable = [
+            (status, batch_id) for batch_id, (owner, status) in self.model.batches.items()
+            if status not in (RECALLED, CONSUMED) or owner in self.actor_by_address
+        ]
+        if not movable:
+            return
+        status, batch_id = data.draw(st.sampled_from(sorted(movable, reverse=True)))
+        owner = self.actor_by_address.get(self.model.batches[batch_id][0])
+
+        if status == HARVESTED:
+            inspector = self._actor(data, role="inspector")
+            self._send(self.model.inspect(inspector.address, batch_id), "markBatchInspected",
+                       batch_id, "ipfs://fuzz/inspected.json", sender=inspector)
+        elif status in (DELIVERED, RETAILED):
+            self._send(self.model.advance(owner.address, [batch_id]), "advanceBatchRetailStatus",
+                       batch_id, sender=owner)
+        else:
+            hops = self.model.next_hops(status)
+            if not hops:
+                return
+            to = data.draw(st.sampled_from(hops))
+            self._send(self.model.transfer(owner.address, [batch_id], to), "transferFrom",
+                       owner, to, batch_id, sender=owner)
+
+    @rule(data=st.data(), count=st.integers(1, MAX_BULK))
+    def mint(self, data, count):
+        sender = self._actor(data, role="farmer")
+        ids = self.model.mint(sender.address, count)
+        uris = [f"ipfs://fuzz/{i}.json" for i in range(count)]
+        self._send(ids is not None, "mintBatches", uris, sender=sender)
+
+    @rule(data=st.data())
+    def inspect(self, data):
+        batch_id = self._batch(data, (HARVESTED,))
+        sender = self._actor(data, role="inspector")
+        ok = self.model.inspect(sender.address, batch_id)
+        self._send(ok, "markBatchInspected", batch_id, "ipfs://fuzz/inspected.json", sender=sender)
+
+    @rule(data=st.data())
+    def transfer(self, data):
+        batch_id = self._batch(data, TRANSFERABLE)
+        owner = self.model.batches[batch_id][0]
+        sender = self._actor(data, address=owner)
+        to = self._recipient(data, batch_id)
+        ok = self.model.transfer(sender.address, [batch_id], to)
+        self._send(ok, "transferFrom", owner, to, batch_id, sender=sender)
+
+    @rule(data=st.data())
+    def bulk_transfer(self, data):
+        owner = self.model.batches[self._batch(data, TRANSFERABLE)][0]
+        sender = self._actor(data, address=owner)
+        owned = [batch_id for batch_id, (holder, _) in self.model.batches.items() if holder == owner]
+        batch_ids = data.draw(st.lists(st.sampled_from(owned), min_size=1, max_size=MAX_BULK, unique=True))
+        to = self._recipient(data, batch_ids[0])
+        ok = self.model.transfer(sender.address, batch_ids, to)
+        self._send(ok, "batchTransferFrom", owner, to, batch_ids, sender=sender)
+
+    @rule(data=st.data())
+    def advance(self, data):
+        pool = self._batch_pool(data, (DELIVERED, RETAILED))
+        batch_ids = data.draw(st.lists(st.sampled_from(pool), min_size=1, max_size=MAX_BULK, unique=True))
+        sender = self._actor(data, address=self.model.batches[batch_ids[0]][0])
+        ok = self.model.advance(sender.address, batch_ids)
+        if len(batch_ids) == 1:
+            self._send(ok, "advanceBatchRetailStatus", batch_ids[0], sender=sender)
+        else:
+            self._send(ok, "advanceBatchRetailStatusMany", batch_ids, sender=sender)
+
+    @rule(data=st.data())
+    def recall(self, data):
+        batch_id = self._batch(data, RECALLABLE)
+        sender = self._actor(data, role="admin")
+        ok = self.model.recall(sender.address, batch_id)
+        self._send(ok, "markBatchRecalled", batch_id, b"fuzz", sender=sender)
+
+    @rule(data=st.data(), role=st.sampled_from(SUPPLY_CHAIN_ROLES), granted=st.booleans())
+    def set_role(self, data, role, granted):
+        sender = self._actor(data, role="admin")
+        account = data.draw(st.sampled_from(self.actors))
+        ok = self.model.set_role(sender.address, account.address, role, granted)
+        method = "grantRole" if granted else "revokeRole"
+        self._send(ok, method, self.role_ids[role], account, sender=sender)
+
+    # ---------- invariants
+
+    def _check_chain(self):
+        model = self.model
+        chain_batches = {}
+        for start in range(1, len(model.batches) + 1, self.page_size):
+            for view in self.sc.getBatchesInRange(start, self.page_size):
+                chain_batches[view.id] = (view.owner, view.status)
+        assert chain_batches == model.batches
+
+        calls = Multicall(self.sc)
+        calls.add("tokenCounter")
+        for holder in self.holders:
+            calls.add("balanceOf", holder)
+        for status in STATUSES:
+            calls.add("statusBatchCount", status)
+        role_checks = [(actor.address, role) for actor in self.actors for role in SUPPLY_CHAIN_ROLES]
+        for account, role in role_checks:
+            calls.add("hasRole", self.role_ids[role], account)
+        token_counter, *rest = calls.execute()
+        balances, rest = rest[: len(self.holders)], rest[len(self.holders):]
+        status_counts, has_roles = rest[: len(STATUSES)], rest[len(STATUSES):]
+
+        assert token_counter == len(model.batches)
+        assert dict(zip(self.holders, balances)) == model.balances(self.holders)
+        expected_counts = [sum(1 for _, status in model.batches.values() if status == s) for s in STATUSES]
+        assert status_counts == expected_counts
+        assert has_roles == [model.has(account, role) for account, role in role_checks]
+
+    @invariant()
+    def chain_matches_model(self):
+        self.unchecked_steps += 1
+        if self.unchecked_steps >= CHECK_EVERY:
+            self.unchecked_steps = 0
+            self._check_chain()
+
+
+def test_batch_lifecycle_matches_model(
+    deployed_contract, accounts, admin, farmer, inspector, logistics, retailer, consumer, quarantine_vault, archive_vault
+):
+    sc = deployed_contract
+    farmer2, logistics2, retailer2 = accounts[6], accounts[7], accounts[8]
+    role_ids = {
+        "farmer": sc.get_FARMER_ROLE(),
+        "inspector": sc.get_INSPECTOR_ROLE(),
+        "logistics": sc.get_LOGISTICS_ROLE(),
+        "retailer": sc.get_RETAILER_ROLE(),
+    }
+    # farmer2 and logistics2 hold two roles each: they can ship to themselves
+    roles = {
+        admin.address: {"admin"},
+        farmer.address: {"farmer"},
+        farmer2.address: {"farmer", "logistics"},
+        inspector.address: {"inspector"},
+        logistics.address: {"logistics"},
+        logistics2.address: {"logistics", "retailer"},
+        retailer.address: {"retailer"},
+        retailer2.address: {"retailer"},
+    }
+    sc.grantRoles(
+        [(role_ids[role], account) for account in (farmer2, logistics2, retailer2) for role in roles[account.address]],
+        sender=admin,
+    )
+    BatchLifecycleMachine.sc = sc
+    BatchLifecycleMachine.actors = (admin, farmer, farmer2, inspector, logistics, logistics2, retailer, retailer2, consumer)
+    BatchLifecycleMachine.roles = roles
+    BatchLifecycleMachine.role_ids = role_ids
+    BatchLifecycleMachine.vaults = (quarantine_vault, archive_vault)
+    BatchLifecycleMachine.page_size = sc.get_MAX_BATCH_PAGE()
+    BatchLifecycleMachine.steps = 0
+
+    run_state_machine_as_test(BatchLifecycleMachine, settings=settings(deadline=None))
+    print(f"\n{BatchLifecycleMachine.steps} contract calls checked against the model")
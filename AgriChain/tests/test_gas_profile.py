@@ -0,0 +1,153 @@
+"""Gas profile of every state-machine transition.
+
+Transitions are measured in steady state: a warm-up round first takes batches
+down the same path, so the status sets and owner lists being written already
+hold (stale) slots, as they do on a live chain. Measured gas is compared
+against tests/gas_baseline.json; any entry that grows by more than
+--gas-threshold (default 5%) fails. Refresh the baseline after an intended
+change with:
+
+    ape test tests/test_gas_profile.py --update-gas-baseline
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+BASELINE_PATH = Path(__file__).parent / "gas_baseline.json"
+
+BULK_SIZE = 10
+
+
+def _load_baseline():
+    if not BASELINE_PATH.exists():
+        return {}
+    return json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+
+
+def _check_profile(request, profile):
+    baseline = _load_baseline()
+
+    if request.config.getoption("--update-gas-baseline"):
+        baseline.update(profile)
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        return
+
+    threshold = request.config.getoption("--gas-threshold")
+    regressions = []
+    for name, gas_used in profile.items():
+        expected = baseline.get(name)
+        if expected is None:
+            print(f"\n  {name}: {gas_used:,} gas (no baseline)")
+            continue
+
+        delta = (gas_used - expected) / expected
+        print(f"\n  {name}: {gas_used:,} gas ({delta:+.1%} vs {expected:,})")
+        if delta > threshold:
+            regressions.append(f"{name}: {expected:,} -> {gas_used:,} ({delta:+.1%})")
+
+    assert not regressions, f"Gas regressed more than {threshold:.0%}:\n" + "\n".join(regressions)
+
+
+def _warm_up(sc, deliver, retailer, archive_vault, n):
+    # Take n batches down the full path and archive them
+    batch_ids = deliver(n)
+    sc.advanceBatchRetailStatusMany(batch_ids, sender=retailer)
+    sc.advanceBatchRetailStatusMany(batch_ids, sender=retailer)
+    sc.batchTransferFrom(retailer, archive_vault, batch_ids, sender=retailer)
+
+
+def test_gas_happy_path(
+    request, deployed_contract, farmer, inspector, logistics, retailer, deliver, archive_vault
+):
+    sc = deployed_contract
+    profile = {}
+
+    _warm_up(sc, deliver, retailer, archive_vault, 1)
+
+    profile["mintBatch"] = sc.mintBatch("ipfs://QmHarvest/meta.json", sender=farmer).gas_used
+    batch_id = sc.tokenCounter()
+
+    profile["markBatchInspected"] = sc.markBatchInspected(
+        batch_id, "ipfs://QmHarvest/inspected.json", sender=inspector
+    ).gas_used
+    profile["transferFrom:INSPECTING->IN_TRANSIT"] = sc.transferFrom(
+        farmer, logistics, batch_id, sender=farmer
+    ).gas_used
+    profile["transferFrom:IN_TRANSIT->DELIVERED"] = sc.transferFrom(
+        logistics, retailer, batch_id, sender=logistics
+    ).gas_used
+    profile["advanceBatchRetailStatus:DELIVERED->RETAILED"] = sc.advanceBatchRetailStatus(
+        batch_id, sender=retailer
+    ).gas_used
+    profile["advanceBatchRetailStatus:RETAILED->CONSUMED"] = sc.advanceBatchRetailStatus(
+        batch_id, sender=retailer
+    ).gas_used
+    profile["transferFrom:CONSUMED->ARCHIVE"] = sc.transferFrom(
+        retailer, archive_vault, batch_id, sender=retailer
+    ).gas_used
+
+    _check_profile(request, profile)
+
+
+def test_gas_recall_path(
+    request, deployed_contract, admin, farmer, inspector, logistics, retailer, quarantine_vault
+):
+    sc = deployed_contract
+    profile = {}
+
+    sc.mintBatch("ipfs://QmRecall/meta.json", sender=farmer)
+    batch_id = sc.tokenCounter()
+    sc.markBatchInspected(batch_id, "ipfs://QmRecall/inspected.json", sender=inspector)
+    sc.transferFrom(farmer, logistics, batch_id, sender=farmer)
+    sc.transferFrom(logistics, retailer, batch_id, sender=logistics)
+
+    profile["markBatchRecalled"] = sc.markBatchRecalled(batch_id, b"qa", sender=admin).gas_used
+    profile["transferFrom:RECALLED->QUARANTINE"] = sc.transferFrom(
+        retailer, quarantine_vault, batch_id, sender=retailer
+    ).gas_used
+
+    _check_profile(request, profile)
+
+
+def test_gas_bulk_operations(
+    request, deployed_contract, farmer, inspector, logistics, retailer, deliver, archive_vault
+):
+    sc = deployed_contract
+    profile = {}
+    uris = [f"ipfs://QmBulk{i:02d}/meta.json" for i in range(BULK_SIZE)]
+
+    _warm_up(sc, deliver, retailer, archive_vault, BULK_SIZE)
+
+    profile[f"mintBatches[{BULK_SIZE}]"] = sc.mintBatches(uris, sender=farmer).gas_used
+    last = sc.tokenCounter()
+    batch_ids = list(range(last - BULK_SIZE + 1, last + 1))
+    for batch_id in batch_ids:
+        sc.markBatchInspected(batch_id, "ipfs://QmBulk/inspected.json", sender=inspector)
+
+    profile[f"batchTransferFrom[{BULK_SIZE}]:INSPECTING->IN_TRANSIT"] = sc.batchTransferFrom(
+        farmer, logistics, batch_ids, sender=farmer
+    ).gas_used
+    profile[f"batchTransferFrom[{BULK_SIZE}]:IN_TRANSIT->DELIVERED"] = sc.batchTransferFrom(
+        logistics, retailer, batch_ids, sender=logistics
+    ).gas_used
+    profile[f"advanceBatchRetailStatusMany[{BULK_SIZE}]:DELIVERED->RETAILED"] = (
+        sc.advanceBatchRetailStatusMany(batch_ids, sender=retailer).gas_used
+    )
+
+    _check_profile(request, profile)
+
+
+def test_gas_admin_operations(request, contract, admin, accounts):
+    sc = contract
+    profile = {}
+
+    profile["grantRole"] = sc.grantRole(sc.get_FARMER_ROLE(), accounts[6], sender=admin).gas_used
+    profile["revokeRole"] = sc.revokeRole(sc.get_FARMER_ROLE(), accounts[6], sender=admin).gas_used
+
+    roster = [(sc.get_FARMER_ROLE(), f"0x{0xfa0000 + i:040x}") for i in range(BULK_SIZE)]
+    profile[f"grantRoles[{BULK_SIZE}]"] = sc.grantRoles(roster, sender=admin).gas_used
+    profile[f"revokeRoles[{BULK_SIZE}]"] = sc.revokeRoles(roster, sender=admin).gas_used
+
+    _check_profile(request, profile)
@@ -0,0 +1,129 @@
+import sqlite3
+
+import pytest
+from ape import project
+
+from scripts.indexer import SCHEMA, BatchIndexer, BlockTimestampCache
+
+
+def _assert_matches_chain(indexer, sc):
+    for batch_id in range(1, sc.tokenCounter() + 1):
+        row = indexer.get_batch(batch_id)
+        assert row["owner"] == sc.ownerOf(batch_id).lower()
+        assert row["status"] == sc.getBatchStatus(batch_id)
+        assert row["uri"] == sc.tokenURI(batch_id)
+
+
+def test_indexer_materializes_state(
+    lifecycle_contract, harvested_batch, delivered_batch, recalled_batch, farmer, retailer, quarantine_vault, tmp_path
+):
+    sc = lifecycle_contract
+    sc.transferFrom(retailer, quarantine_vault, recalled_batch, sender=retailer)
+
+    with BatchIndexer(sc, tmp_path / "index.db") as indexer:
+        indexer.sync()
+        _assert_matches_chain(indexer, sc)
+
+        assert indexer.get_batch(harvested_batch)["farmer"] == farmer.address.lower()
+        assert indexer.batches_by_owner(retailer) == [delivered_batch]
+        assert indexer.batches_by_status(sc.get_RECALLED_STATE()) == [recalled_batch]
+
+        events = [entry["event"] for entry in indexer.timeline(delivered_batch)]
+        assert events == [
+            "URI", "StatusUpdated", "BatchMinted", "Transfer",
+            "StatusUpdated", "BatchInspected", "URI",
+            "StatusUpdated", "Transfer",
+            "StatusUpdated", "Transfer",
+        ]
+        assert "BatchRecalled" in [entry["event"] for entry in indexer.timeline(recalled_batch)]
+
+
+def test_indexer_resumes_from_checkpoint(deployed_contract, retailer, tmp_path, deliver):
+    sc = deployed_contract
+    db_path = tmp_path / "index.db"
+    [batch_id] = deliver(1)
+
+    with BatchIndexer(sc, db_path) as indexer:
+        first = indexer.sync()
+        checkpoint = indexer.last_block
+        assert first > 0
+        assert indexer.sync() == 0
+
+    sc.advanceBatchRetailStatus(batch_id, sender=retailer)
+
+    with BatchIndexer(sc, db_path) as indexer:
+        assert indexer.last_block == checkpoint
+        assert indexer.sync() == 1
+        assert indexer.last_block > checkpoint
+        _assert_matches_chain(indexer, sc)
+        assert len(indexer.timeline(batch_id)) == 12
+
+
+def test_indexer_small_pages_match_single_pass(deployed_contract, tmp_path, deliver):
+    sc = deployed_contract
+    deliver(3)
+
+    with BatchIndexer(sc, tmp_path / "paged.db", page_size=2) as indexer:
+        indexer.sync()
+        _assert_matches_chain(indexer, sc)
+
+
+def test_indexer_rejects_other_contract(deployed_contract, admin, tmp_path):
+    db_path = tmp_path / "index.db"
+    with BatchIndexer(deployed_contract, db_path) as indexer:
+        indexer.sync()
+
+    other = admin.deploy(project.AgriChain)
+    with pytest.raises(ValueError, match="already indexes"):
+        BatchIndexer(other, db_path)
+
+
+def test_block_timestamps_fetched_once_per_block(deployed_contract, farmer, tmp_path):
+    sc = deployed_contract
+    # 5 txs x 50 lots x 4 logs (URI, StatusUpdated, BatchMinted, Transfer) = 1,000 logs
+    for tx in range(5):
+        sc.mintBatches([f"ipfs://lot-{tx}-{i}/meta.json" for i in range(50)], sender=farmer)
+
+    db_path = tmp_path / "index.db"
+    with BatchIndexer(sc, db_path) as indexer:
+        processed = indexer.sync()
+        fetches = indexer.timestamps.fetches
+        blocks = {entry["block"] for entry in indexer.timeline(1) + indexer.timeline(250)}
+        print(f"\n[{processed} logs] getBlock calls: {fetches} (per-log: {processed}, saved {processed - fetches})")
+
+        assert processed == 1_000
+        assert fetches == 5
+        for block in blocks:
+            assert indexer.timestamps.get(block) == sc.provider.get_block(block).timestamp
+
+    # Persisted: a new session answers from SQLite without any RPC call
+    with BatchIndexer(sc, db_path) as indexer:
+        for block in blocks:
+            indexer.timestamps.get(block)
+        assert indexer.timestamps.fetches == 0
+
+
+def test_block_timestamp_lru_is_bounded(tmp_path):
+    conn = sqlite3.connect(tmp_path / "ts.db")
+    conn.executescript(SCHEMA)
+    cache = BlockTimestampCache(conn, max_size=3, fetch=lambda number: 1_000 + number)
+
+    cache.prefetch([1, 2, 2, 3, 4, 5])
+    assert cache.fetches == 5
+    assert len(cache._lru) == 3
+
+    # Evicted entries come back from SQLite, not the fetcher
+    assert cache.get(1) == 1_001
+    assert cache.fetches == 5
+
+
+def test_prefetch_wider_than_lru_reads_persisted_rows(tmp_path):
+    conn = sqlite3.connect(tmp_path / "ts.db")
+    conn.executescript(SCHEMA)
+    BlockTimestampCache(conn, fetch=lambda number: 1_000 + number).prefetch(range(1, 11))
+
+    # A fresh cache (new process) over the same rows, with a page of 10 > max_size
+    cache = BlockTimestampCache(conn, max_size=3, fetch=lambda number: 1_000 + number)
+    cache.prefetch(range(1, 11))
+    assert cache.fetches == 0
+    assert len(cache._lru) == 3
@@ -0,0 +1,85 @@
+import hashlib
+
+import pytest
+
+from scripts.ipfs_pin import (
+    MISMATCHED,
+    OK,
+    UNRESOLVABLE,
+    UNVERIFIED,
+    LocalPinBackend,
+    audit_token_uris,
+    audit_uris,
+    build_metadata,
+    compute_cid,
+    encode_metadata,
+    pin_documents,
+    prepare_documents,
+    raw_cid_digest,
+)
+
+
+def test_compute_cid_matches_ipfs_raw_leaf():
+    # `ipfs add --cid-version 1 --raw-leaves` of b"hello world"
+    assert compute_cid(b"hello world") == "bafkreifzjut3te2nhyekklss27nh3k72ysco7y32koao5eei66wof36n5e"
+    assert raw_cid_digest(compute_cid(b"hello world")) == hashlib.sha256(b"hello world").digest()
+    assert raw_cid_digest("QmYwAPJzv5CZsnA625s3Xf2nemtYgPpHdWEz79ojWnPbdG") is None
+
+
+def test_metadata_encoding_matches_json_stringify():
+    metadata = build_metadata("Lô A", farm_name="Nông trại", timestamp="2025-01-01T00:00:00.000+00:00")
+    assert encode_metadata(metadata).decode() == (
+        '{"name":"Lô A","productType":"other","harvestDate":null,"farmName":"Nông trại",'
+        '"address":"Chưa xác định","description":"","timestamp":"2025-01-01T00:00:00.000Z",'
+        '"createdBy":"Unknown"}'
+    )
+
+
+def test_pin_is_idempotent(tmp_path):
+    backend = LocalPinBackend(tmp_path)
+    documents = prepare_documents([build_metadata(f"Lô {i}") for i in range(20)])
+
+    first = pin_documents(backend, documents, workers=4)
+    second = pin_documents(backend, documents, workers=4)
+    assert len(first["pinned"]) == len(second["pinned"]) == 20
+    assert first["failed"] == second["failed"] == []
+    cid, data = documents[0]
+    assert backend.fetch(cid) == data
+
+
+def test_audit_reports_broken_token_uris(deployed_contract, farmer, tmp_path):
+    sc = deployed_contract
+    backend = LocalPinBackend(tmp_path)
+    documents = prepare_documents([build_metadata(f"Lô {i}") for i in range(5)])
+    pin_documents(backend, documents)
+
+    (missing_cid, _), (tampered_cid, _) = documents[3], documents[4]
+    (tmp_path / missing_cid).unlink()
+    (tmp_path / tampered_cid).write_bytes(b'{"name":"forged"}')
+
+    uris = [f"ipfs://{cid}" for cid, _ in documents] + ["ipfs://legacy/meta.json"]
+    sc.mintBatches(uris, sender=farmer)
+    (tmp_path / "legacy").mkdir()
+    (tmp_path / "legacy" / "meta.json").write_bytes(b"{}")
+
+    report = audit_token_uris(sc, backend, workers=4)
+    assert report["results"] == {
+        1: OK, 2: OK, 3: OK,
+        4: UNRESOLVABLE,
+        5: MISMATCHED,
+        6: UNVERIFIED,
+    }
+
+
+def test_fetch_stays_inside_the_store(tmp_path):
+    store = tmp_path / "store"
+    backend = LocalPinBackend(store)
+    (tmp_path / "secret").write_bytes(b"outside")
+
+    with pytest.raises(ValueError, match="escapes the pin store"):
+        backend.fetch("../secret")
+    with pytest.raises(ValueError, match="escapes the pin store"):
+        backend.fetch(str(tmp_path / "secret"))
+
+    report = audit_uris(backend, {1: "ipfs://../secret", 2: "ipfs://../../etc/passwd"})
+    assert report["results"] == {1: UNRESOLVABLE, 2: UNRESOLVABLE}
@@ -0,0 +1,42 @@
+import pytest
+
+from scripts.loadgen import (
+    ARCHIVE_VAULT,
+    QUARANTINE_VAULT,
+    LoadGenerator,
+    parse_mix,
+    percentile,
+    setup_crews,
+)
+
+CONSUMED = 6
+RECALLED = 7
+
+
+def test_parse_mix_and_percentile():
+    assert parse_mix("retail=6, archive=3,recall") == {"retail": 6.0, "archive": 3.0, "recall": 1.0}
+    with pytest.raises(ValueError):
+        parse_mix("burn=1")
+    assert percentile([5, 1, 4, 2, 3], 50) == 3
+    assert percentile([5, 1, 4, 2, 3], 99) == 5
+    assert percentile([], 50) is None
+
+
+def test_every_lifecycle_kind_completes(contract, admin):
+    generator = LoadGenerator(contract, admin, setup_crews(contract, admin, 2), seed=7, serialize=True)
+    report = generator.run(6, {"retail": 1, "archive": 1, "recall": 1})
+
+    assert report["completed"] == report["lifecycles"] == 6
+    assert report["failed"] == 0
+    assert report["transactions"] == sum(record["txs"] for record in generator.lifecycles)
+    assert set(report["gas_per_lifecycle"]) <= {"retail", "archive", "recall"}
+
+    for record in generator.lifecycles:
+        batch_id = record["batch_id"]
+        if record["kind"] == "recall":
+            assert contract.ownerOf(batch_id) == QUARANTINE_VAULT
+            assert contract.getBatchStatus(batch_id) == RECALLED
+        else:
+            assert contract.getBatchStatus(batch_id) == CONSUMED
+            if record["kind"] == "archive":
+                assert contract.ownerOf(batch_id) == ARCHIVE_VAULT
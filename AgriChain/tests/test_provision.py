@@ -0,0 +1,74 @@
+import pytest
+
+from scripts.provision import load_manifest, plan_changes, provision
+
+FARMER_BIT = 1
+INSPECTOR_BIT = 2
+LOGISTICS_BIT = 4
+RETAILER_BIT = 8
+ADMIN_BIT = 16
+
+
+def _address(i):
+    return f"0x{0xc0000000 + i:040x}"
+
+
+def test_csv_and_yaml_manifests_agree(tmp_path):
+    first, second = _address(1), _address(2)
+    (tmp_path / "roles.csv").write_text(
+        f"address,roles\n{first},farmer\n{second},LOGISTICS;RETAILER_ROLE\n{first},\n"
+    )
+    (tmp_path / "roles.yaml").write_text(
+        f"accounts:\n  - address: '{first}'\n    roles: [FARMER]\n"
+        f"  - address: '{second}'\n    roles: [LOGISTICS, RETAILER]\n"
+    )
+
+    expected = {
+        first: {"FARMER"},
+        second: {"LOGISTICS", "RETAILER"},
+    }
+    assert {address.lower(): roles for address, roles in load_manifest(tmp_path / "roles.csv").items()} == expected
+    assert {address.lower(): roles for address, roles in load_manifest(tmp_path / "roles.yaml").items()} == expected
+
+    (tmp_path / "bad.csv").write_text(f"address,roles\n{first},ADMIN\n")
+    with pytest.raises(ValueError, match="Unknown role"):
+        load_manifest(tmp_path / "bad.csv")
+
+
+def test_plan_only_touches_managed_bits():
+    grants, revokes = plan_changes(
+        {"a": {"FARMER"}, "b": set(), "c": {"RETAILER"}},
+        {"a": FARMER_BIT | ADMIN_BIT, "b": INSPECTOR_BIT | ADMIN_BIT, "c": LOGISTICS_BIT},
+    )
+    assert grants == [("RETAILER", "c")]
+    assert revokes == [("INSPECTOR", "b"), ("LOGISTICS", "c")]
+
+
+def test_provision_is_idempotent(deployed_contract, admin, farmer, inspector):
+    sc = deployed_contract
+    desired = {_address(i): {"FARMER", "INSPECTOR"} if i % 2 else {"RETAILER"} for i in range(5)}
+    desired[farmer.address] = {"FARMER", "LOGISTICS"}
+    desired[inspector.address] = set()
+    desired[admin.address] = {"RETAILER"}
+
+    dry = provision(sc, admin, desired, dry_run=True)
+    assert dry["transactions"] == 0
+    assert sc.roleMask(_address(1)) == 0
+
+    # chunk_size=2 spreads 10 changes over several pipelined transactions
+    report = provision(sc, admin, desired, chunk_size=2)
+    assert len(report["grants"]) == 9
+    assert report["revokes"] == [("INSPECTOR", inspector.address)]
+    assert report["transactions"] == 6
+    assert report["failed"] == 0
+    assert report["grants"] == dry["grants"]
+
+    assert sc.roleMask(_address(1)) == FARMER_BIT | INSPECTOR_BIT
+    assert sc.roleMask(_address(2)) == RETAILER_BIT
+    assert sc.roleMask(farmer) == FARMER_BIT | LOGISTICS_BIT
+    assert sc.roleMask(inspector) == 0
+    assert sc.roleMask(admin) == ADMIN_BIT | RETAILER_BIT
+
+    again = provision(sc, admin, desired)
+    assert again["grants"] == again["revokes"] == []
+    assert again["transactions"] == 0
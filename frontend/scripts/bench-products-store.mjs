@@ -0,0 +1,209 @@
+/**
+ * Micro-benchmark: products store lookups, timeline dedup and filtered views
+ *
+ * Replays the store's hot path (getById per log + addEvent) for N products and
+ * E timeline logs, first as a cold load and then as a full replay (every log a
+ * duplicate, as after reloadProductEvents), then every holder's status-filtered
+ * views as useProductFilters computes them. "legacy" is the previous
+ * array.find / fuzzy-scan / products.filter store; "indexed" is Map lookups,
+ * the status and holder indexes and productIndex.js.
+ * Vue reactivity is not involved: both variants run on plain objects.
+ *
+ * Usage:
+ *   node scripts/bench-products-store.mjs [--products 10000] [--events 100000] [--skip-legacy]
+ */
+
+import {
+  createEventDedup,
+  indexAdd,
+  selectIds,
+} from "../src/stores/productIndex.js";
+
+const args = process.argv.slice(2);
+function option(name, fallback) {
+  const i = args.indexOf(`--${name}`);
+  return i === -1 ? fallback : Number(args[i + 1]);
+}
+const PRODUCTS = option("products", 10000);
+const EVENTS = option("events", 100000);
+const SKIP_LEGACY = args.includes("--skip-legacy");
+const HOLDERS = 50;
+const VIEW_STATUSES = [
+  "HARVESTED",
+  "INSPECTING",
+  "IN_TRANSIT",
+  "DELIVERED",
+  "RETAILED",
+  "RECALLED",
+];
+
+function holderAddress(batchId) {
+  return `0x${(batchId % HOLDERS).toString(16).padStart(40, "0")}`;
+}
+
+const STEPS = [
+  ["REGISTERED", null, "HARVESTED"],
+  ["ATTESTED", "HARVESTED", "INSPECTING"],
+  ["TRANSFER", "INSPECTING", "IN_TRANSIT"],
+  ["TRANSFER", "IN_TRANSIT", "DELIVERED"],
+  ["STATUS_UPDATED", "DELIVERED", "RETAILED"],
+  ["STATUS_UPDATED", "RETAILED", "CONSUMED"],
+];
+
+// Timeline entries as useProductSync builds them, in chain order
+function makeEntries() {
+  const entries = [];
+  const start = Date.UTC(2025, 0, 1) / 1000;
+  for (let i = 0; i < EVENTS; i++) {
+    const batchId = (i % PRODUCTS) + 1;
+    const [type, statusFrom, statusTo] =
+      STEPS[Math.floor(i / PRODUCTS) % STEPS.length];
+    const block = Math.floor(i / 4);
+    entries.push({
+      batchId,
+      entry: {
+        timestamp: new Date((start + block * 12) * 1000).toISOString(),
+        txHash: `0x${block.toString(16).padStart(64, "0")}`,
+        logIndex: i % 4,
+        blockNumber: block,
+        type,
+        actor: holderAddress(batchId),
+        statusFrom: statusFrom ?? undefined,
+        statusTo,
+      },
+    });
+  }
+  return entries;
+}
+
+function makeProducts() {
+  const products = [];
+  for (let id = 1; id <= PRODUCTS; id++) {
+    products.push({
+      id,
+      name: `Lô #${id}`,
+      status: VIEW_STATUSES[id % VIEW_STATUSES.length],
+      // Mixed case, as MetaMask reports accounts
+      currentHolderAddress: holderAddress(id).replace(/a/g, "A"),
+      events: [],
+    });
+  }
+  return products;
+}
+
+// Previous store: linear getById, fuzzy scan of the product's events
+function legacyStore(products) {
+  const getById = (id) => products.find((p) => p.id === id);
+  return {
+    getById,
+    filter: (holder, status) =>
+      products.filter(
+        (p) =>
+          p.currentHolderAddress?.toLowerCase() === holder.toLowerCase() &&
+          p.status === status
+      ),
+    addEvent(id, event) {
+      const product = getById(id);
+      if (!product) return null;
+      const eventTimestamp = new Date(event.timestamp).getTime();
+      const isDuplicate = product.events.some((existingEvent) => {
+        const isSameType =
+          existingEvent.type === event.type ||
+          (["REGISTERED", "REGISTERED_ONCHAIN"].includes(existingEvent.type) &&
+            ["REGISTERED", "REGISTERED_ONCHAIN"].includes(event.type));
+        if (!isSameType) return false;
+        if (existingEvent.actor !== event.actor) return false;
+        const existingTimestamp = new Date(existingEvent.timestamp).getTime();
+        if (Math.abs(existingTimestamp - eventTimestamp) > 10000) return false;
+        if (["STATUS_UPDATED", "TRANSFER", "ATTESTED"].includes(event.type)) {
+          if (existingEvent.statusFrom !== event.statusFrom) return false;
+          if (existingEvent.statusTo !== event.statusTo) return false;
+        }
+        return true;
+      });
+      if (isDuplicate) return null;
+      product.events.push(event);
+      return event;
+    },
+  };
+}
+
+function indexedStore(products) {
+  const productsById = new Map(products.map((p) => [p.id, p]));
+  const idsByStatus = new Map();
+  const idsByHolder = new Map();
+  for (const p of products) {
+    indexAdd(idsByStatus, p.status, p.id);
+    indexAdd(idsByHolder, p.currentHolderAddress.toLowerCase(), p.id);
+  }
+  const dedup = createEventDedup();
+  const getById = (id) => productsById.get(id);
+  return {
+    getById,
+    filter: (holder, status) =>
+      selectIds(idsByHolder, idsByStatus, { holder, statuses: [status] }).map(
+        getById
+      ),
+    addEvent(id, event) {
+      const product = getById(id);
+      if (!product) return null;
+      if (!dedup.claim(product, event)) return null;
+      product.events.push(event);
+      return event;
+    },
+  };
+}
+
+function time(fn) {
+  const start = performance.now();
+  const result = fn();
+  return { ms: performance.now() - start, result };
+}
+
+function run(name, createStore, entries) {
+  const products = makeProducts();
+  const store = createStore(products);
+  const apply = () => {
+    let added = 0;
+    for (const { batchId, entry } of entries) {
+      if (store.getById(batchId) && store.addEvent(batchId, entry)) added++;
+    }
+    return added;
+  };
+
+  const load = time(apply);
+  const replay = time(apply);
+  const lookups = time(() => {
+    let found = 0;
+    for (let i = 0; i < EVENTS; i++) if (store.getById((i % PRODUCTS) + 1)) found++;
+    return found;
+  });
+
+  // Every holder opens every status view once
+  const filters = time(() => {
+    let rows = 0;
+    for (let h = 0; h < HOLDERS; h++) {
+      for (const status of VIEW_STATUSES) {
+        rows += store.filter(holderAddress(h), status).length;
+      }
+    }
+    return rows;
+  });
+
+  return {
+    name,
+    "load ms": Math.round(load.ms),
+    added: load.result,
+    "replay ms": Math.round(replay.ms),
+    "replay added": replay.result,
+    [`${EVENTS} getById ms`]: Math.round(lookups.ms),
+    [`${HOLDERS * VIEW_STATUSES.length} filters ms`]: Math.round(filters.ms),
+    "filter rows": filters.result,
+  };
+}
+
+const entries = makeEntries();
+console.log(`Products: ${PRODUCTS}, timeline events: ${EVENTS}`);
+const rows = [run("indexed", indexedStore, entries)];
+if (!SKIP_LEGACY) rows.unshift(run("legacy", legacyStore, entries));
+console.table(rows);
@@ -0,0 +1,96 @@
+/**
+ * Micro-benchmark: paged + windowed role tables as the batch count grows
+ *
+ * For each dataset size, replays what a RoleProductTable does on mount (first
+ * keyset page from the status index, height index, visible range) and while
+ * the user scrolls to the bottom (page loads, row measurements, range per
+ * scroll frame). "rows" is the number of <tr> the table renders; the previous
+ * table rendered every product. Vue and the DOM are not involved.
+ *
+ * Usage:
+ *   node scripts/bench-virtual-list.mjs [--sizes 100,1000,10000,50000] [--viewport 480]
+ */
+
+import { indexAdd, pageIds, selectIds } from "../src/stores/productIndex.js";
+import { createHeightIndex, visibleRange } from "../src/utils/virtualList.js";
+
+const args = process.argv.slice(2);
+function option(name, fallback) {
+  const i = args.indexOf(`--${name}`);
+  return i === -1 ? fallback : args[i + 1];
+}
+const SIZES = option("sizes", "100,1000,10000,50000").split(",").map(Number);
+const VIEWPORT = Number(option("viewport", 480));
+const PAGE_SIZE = 50;
+const ROW_ESTIMATE = 41;
+const OVERSCAN = 6;
+const STATUSES = ["HARVESTED", "INSPECTING", "DELIVERED", "RECALLED"];
+
+function time(fn) {
+  const start = performance.now();
+  const result = fn();
+  return { ms: performance.now() - start, result };
+}
+
+function run(size) {
+  const idsByStatus = new Map();
+  const idsByHolder = new Map();
+  for (let id = 1; id <= size; id++) {
+    indexAdd(idsByStatus, STATUSES[id % STATUSES.length], id);
+    indexAdd(idsByHolder, "0xretailer", id);
+  }
+  const filter = { holder: "0xRetailer", statuses: ["DELIVERED"] };
+  const matching = selectIds(idsByHolder, idsByStatus, filter).length;
+
+  // Mount: first page, heights, visible rows
+  const mount = time(() => {
+    const page = pageIds(selectIds(idsByHolder, idsByStatus, filter), {
+      limit: PAGE_SIZE,
+    });
+    const heights = createHeightIndex(ROW_ESTIMATE);
+    heights.resize(page.ids.length);
+    const range = visibleRange(heights, 0, VIEWPORT, OVERSCAN);
+    return { page, heights, rows: range.end - range.start };
+  });
+
+  // Scroll to the bottom one viewport per frame, loading pages at the tail
+  const scroll = time(() => {
+    let { page, heights } = mount.result;
+    let loaded = page.ids.length;
+    let cursor = page.nextCursor;
+    let maxRows = 0;
+    let frames = 0;
+    for (let top = 0; ; top += VIEWPORT) {
+      const range = visibleRange(heights, top, VIEWPORT, OVERSCAN);
+      for (let i = range.start; i < range.end; i++) {
+        heights.set(i, ROW_ESTIMATE + (i % 3) * 8); // rendered rows measured
+      }
+      maxRows = Math.max(maxRows, range.end - range.start);
+      frames++;
+      if (range.end < loaded) continue;
+      if (cursor === null) break;
+      const ids = selectIds(idsByHolder, idsByStatus, filter);
+      page = pageIds(ids, { after: cursor, limit: PAGE_SIZE });
+      cursor = page.nextCursor;
+      loaded += page.ids.length;
+      heights.resize(loaded);
+    }
+    return { maxRows, frames, loaded };
+  });
+
+  return {
+    batches: size,
+    matching,
+    "mount ms": Number(mount.ms.toFixed(2)),
+    "mount rows": mount.result.rows,
+    "old rows": matching,
+    "scroll frames": scroll.result.frames,
+    "max rows": scroll.result.maxRows,
+    "scroll ms/frame": Number((scroll.ms / scroll.result.frames).toFixed(3)),
+  };
+}
+
+console.log(
+  `Viewport ${VIEWPORT}px, rows ~${ROW_ESTIMATE}px, pages of ${PAGE_SIZE}`
+);
+console.table(SIZES.map(run));
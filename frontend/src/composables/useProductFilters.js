@@ -1,10 +1,15 @@
 import { computed } from "vue";
 import { useProductsStore } from "../stores/useProductsStore";
 import { useSessionStore } from "../stores/useSessionStore";
+import { useProductPages } from "./useProductPages";
 
 /**
  * Composable for filtering products by role and status
  * Reduces duplication across FarmerView, LogisticsView, RetailerView
+ *
+ * Reads the store's holder/status indexes (productsWhere), so each computed
+ * re-runs only when its own index entries change and costs O(matching rows).
+ * The per-status lists are useProductPages() pagers for RoleProductTable
  */
 export function useProductFilters() {
   const productsStore = useProductsStore();
@@ -18,57 +23,37 @@ export function useProductFilters() {
   const myProducts = computed(() => {
     if (!currentAccount.value) return [];
 
-    return productsStore.products.filter(
-      (p) =>
-        p.currentHolderAddress?.toLowerCase() ===
-        currentAccount.value.toLowerCase()
-    );
+    return productsStore.productsWhere({ holder: currentAccount.value });
   });
 
   /**
-   * Filter products by status (owned by current account)
+   * Pager over products in status (owned by current account)
    */
   function filterByStatus(status) {
-    return computed(() => {
-      if (!currentAccount.value) return [];
-
-      return productsStore.products.filter(
-        (p) =>
-          p.currentHolderAddress?.toLowerCase() ===
-            currentAccount.value.toLowerCase() && p.status === status
-      );
-    });
+    return filterByStatuses([status]);
   }
 
   /**
-   * Filter products by multiple statuses
+   * Pager over products in any of statuses (owned by current account)
    */
   function filterByStatuses(statuses) {
-    return computed(() => {
-      if (!currentAccount.value) return [];
-
-      return productsStore.products.filter(
-        (p) =>
-          p.currentHolderAddress?.toLowerCase() ===
-            currentAccount.value.toLowerCase() && statuses.includes(p.status)
-      );
-    });
+    return useProductPages(() =>
+      currentAccount.value ? { holder: currentAccount.value, statuses } : null
+    );
   }
 
   /**
-   * Filter RECALLED products not yet in quarantine
+   * Pager over RECALLED products not yet in quarantine
    */
-  const recalledProductsToQuarantine = computed(() => {
-    if (!currentAccount.value) return [];
-
-    return productsStore.products.filter(
-      (p) =>
-        p.currentHolderAddress?.toLowerCase() ===
-          currentAccount.value.toLowerCase() &&
-        p.status === "RECALLED" &&
-        p.currentHolderRole !== "QUARANTINE"
-    );
-  });
+  const recalledProductsToQuarantine = useProductPages(() =>
+    currentAccount.value
+      ? {
+          holder: currentAccount.value,
+          statuses: ["RECALLED"],
+          where: (p) => p.currentHolderRole !== "QUARANTINE",
+        }
+      : null
+  );
 
   return {
     currentAccount,
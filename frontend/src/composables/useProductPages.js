@@ -0,0 +1,84 @@
+import { computed, reactive, ref, toValue, watch } from "vue";
+import { useProductsStore } from "../stores/useProductsStore";
+
+/**
+ * Composable for paging a filtered product list out of the store
+ * Pages come from the store's keyset cursor API (productsPage): the list
+ * holds every matching product up to the last loaded id, and loadMore pulls
+ * the next `pageSize` after it. RoleProductTable calls loadMore as its
+ * virtual window reaches the end, so a view mounts with one page whatever
+ * the number of batches
+ *
+ * Products that start or stop matching (status/holder changes) appear or
+ * disappear in place; the cursor is an id, so nothing else shifts
+ *
+ * @param {Function|Ref} filter - { holder?, statuses?, where? } or null (empty)
+ * @param {object} options
+ * @param {number} options.pageSize - Products per page
+ * @returns {object} Reactive { items, total, hasMore, loadMore, reset }
+ */
+export function useProductPages(filter, { pageSize = 50 } = {}) {
+  const productsStore = useProductsStore();
+
+  // Last loaded id; null while only the first page is shown
+  const loadedThrough = ref(null);
+
+  const ids = computed(() => {
+    const current = toValue(filter);
+    return current ? productsStore.idsWhere(current) : [];
+  });
+
+  // Until loadMore runs, the first page is whatever currently matches
+  const through = computed(() => {
+    if (loadedThrough.value !== null) return loadedThrough.value;
+    const firstPage = Math.min(pageSize, ids.value.length);
+    return firstPage > 0 ? ids.value[firstPage - 1] : 0;
+  });
+
+  const items = computed(() => {
+    const cursor = through.value;
+    const end = ids.value.findIndex((id) => id > cursor);
+    return ids.value
+      .slice(0, end === -1 ? ids.value.length : end)
+      .map((id) => productsStore.getById(id));
+  });
+
+  const hasMore = computed(() => {
+    const last = ids.value[ids.value.length - 1];
+    return last !== undefined && through.value < last;
+  });
+
+  function loadMore() {
+    const current = toValue(filter);
+    if (!current || !hasMore.value) return;
+    const page = productsStore.productsPage(current, {
+      after: through.value,
+      limit: pageSize,
+    });
+    if (page.items.length > 0) {
+      loadedThrough.value = page.items[page.items.length - 1].id;
+    }
+  }
+
+  function reset() {
+    loadedThrough.value = null;
+  }
+
+  // New account or statuses: start over from the first page
+  watch(
+    () => {
+      const current = toValue(filter);
+      if (!current) return "";
+      return [current.holder ?? "", ...(current.statuses ?? [])].join("|");
+    },
+    reset
+  );
+
+  return reactive({
+    items,
+    total: computed(() => ids.value.length),
+    hasMore,
+    loadMore,
+    reset,
+  });
+}
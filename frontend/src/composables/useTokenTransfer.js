@@ -99,11 +99,10 @@ export function useTokenTransfer() {
     const result = await transferToken(product, QUARANTINE_VAULT);
 
     // Update local state
-    const storeProduct = productsStore.getById(product.id);
-    if (storeProduct) {
-      storeProduct.currentHolderRole = "QUARANTINE";
-      storeProduct.currentHolderAddress = QUARANTINE_VAULT;
-    }
+    productsStore.setProductState(product.id, {
+      holderRole: "QUARANTINE",
+      holderAddress: QUARANTINE_VAULT,
+    });
 
     return result;
   }
@@ -123,11 +122,10 @@ export function useTokenTransfer() {
     const result = await transferToken(product, ARCHIVE_VAULT);
 
     // Update local state
-    const storeProduct = productsStore.getById(product.id);
-    if (storeProduct) {
-      storeProduct.currentHolderRole = "ARCHIVE";
-      storeProduct.currentHolderAddress = ARCHIVE_VAULT;
-    }
+    productsStore.setProductState(product.id, {
+      holderRole: "ARCHIVE",
+      holderAddress: ARCHIVE_VAULT,
+    });
 
     return result;
   }
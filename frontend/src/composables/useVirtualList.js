@@ -0,0 +1,140 @@
+import { computed, onBeforeUnmount, onMounted, ref, toValue, watch } from "vue";
+import { createHeightIndex, visibleRange } from "../utils/virtualList";
+
+/**
+ * Composable for windowed rendering of long lists
+ * Only the rows inside the scroll viewport (plus `overscan` on each side) are
+ * in the DOM; the rest is two padding blocks sized from measured/estimated
+ * row heights, so the node count stays flat however long the list gets
+ *
+ * Usage in a template:
+ *   <div ref="viewport" class="overflow-y-auto" @scroll="onScroll">
+ *     <div :style="{ height: range.padTop + 'px' }" />
+ *     <Row v-for="(item, i) in visibleItems" :ref="(el) => measure(el, range.start + i)" />
+ *     <div :style="{ height: range.padBottom + 'px' }" />
+ *   </div>
+ *
+ * @param {Ref<Array>|Function} items - Rows (ref, computed or getter)
+ * @param {object} options
+ * @param {number} options.estimate - Row height in px before it is measured
+ * @param {number} options.viewportHeight - Height assumed until mounted
+ * @param {number} options.overscan - Rows rendered beyond each edge
+ * @param {Function} options.onNearEnd - Called when the last rows come into view
+ */
+export function useVirtualList(
+  items,
+  { estimate = 40, viewportHeight = 480, overscan = 6, onNearEnd = null } = {}
+) {
+  const viewport = ref(null);
+  const scrollTop = ref(0);
+  const height = ref(viewportHeight);
+  // Heights live outside reactivity; bumping version re-derives the range
+  const version = ref(0);
+  const heights = createHeightIndex(estimate);
+
+  const count = computed(() => toValue(items)?.length || 0);
+
+  watch(
+    count,
+    (n) => {
+      heights.resize(n);
+      version.value++;
+    },
+    { immediate: true }
+  );
+
+  const range = computed(() => {
+    version.value;
+    return visibleRange(heights, scrollTop.value, height.value, overscan);
+  });
+
+  const visibleItems = computed(() =>
+    (toValue(items) || []).slice(range.value.start, range.value.end)
+  );
+
+  // Next page as soon as the tail is rendered; re-checked after each page so
+  // a viewport taller than one page keeps filling
+  watch(
+    () => [range.value.end >= count.value, count.value],
+    ([atEnd, n]) => {
+      if (atEnd && n > 0 && onNearEnd) onNearEnd();
+    },
+    { immediate: true }
+  );
+
+  // Scroll events fire faster than frames: read scrollTop once per frame
+  let frame = null;
+  function onScroll() {
+    if (frame !== null) return;
+    frame = requestAnimationFrame(() => {
+      frame = null;
+      if (viewport.value) scrollTop.value = viewport.value.scrollTop;
+    });
+  }
+
+  const indexOf = new WeakMap();
+  // Created up front: row refs are set during the first patch, before mount
+  const rowObserver =
+    typeof ResizeObserver !== "undefined"
+      ? new ResizeObserver((entries) => {
+          for (const entry of entries) record(entry.target);
+        })
+      : null;
+  const viewportObserver =
+    typeof ResizeObserver !== "undefined"
+      ? new ResizeObserver(() => {
+          if (viewport.value) height.value = viewport.value.clientHeight;
+        })
+      : null;
+
+  function record(el) {
+    // Rows scrolled out of the window report a last 0×0 resize: drop them
+    if (!el.isConnected) {
+      rowObserver?.unobserve(el);
+      return;
+    }
+    const index = indexOf.get(el);
+    if (index !== undefined && heights.set(index, el.offsetHeight)) {
+      version.value++;
+    }
+  }
+
+  /** Function ref for rendered rows: tracks their real height */
+  function measure(el, index) {
+    const node = el?.$el ?? el;
+    if (!node || typeof node.offsetHeight !== "number") return;
+    indexOf.set(node, index);
+    if (rowObserver) {
+      rowObserver.observe(node);
+    } else {
+      record(node);
+    }
+  }
+
+  // The viewport can mount later than the component (e.g. behind v-if/v-else)
+  function attach(el, previous) {
+    if (previous) viewportObserver?.unobserve(previous);
+    if (!el) return;
+    height.value = el.clientHeight || viewportHeight;
+    scrollTop.value = el.scrollTop;
+    viewportObserver?.observe(el);
+  }
+
+  watch(viewport, attach, { flush: "post" });
+
+  onMounted(() => attach(viewport.value));
+
+  onBeforeUnmount(() => {
+    if (frame !== null) cancelAnimationFrame(frame);
+    rowObserver?.disconnect();
+    viewportObserver?.disconnect();
+  });
+
+  return {
+    viewport,
+    range,
+    visibleItems,
+    onScroll,
+    measure,
+  };
+}
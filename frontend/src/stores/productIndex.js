@@ -0,0 +1,157 @@
+/**
+ * Index helpers for the products store
+ *
+ * Secondary indexes (status → ids, holder address → ids):
+ * - Map of Sets, maintained incrementally by the store's setProductState
+ * - selectIds walks the smallest candidate set, so a filtered view costs
+ *   O(matching rows) rather than O(all products)
+ * - pageIds cuts keyset pages (cursor = last id seen) out of selectIds output
+ *
+ * Timeline event dedup:
+ * - Every chain-derived entry is identified by its log: (transactionHash, logIndex)
+ * - Entries without a log position (demo / manually added) fall back to an
+ *   exact type + actor + timestamp + transition key
+ * - Per product: Map txHash → logIndex(es), seeded lazily from product.events.
+ *   Keying on the log's own txHash string (no concatenation) lets V8 reuse its
+ *   cached hash, so a replayed log costs two lookups instead of a scan
+ *
+ * No Vue imports: everything here also runs on the store's reactive Maps, and
+ * scripts/bench-products-store.mjs runs it under plain Node
+ */
+
+export function indexAdd(index, key, id) {
+  const ids = index.get(key);
+  if (ids) ids.add(id);
+  else index.set(key, new Set([id]));
+}
+
+export function indexRemove(index, key, id) {
+  const ids = index.get(key);
+  if (!ids) return;
+  ids.delete(id);
+  if (ids.size === 0) index.delete(key);
+}
+
+/**
+ * Ids held by holder and/or in one of statuses, ascending.
+ * @param {Map<string, Set<number>>} idsByHolder - Lowercase address → ids
+ * @param {Map<string, Set<number>>} idsByStatus - Status name → ids
+ * @param {{holder?: string, statuses?: string[]}} filter - At least one set
+ * @returns {number[]}
+ */
+export function selectIds(
+  idsByHolder,
+  idsByStatus,
+  { holder = null, statuses = null } = {}
+) {
+  const statusSets = statuses
+    ? statuses.map((status) => idsByStatus.get(status)).filter(Boolean)
+    : null;
+  let ids;
+
+  if (!holder) {
+    ids = (statusSets || []).flatMap((set) => [...set]);
+  } else {
+    const held = idsByHolder.get(holder.toLowerCase());
+    if (!held) return [];
+    if (!statusSets) {
+      ids = [...held];
+    } else if (held.size <= statusSets.reduce((n, set) => n + set.size, 0)) {
+      ids = [...held].filter((id) => statusSets.some((set) => set.has(id)));
+    } else {
+      ids = statusSets.flatMap((set) => [...set].filter((id) => held.has(id)));
+    }
+  }
+
+  return ids.sort((a, b) => a - b);
+}
+
+/**
+ * Keyset page of ascending ids: the first `limit` ids greater than `after`.
+ * The cursor is an id, not an offset, so rows added or removed before it do
+ * not shift the page; nextCursor is null on the last page.
+ * @param {number[]} ids - Ascending ids (selectIds output)
+ * @param {{after?: number, limit?: number}} cursor
+ * @returns {{ids: number[], nextCursor: number|null, total: number}}
+ */
+export function pageIds(ids, { after = 0, limit = Infinity } = {}) {
+  let lo = 0;
+  let hi = ids.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (ids[mid] <= after) lo = mid + 1;
+    else hi = mid;
+  }
+  const page = ids.slice(lo, lo + limit);
+  return {
+    ids: page,
+    nextCursor: lo + page.length < ids.length ? page[page.length - 1] : null,
+    total: ids.length,
+  };
+}
+
+function localKey(event) {
+  return [
+    "local",
+    event.type,
+    event.actor,
+    new Date(event.timestamp).getTime(),
+    event.statusFrom ?? "",
+    event.statusTo ?? "",
+  ].join(":");
+}
+
+function hasLogPosition(event) {
+  return Boolean(event.txHash) && event.logIndex !== undefined && event.logIndex !== null;
+}
+
+export function createEventDedup() {
+  const slotsByProduct = new WeakMap();
+
+  // Returns true if (group, index) was not recorded yet. A product usually has
+  // one log per transaction, so a lone index is stored bare and only becomes a
+  // Set when a second log of the same transaction arrives
+  function record(slots, group, index) {
+    const indexes = slots.get(group);
+    if (indexes === undefined) {
+      slots.set(group, index);
+      return true;
+    }
+    if (typeof indexes === "number") {
+      if (indexes === index) return false;
+      slots.set(group, new Set([indexes, index]));
+      return true;
+    }
+    if (indexes.has(index)) return false;
+    indexes.add(index);
+    return true;
+  }
+
+  function recordEvent(slots, event) {
+    return hasLogPosition(event)
+      ? record(slots, event.txHash, Number(event.logIndex))
+      : record(slots, localKey(event), 0);
+  }
+
+  function slotsFor(product) {
+    let slots = slotsByProduct.get(product);
+    if (!slots) {
+      slots = new Map();
+      for (const event of product.events || []) recordEvent(slots, event);
+      slotsByProduct.set(product, slots);
+    }
+    return slots;
+  }
+
+  return {
+    /** Record event for product; false if the product already has it */
+    claim(product, event) {
+      return recordEvent(slotsFor(product), event);
+    },
+
+    /** Drop product's keys (after its events array was replaced) */
+    forget(product) {
+      slotsByProduct.delete(product);
+    },
+  };
+}
@@ -1,20 +1,54 @@
 import { ref, onMounted, onUnmounted } from "vue";
-import { getReadOnlyContract } from "../web3/contractClient";
+import {
+  getBatchesByIds,
+  getReadOnlyContract,
+} from "../web3/contractClient";
 import { useProductsStore } from "../stores/useProductsStore";
 import { fetchMetadataFromIPFS } from "../web3/ipfsClient";
+import { syncContractEvents } from "../web3/eventSync";
+import { createLiveEventStream } from "../web3/liveEvents";
+import {
+  connectSyncWorker,
+  getSyncWorkerClient,
+  isSyncWorkerSupported,
+} from "../web3/syncWorkerClient";
+import { STATUS_MAP, applyTimelineLogs } from "../web3/timeline";
+import { blockTimestampStats } from "../web3/blockTimestamps";
+import { ipfsCacheStats } from "../web3/ipfsCache";
+import { createLimiter } from "../utils/helpers";
 
 /**
  * ERC721 Product Sync Composable
  *
  * Architecture: Single Source of Truth (blockchain events only)
  * - Products created with empty events array
- * - loadPastEventsFromChain() queries blockchain for timeline (block timestamps)
- * - Real-time listeners update state only, no event creation
+ * - loadPastEventsFromChain() replays the checkpointed log cache (only new blocks are fetched)
+ * - Real-time logs are coalesced per batch and read back in one multicall;
+ *   missed blocks are backfilled on wake/reconnect (state only, no event creation)
  * - Duplicate prevention handled by store
+ * - With VITE_RPC_URL and SharedWorker support, all of the above runs once per
+ *   browser in workers/chainSync.worker.js; tabs apply its snapshot and deltas
  */
 
 let globalListenersAttached = false;
-let globalContract = null;
+let liveStream = null;
+
+// Max page/metadata requests in flight during loadProductsFromChain
+const DEFAULT_LOAD_CONCURRENCY = Number(
+  import.meta.env.VITE_LOAD_CONCURRENCY || 8
+);
+
+// Apply timeline entries rebuilt by the sync worker: [[batchId, entry], ...]
+function applyTimelineEntries(productsStore, entries) {
+  for (const [batchId, entry] of entries) {
+    const product = productsStore.getById(batchId);
+    if (!product) continue;
+    if (entry.type === "REGISTERED" && !entry.location) {
+      entry.location = product.metadata?.location || "";
+    }
+    productsStore.addEvent(batchId, entry);
+  }
+}
 
 async function loadMetadataFromURI(uri) {
   try {
@@ -45,21 +79,11 @@ export function useProductSync(options = {}) {
     viewName = "Unknown",
     onProductLoaded = null,
     onStatusUpdated = null,
+    concurrency = DEFAULT_LOAD_CONCURRENCY,
   } = options;
   const productsStore = useProductsStore();
   const loadingProducts = ref(false);
 
-  const STATUS_MAP = {
-    0: "NOT_EXIST",
-    1: "HARVESTED",
-    2: "INSPECTING",
-    3: "IN_TRANSIT",
-    4: "DELIVERED",
-    5: "RETAILED",
-    6: "CONSUMED",
-    7: "RECALLED",
-  };
-
   // Special vault addresses from smart contract
   const QUARANTINE_VAULT = "0x000000000000000000000000000000000000dead";
   const ARCHIVE_VAULT = "0x000000000000000000000000000000000000aaaa";
@@ -100,18 +124,92 @@ export function useProductSync(options = {}) {
     return map[statusNum] || "UNKNOWN";
   }
 
-  function determineEventType(oldStatusNum, newStatusNum) {
-    if (oldStatusNum === 1 && newStatusNum === 2) return "ATTESTED";
-    if (oldStatusNum === 2 && newStatusNum === 3) return "TRANSFER";
-    if (oldStatusNum === 3 && newStatusNum === 4) return "TRANSFER";
-    if (oldStatusNum === 4 && newStatusNum === 5) return "STATUS_UPDATED";
-    if (oldStatusNum === 5 && newStatusNum === 6) return "STATUS_UPDATED";
-    if (newStatusNum === 7) return "RECALL";
-    return "STATUS_UPDATED";
+  // Shells + metadata for batch views ({ id, owner, status, uri }), from the
+  // chain or from the sync worker's snapshot
+  async function applyBatchViews(batches, limit) {
+    // Shells in id order right away, so tables render before metadata arrives
+    for (const batch of batches) {
+      const i = Number(batch.id);
+      const statusNum = Number(batch.status);
+      // Preserve RECALLED holder role of an already-loaded product
+      const existingProduct = productsStore.getById(i);
+      productsStore.addProductFromOnChain({
+        id: i,
+        name: existingProduct?.name || `Lô #${i}`,
+        uri: batch.uri,
+        holder: batch.owner.toLowerCase(),
+        initSupply: 1,
+        status: STATUS_MAP[statusNum] || "NOT_EXIST",
+        holderRole: getHolderRoleFromStatus(
+          statusNum,
+          batch.owner,
+          existingProduct?.currentHolderRole
+        ),
+      });
+    }
+
+    // Metadata with bounded parallelism (IPFS hits come from the CID cache)
+    await Promise.all(
+      batches.map((batch) =>
+        limit(async () => {
+          const i = Number(batch.id);
+          try {
+            const metadata = await loadMetadataFromURI(batch.uri);
+            const product = productsStore.addProductFromOnChain({
+              id: i,
+              name: metadata?.name || `Lô #${i}`,
+              location: metadata?.location || "",
+              metadata,
+            });
+
+            if (onProductLoaded) {
+              onProductLoaded(product, {
+                status: product.status,
+                holderRole: product.currentHolderRole,
+              });
+            }
+          } catch (err) {
+            console.warn(`[${viewName}] Error loading batch ${i}:`, err.message);
+          }
+        })
+      )
+    );
   }
 
   // Load all batches from chain: create shells → query events → populate timeline
   async function loadProductsFromChain() {
+    const worker = connectSyncWorker({
+      onSnapshot: async ({ batches, entries }) => {
+        await applyBatchViews(batches, createLimiter(concurrency));
+        applyTimelineEntries(productsStore, entries);
+      },
+      onDelta: async ({ batches, entries }) => {
+        await applyLiveBatches({ batches });
+        applyTimelineEntries(productsStore, entries);
+      },
+    });
+    if (worker) {
+      // Another tab may have synced already: the snapshot comes from memory
+      try {
+        loadingProducts.value = true;
+        await worker.firstSnapshot;
+        console.log(
+          `[${viewName}] ✅ Loaded ${productsStore.products.length} products from the sync worker`
+        );
+        return;
+      } catch (error) {
+        // The client has stood down: sync and listen in this tab instead
+        console.error(`[${viewName}] Sync worker failed, syncing in this tab:`, error);
+        attachGlobalEventListeners();
+      } finally {
+        loadingProducts.value = false;
+      }
+    }
+
+    await loadProductsInTab();
+  }
+
+  async function loadProductsInTab() {
     if (!window.ethereum) {
       console.warn(`[${viewName}] MetaMask not found`);
       return;
@@ -120,55 +218,37 @@ export function useProductSync(options = {}) {
     try {
       loadingProducts.value = true;
       const contract = getReadOnlyContract();
-      const tokenCounter = await contract.tokenCounter();
-
-      console.log(`[${viewName}] Loading ${tokenCounter} batches...`);
+      const limit = createLimiter(concurrency);
 
-      // Create/update product shells with current blockchain state
-      for (let i = 1; i <= Number(tokenCounter); i++) {
-        try {
-          const owner = await contract.ownerOf(i);
-          const status = await contract.getBatchStatus(i);
-          const uri = await contract.tokenURI(i);
+      // Timeline delta sync runs alongside the batch/metadata pipeline
+      const timelineSync = syncContractEvents(contract);
+      timelineSync.catch(() => {}); // reported by loadPastEventsFromChain
 
-          if (Number(status) === 0) continue;
+      const [tokenCounter, pageSize] = (
+        await Promise.all([contract.tokenCounter(), contract.get_MAX_BATCH_PAGE()])
+      ).map(Number);
 
-          const metadata = await loadMetadataFromURI(uri);
-          const name = metadata?.name || `Lô #${i}`;
-          const statusName = STATUS_MAP[Number(status)] || "NOT_EXIST";
-          // For initial load, get existing product role if it exists (preserve RECALLED holder role)
-          const existingProduct = productsStore.getById(i);
-          const holderRole = getHolderRoleFromStatus(
-            Number(status),
-            owner,
-            existingProduct?.currentHolderRole
-          );
-
-          productsStore.addProductFromOnChain({
-            id: i,
-            name,
-            uri,
-            holder: owner.toLowerCase(),
-            location: metadata?.location || "",
-            initSupply: 1,
-            status: statusName,
-            holderRole: holderRole,
-            metadata: metadata,
-          });
+      console.log(`[${viewName}] Loading ${tokenCounter} batches...`);
 
-          if (onProductLoaded) {
-            const product = productsStore.getById(i);
-            onProductLoaded(product, { status: statusName, holderRole });
-          }
-        } catch (err) {
-          console.warn(`[${viewName}] Error loading batch ${i}:`, err.message);
-        }
+      // 1. Current state: getBatchesInRange pages, `concurrency` in flight
+      const pageStarts = [];
+      for (let start = 1; start <= tokenCounter; start += pageSize) {
+        pageStarts.push(start);
       }
+      const pages = await Promise.all(
+        pageStarts.map((start) =>
+          limit(() => contract.getBatchesInRange(start, pageSize))
+        )
+      );
+      const batches = pages.flat().filter((batch) => Number(batch.status) !== 0);
+
+      await applyBatchViews(batches, limit);
 
       // Load ALL events from blockchain to reconstruct complete timeline
-      await loadPastEventsFromChain(contract, Number(tokenCounter));
+      await loadPastEventsFromChain(contract, timelineSync);
       console.log(
-        `[${viewName}] ✅ Loaded ${tokenCounter} products with events`
+        `[${viewName}] ✅ Loaded ${tokenCounter} products with events ` +
+          `(IPFS cache: ${ipfsCacheStats.hits} hits, ${ipfsCacheStats.misses} misses)`
       );
     } catch (error) {
       console.error(`[${viewName}] Error loading batches:`, error);
@@ -177,394 +257,116 @@ export function useProductSync(options = {}) {
     }
   }
 
-  // Load past events from blockchain to reconstruct timeline (synced across browsers)
-  async function loadPastEventsFromChain(contract, maxBatchId) {
+  // Rebuild timelines from the log cache; only blocks after the checkpoint hit the RPC
+  async function loadPastEventsFromChain(
+    contract,
+    timelineSync = syncContractEvents(contract)
+  ) {
     try {
-      const currentBlock = await contract.runner.provider.getBlockNumber();
-      const fromBlock = Math.max(0, currentBlock - 10000);
-
-      // Query all event types
-      const [
-        mintedEvents,
-        inspectedEvents,
-        statusEvents,
-        recalledEvents,
-        transferEvents,
-      ] = await Promise.all([
-        contract.queryFilter(
-          contract.filters.BatchMinted(),
-          fromBlock,
-          currentBlock
-        ),
-        contract.queryFilter(
-          contract.filters.BatchInspected(),
-          fromBlock,
-          currentBlock
-        ),
-        contract.queryFilter(
-          contract.filters.StatusUpdated(),
-          fromBlock,
-          currentBlock
-        ),
-        contract.queryFilter(
-          contract.filters.BatchRecalled(),
-          fromBlock,
-          currentBlock
-        ),
-        contract.queryFilter(
-          contract.filters.Transfer(),
-          fromBlock,
-          currentBlock
-        ),
-      ]);
-
-      // Process BatchMinted events
-      for (const event of mintedEvents) {
-        const batchId = Number(event.args.batchId);
-        const product = productsStore.getById(batchId);
-        if (!product) continue;
-
-        // Validate event args
-        if (!event.args.farmer) {
-          console.warn(
-            `[${viewName}] BatchMinted event missing farmer:`,
-            batchId
-          );
-          continue;
-        }
-
-        const block = await event.getBlock();
-        const farmer = event.args.farmer.toLowerCase();
-
-        productsStore.addEvent(batchId, {
-          type: "REGISTERED",
-          actor: farmer,
-          timestamp: new Date(block.timestamp * 1000).toISOString(),
-          statusTo: "HARVESTED",
-          location: product.metadata?.location || "",
-        });
-      }
-
-      // Process BatchInspected events
-      for (const event of inspectedEvents) {
-        const batchId = Number(event.args.batchId);
-        const product = productsStore.getById(batchId);
-        if (!product) continue;
-
-        // Validate event args
-        if (!event.args.inspector) {
-          console.warn(
-            `[${viewName}] BatchInspected event missing inspector:`,
-            batchId
-          );
-          continue;
-        }
-
-        const block = await event.getBlock();
-
-        productsStore.addEvent(batchId, {
-          type: "ATTESTED",
-          actor: event.args.inspector.toLowerCase(),
-          timestamp: new Date(block.timestamp * 1000).toISOString(),
-          statusFrom: "HARVESTED",
-          statusTo: "INSPECTING",
-          location: "Certificate attached via Inspector",
-        });
-      }
-
-      // Process StatusUpdated events
-      for (const event of statusEvents) {
-        const batchId = Number(event.args.batchId);
-        const product = productsStore.getById(batchId);
-        if (!product) continue;
-
-        // Validate event args
-        if (
-          event.args.updater === undefined ||
-          event.args.oldStatus === undefined ||
-          event.args.newStatus === undefined
-        ) {
-          console.warn(
-            `[${viewName}] StatusUpdated event missing args:`,
-            batchId
-          );
-          continue;
-        }
-
-        const block = await event.getBlock();
-        const oldStatusName = STATUS_MAP[Number(event.args.oldStatus)];
-        const newStatusName = STATUS_MAP[Number(event.args.newStatus)];
-        const eventType = determineEventType(
-          Number(event.args.oldStatus),
-          Number(event.args.newStatus)
-        );
-
-        productsStore.addEvent(batchId, {
-          type: eventType,
-          actor: event.args.updater.toLowerCase(),
-          timestamp: new Date(block.timestamp * 1000).toISOString(),
-          statusFrom: oldStatusName,
-          statusTo: newStatusName,
-          location: `Status updated by ${event.args.updater.slice(0, 10)}...`,
-        });
-      }
-
-      // Process Transfer events (ERC721)
-      for (const event of transferEvents) {
-        const tokenId = Number(event.args.tokenId);
-        const product = productsStore.getById(tokenId);
-        if (!product) continue;
-
-        // Skip mint transfers (from 0x0)
-        if (event.args.from === "0x0000000000000000000000000000000000000000")
-          continue;
-
-        // Validate event args exist
-        if (!event.args.to || !event.args.from) {
-          console.warn(`[${viewName}] Transfer event missing args:`, tokenId);
-          continue;
-        }
-
-        const block = await event.getBlock();
-
-        productsStore.addEvent(tokenId, {
-          type: "TRANSFER",
-          actor: event.args.to.toLowerCase(),
-          timestamp: new Date(block.timestamp * 1000).toISOString(),
-          location: `Transferred from ${event.args.from.slice(
-            0,
-            10
-          )}... to ${event.args.to.slice(0, 10)}...`,
-        });
-      }
-
-      // Process BatchRecalled events
-      for (const event of recalledEvents) {
-        const batchId = Number(event.args.batchId);
-        const product = productsStore.getById(batchId);
-        if (!product) continue;
-
-        // Validate event args
-        if (!event.args.caller) {
-          console.warn(
-            `[${viewName}] BatchRecalled event missing caller:`,
-            batchId
-          );
-          continue;
-        }
-
-        const block = await event.getBlock();
-
-        productsStore.addEvent(batchId, {
-          type: "RECALL",
-          actor: event.args.caller.toLowerCase(),
-          timestamp: new Date(block.timestamp * 1000).toISOString(),
-          statusTo: "RECALLED",
-          reasonHash: event.args.reasonHash,
-          location: "Product recalled by admin",
-        });
-      }
+      const { logs, cachedCount, freshCount } = await timelineSync;
+      console.log(
+        `[${viewName}] Timeline: ${cachedCount} cached + ${freshCount} new logs ` +
+          `(block timestamps: ${blockTimestampStats.fetches} fetched, ` +
+          `${blockTimestampStats.hits} cache hits)`
+      );
+      applyTimelineLogs(productsStore, logs);
     } catch (error) {
       console.error(`[${viewName}] Error loading past events:`, error);
     }
   }
 
-  // Attach event listeners for real-time updates (state only, no event creation)
-  function listenToContractEvents(contract) {
-    // BatchMinted: New batch created
-    contract.on("BatchMinted", async (batchId, farmer, event) => {
-      console.log(`[${viewName}] BatchMinted: ${batchId}`);
-
-      try {
-        const uri = await contract.tokenURI(batchId);
-        const metadata = await loadMetadataFromURI(uri);
-        const name = metadata?.name || `Lô #${batchId}`;
-
-        // Create product shell only - events added by blockchain query
-        productsStore.addProductFromOnChain({
-          id: Number(batchId),
-          name,
-          uri,
-          holder: farmer.toLowerCase(),
-          location: metadata?.location || "",
-          initSupply: 1,
-          status: "HARVESTED",
-          holderRole: "FARMER",
-          metadata: metadata,
-        });
-
-        if (onProductLoaded) {
-          const product = productsStore.getById(Number(batchId));
-          onProductLoaded(product, {
-            status: "HARVESTED",
-            holderRole: "FARMER",
-          });
-        }
-      } catch (error) {
-        console.error(`[${viewName}] Error handling BatchMinted:`, error);
-      }
-    });
-
-    // Transfer: Ownership change (drives state transitions)
-    contract.on("Transfer", async (from, to, tokenId, event) => {
-      console.log(
-        `[${viewName}] Transfer: ${tokenId} from ${from.slice(
-          0,
-          6
-        )}... to ${to.slice(0, 6)}...`
-      );
-
-      const product = productsStore.getById(Number(tokenId));
-      if (!product) return;
-
-      try {
-        // Update product state only
-        product.currentHolderAddress = to.toLowerCase();
-        const status = await contract.getBatchStatus(tokenId);
-        const statusName = STATUS_MAP[Number(status)];
-        // Pass current role to preserve RECALLED holder role
-        const holderRole = getHolderRoleFromStatus(
-          Number(status),
-          to,
-          product.currentHolderRole
-        );
-
-        product.status = statusName;
-        product.currentHolderRole = holderRole;
-
-        if (onStatusUpdated) {
-          onStatusUpdated(product, { newStatus: statusName, holderRole });
-        }
-      } catch (error) {
-        console.error(`[${viewName}] Error handling Transfer:`, error);
-      }
-    });
-
-    // BatchInspected: Inspector attestation
-    contract.on("BatchInspected", async (batchId, inspector, event) => {
-      console.log(`[${viewName}] BatchInspected: ${batchId}`);
-
-      const product = productsStore.getById(Number(batchId));
-      if (!product) return;
-
-      try {
-        // Update product state only
-        product.status = "INSPECTING";
-        product.currentHolderRole = "FARMER";
-
-        if (onStatusUpdated) {
-          onStatusUpdated(product, {
-            newStatus: "INSPECTING",
-            holderRole: "FARMER",
-          });
-        }
-      } catch (error) {
-        console.error(`[${viewName}] Error handling BatchInspected:`, error);
-      }
-    });
-
-    // StatusUpdated: Generic status change
-    contract.on(
-      "StatusUpdated",
-      async (batchId, updater, oldStatus, newStatus, event) => {
-        console.log(
-          `[${viewName}] StatusUpdated: ${batchId} (${oldStatus}→${newStatus})`
-        );
-
-        const product = productsStore.getById(Number(batchId));
-        if (!product) return;
+  // Apply one coalesced window of live logs: every touched batch was read once
+  // (owner/status/uri), so the final state wins however many logs it had
+  async function applyLiveBatches({ batches, logsByBatch }) {
+    const limit = createLimiter(concurrency);
+
+    await Promise.all(
+      batches.map((batch) =>
+        limit(async () => {
+          const id = Number(batch.id);
+          const statusNum = Number(batch.status);
+          if (statusNum === 0) return;
+
+          const names = logsByBatch?.get(id)?.map((entry) => entry.name);
+          console.log(
+            `[${viewName}] Batch ${id} updated` +
+              (names ? `: ${names.join(", ")}` : "")
+          );
 
-        try {
-          // Update product state only
-          const statusName = STATUS_MAP[Number(newStatus)];
+          const status = STATUS_MAP[statusNum];
+          const owner = batch.owner.toLowerCase();
+          const existing = productsStore.getById(id);
+          const previousStatus = existing?.status;
           // Pass current role to preserve RECALLED holder role
           const holderRole = getHolderRoleFromStatus(
-            Number(newStatus),
-            product.currentHolderAddress,
-            product.currentHolderRole
+            statusNum,
+            owner,
+            existing?.currentHolderRole
           );
 
-          product.status = statusName;
-          product.currentHolderRole = holderRole;
+          if (!existing || existing.uri !== batch.uri) {
+            // New batch, or re-pointed metadata (inspection certificate)
+            const metadata = await loadMetadataFromURI(batch.uri);
+            const product = productsStore.addProductFromOnChain({
+              id,
+              name: metadata?.name || existing?.name || `Lô #${id}`,
+              uri: batch.uri,
+              holder: owner,
+              location: metadata?.location || "",
+              initSupply: 1,
+              status,
+              holderRole,
+              metadata,
+            });
+            if (!existing && onProductLoaded) {
+              onProductLoaded(product, { status, holderRole });
+              return;
+            }
+          }
 
-          if (onStatusUpdated) {
-            onStatusUpdated(product, { newStatus: statusName, holderRole });
+          const product = productsStore.setProductState(id, {
+            status,
+            holderAddress: owner,
+            holderRole,
+          });
+          if (existing && onStatusUpdated && previousStatus !== status) {
+            onStatusUpdated(product, { newStatus: status, holderRole });
           }
-        } catch (error) {
-          console.error(`[${viewName}] Error handling StatusUpdated:`, error);
-        }
-      }
+        })
+      )
     );
+  }
 
-    // BatchRecalled: Admin recall
-    contract.on("BatchRecalled", async (batchId, caller, reasonHash, event) => {
-      console.log(`[${viewName}] BatchRecalled: ${batchId}`);
-
-      const product = productsStore.getById(Number(batchId));
-      if (!product) return;
-
-      try {
-        // Update product state only - PRESERVE currentHolderRole
-        // Product stays with current holder until transferred to QUARANTINE_VAULT
-        product.status = "RECALLED";
-        // Don't change currentHolderRole - keep existing holder's role
-
-        if (onStatusUpdated) {
-          onStatusUpdated(product, {
-            newStatus: "RECALLED",
-            holderRole: product.currentHolderRole, // Use existing role, not hardcoded FARMER
-          });
-        }
-      } catch (error) {
-        console.error(`[${viewName}] Error handling BatchRecalled:`, error);
-      }
+  // Real-time updates (state only, no event creation): one coalescing log
+  // stream, see web3/liveEvents.js
+  async function listenToContractEvents(contract, fromBlock = null) {
+    liveStream = createLiveEventStream(contract, {
+      readBatches: getBatchesByIds,
+      onFlush: applyLiveBatches,
     });
-
-    // BatchArchived: Final state (to ARCHIVE_VAULT)
-    contract.on(
-      "BatchArchived",
-      async (batchId, caller, archiveWallet, event) => {
-        console.log(`[${viewName}] BatchArchived: ${batchId}`);
-
-        const product = productsStore.getById(Number(batchId));
-        if (!product) return;
-
-        try {
-          // Update product state only
-          product.status = "CONSUMED";
-          product.currentHolderAddress = archiveWallet.toLowerCase();
-        } catch (error) {
-          console.error(`[${viewName}] Error handling BatchArchived:`, error);
-        }
-      }
-    );
+    await liveStream.start(fromBlock);
   }
 
-  function attachGlobalEventListeners() {
-    if (globalListenersAttached) return;
+  async function attachGlobalEventListeners() {
+    // The sync worker listens for every tab, unless it failed for this one
+    if (globalListenersAttached || isSyncWorkerSupported()) return;
+    globalListenersAttached = true;
 
     try {
-      const contract = getReadOnlyContract();
-      globalContract = contract;
-      listenToContractEvents(contract);
-      globalListenersAttached = true;
+      await listenToContractEvents(getReadOnlyContract());
     } catch (error) {
+      globalListenersAttached = false;
       console.error(`[${viewName}] Error attaching global listeners:`, error);
     }
   }
 
   function cleanup() {
-    if (globalContract) {
-      globalContract.removeAllListeners("BatchMinted");
-      globalContract.removeAllListeners("Transfer");
-      globalContract.removeAllListeners("BatchInspected");
-      globalContract.removeAllListeners("StatusUpdated");
-      globalContract.removeAllListeners("BatchRecalled");
-      globalContract.removeAllListeners("BatchArchived");
+    if (liveStream) {
+      liveStream.stop();
     }
 
     globalListenersAttached = false;
-    globalContract = null;
+    liveStream = null;
   }
 
   onMounted(() => {
@@ -588,125 +390,23 @@ export function useProductSync(options = {}) {
  */
 export async function reloadProductEvents(productId) {
   try {
+    // The worker broadcasts the new logs to every tab, this one included
+    const worker = getSyncWorkerClient();
+    if (worker) {
+      await worker.sync();
+      return;
+    }
+
     const contract = getReadOnlyContract();
     const productsStore = useProductsStore();
     const product = productsStore.getById(productId);
     if (!product) return;
 
-    // Query recent events (last 1000 blocks)
-    const currentBlock = await contract.runner.provider.getBlockNumber();
-    const fromBlock = Math.max(0, currentBlock - 1000);
-
-    const [
-      mintedEvents,
-      inspectedEvents,
-      statusEvents,
-      transferEvents,
-      recalledEvents,
-    ] = await Promise.all([
-      contract.queryFilter(contract.filters.BatchMinted(productId), fromBlock),
-      contract.queryFilter(
-        contract.filters.BatchInspected(productId),
-        fromBlock
-      ),
-      contract.queryFilter(
-        contract.filters.StatusUpdated(productId),
-        fromBlock
-      ),
-      contract.queryFilter(
-        contract.filters.Transfer(null, null, productId),
-        fromBlock
-      ),
-      contract.queryFilter(
-        contract.filters.BatchRecalled(productId),
-        fromBlock
-      ),
-    ]);
-
-    // Process all event types with blockchain timestamps (addEvent() handles duplicates)
-
-    for (const event of mintedEvents) {
-      const block = await event.getBlock();
-      productsStore.addEvent(productId, {
-        type: "REGISTERED",
-        actor: event.args.farmer.toLowerCase(),
-        timestamp: new Date(block.timestamp * 1000).toISOString(),
-        statusTo: "HARVESTED",
-        location: product.metadata?.location || "",
-      });
-    }
-
-    for (const event of inspectedEvents) {
-      const block = await event.getBlock();
-      productsStore.addEvent(productId, {
-        type: "ATTESTED",
-        actor: event.args.inspector.toLowerCase(),
-        timestamp: new Date(block.timestamp * 1000).toISOString(),
-        statusFrom: "HARVESTED",
-        statusTo: "INSPECTING",
-        location: "Certificate attached via Inspector",
-      });
-    }
-
-    for (const event of statusEvents) {
-      const block = await event.getBlock();
-      const STATUS_MAP = {
-        0: "NOT_EXIST",
-        1: "HARVESTED",
-        2: "INSPECTING",
-        3: "IN_TRANSIT",
-        4: "DELIVERED",
-        5: "RETAILED",
-        6: "CONSUMED",
-        7: "RECALLED",
-      };
-
-      productsStore.addEvent(productId, {
-        type: "STATUS_UPDATED",
-        actor: event.args.updater.toLowerCase(),
-        timestamp: new Date(block.timestamp * 1000).toISOString(),
-        statusFrom: STATUS_MAP[Number(event.args.oldStatus)],
-        statusTo: STATUS_MAP[Number(event.args.newStatus)],
-        location: `Status updated by ${event.args.updater.slice(0, 10)}...`,
-      });
-    }
-
-    for (const event of transferEvents) {
-      // Skip mint transfers
-      if (event.args.from === "0x0000000000000000000000000000000000000000")
-        continue;
-
-      // Validate event args exist
-      if (!event.args.to || !event.args.from) {
-        console.warn(
-          `[reloadProductEvents] Transfer event missing args for product ${productId}`
-        );
-        continue;
-      }
-
-      const block = await event.getBlock();
-      productsStore.addEvent(productId, {
-        type: "TRANSFER",
-        actor: event.args.to.toLowerCase(),
-        timestamp: new Date(block.timestamp * 1000).toISOString(),
-        location: `Transferred from ${event.args.from.slice(
-          0,
-          10
-        )}... to ${event.args.to.slice(0, 10)}...`,
-      });
-    }
-
-    for (const event of recalledEvents) {
-      const block = await event.getBlock();
-      productsStore.addEvent(productId, {
-        type: "RECALL",
-        actor: event.args.caller.toLowerCase(),
-        timestamp: new Date(block.timestamp * 1000).toISOString(),
-        statusTo: "RECALLED",
-        reasonHash: event.args.reasonHash,
-        location: "Product recalled by admin",
-      });
-    }
+    // Only the logs after the checkpoint: earlier ones are already on the
+    // timeline. The checkpoint is shared, so the delta goes to every batch it
+    // touches, not just this one, or the other batches would never see it
+    const { logs } = await syncContractEvents(contract, { includeCached: false });
+    applyTimelineLogs(productsStore, logs);
   } catch (error) {
     console.error("[reloadProductEvents] Error:", error);
   }
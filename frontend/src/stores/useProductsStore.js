@@ -1,4 +1,12 @@
 import { defineStore } from "pinia";
+import { toRaw } from "vue";
+import {
+  createEventDedup,
+  indexAdd,
+  indexRemove,
+  pageIds,
+  selectIds,
+} from "./productIndex";
 
 const VALID_STATUSES = [
   "NOT_EXIST",
@@ -11,17 +19,51 @@ const VALID_STATUSES = [
   "RECALLED",
 ];
 
+const PAGE_SIZE = 50;
+
+// Timeline keys per product, outside reactive state (see productIndex.js)
+const eventDedup = createEventDedup();
+
+function holderKey(address) {
+  return (address || "").toLowerCase();
+}
+
 export const useProductsStore = defineStore("products", {
   state: () => ({
-    products: [],
+    products: [], // render order
+    productsById: new Map(), // batch id → same product objects, O(1) lookups
+    // Secondary indexes, kept in sync by setProductState
+    idsByStatus: new Map(), // status → Set of ids
+    idsByHolder: new Map(), // lowercase holder address → Set of ids
   }),
 
   getters: {
     getById: (state) => (id) => {
-      return state.products.find((p) => p.id === id);
+      return state.productsById.get(id);
     },
     exists: (state) => (id) => {
-      return !!state.products.find((p) => p.id === id);
+      return state.productsById.has(id);
+    },
+    // Ids matching { holder, statuses, where? } ascending, O(matching rows)
+    idsWhere: (state) => (filter) => {
+      const ids = selectIds(state.idsByHolder, state.idsByStatus, filter);
+      if (!filter?.where) return ids;
+      return ids.filter((id) => filter.where(state.productsById.get(id)));
+    },
+    // Products matching filter in id order
+    productsWhere() {
+      return (filter) => this.idsWhere(filter).map((id) => this.getById(id));
+    },
+    // Cursor API: one keyset page of the filter, { items, nextCursor, total }
+    productsPage() {
+      return (filter, { after = 0, limit = PAGE_SIZE } = {}) => {
+        const page = pageIds(this.idsWhere(filter), { after, limit });
+        return {
+          items: page.ids.map((id) => this.getById(id)),
+          nextCursor: page.nextCursor,
+          total: page.total,
+        };
+      };
     },
   },
 
@@ -39,12 +81,12 @@ export const useProductsStore = defineStore("products", {
 
       if (product) {
         // Update metadata only, preserve events
+        this.setProductState(id, {
+          status: payload.status,
+          holderAddress: payload.holder,
+          holderRole: payload.holderRole,
+        });
         product.name = payload.name || product.name;
-        product.status = payload.status || product.status;
-        product.currentHolderRole =
-          payload.holderRole || product.currentHolderRole;
-        product.currentHolderAddress =
-          payload.holder || product.currentHolderAddress;
         product.uri = payload.uri || product.uri;
         product.location = payload.location || product.location;
         product.initialSupply = payload.initSupply ?? product.initialSupply;
@@ -70,6 +112,31 @@ export const useProductsStore = defineStore("products", {
       };
 
       this.products.push(product);
+      this.productsById.set(id, product);
+      indexAdd(this.idsByStatus, product.status, id);
+      indexAdd(this.idsByHolder, holderKey(product.currentHolderAddress), id);
+      return product;
+    },
+
+    // Single write path for status / holder: keeps the secondary indexes in sync
+    setProductState(id, { status, holderAddress, holderRole } = {}) {
+      const product = this.getById(id);
+      if (!product) return null;
+
+      if (status && status !== product.status) {
+        indexRemove(this.idsByStatus, product.status, id);
+        indexAdd(this.idsByStatus, status, id);
+        product.status = status;
+      }
+      const oldHolder = holderKey(product.currentHolderAddress);
+      if (holderAddress && holderKey(holderAddress) !== oldHolder) {
+        indexRemove(this.idsByHolder, oldHolder, id);
+        indexAdd(this.idsByHolder, holderKey(holderAddress), id);
+        product.currentHolderAddress = holderAddress;
+      }
+      if (holderRole) {
+        product.currentHolderRole = holderRole;
+      }
       return product;
     },
 
@@ -91,14 +158,11 @@ export const useProductsStore = defineStore("products", {
       }
 
       const oldStatus = product.status;
-      product.status = newStatus;
-
-      if (options.currentHolderRole) {
-        product.currentHolderRole = options.currentHolderRole;
-      }
-      if (options.currentHolderAddress) {
-        product.currentHolderAddress = options.currentHolderAddress;
-      }
+      this.setProductState(id, {
+        status: newStatus,
+        holderAddress: options.currentHolderAddress,
+        holderRole: options.currentHolderRole,
+      });
 
       // Tự động thêm event nếu không bị tắt
       if (options.addEvent !== false) {
@@ -115,7 +179,7 @@ export const useProductsStore = defineStore("products", {
       return product;
     },
 
-    // Add event with duplicate prevention (multi-criteria check)
+    // Add event unless the product already has it: exact (txHash, logIndex) match
     addEvent(id, event) {
       const product = this.getById(id);
       if (!product) {
@@ -124,44 +188,11 @@ export const useProductsStore = defineStore("products", {
       }
       if (!Array.isArray(product.events)) {
         product.events = [];
+        eventDedup.forget(toRaw(product));
       }
 
-      // Multi-criteria duplicate check
-      const eventTimestamp = new Date(event.timestamp).getTime();
-      const isDuplicate = product.events.some((existingEvent) => {
-        // Criterion 1: Type match (with special cases)
-        const isSameType =
-          existingEvent.type === event.type ||
-          (["REGISTERED", "REGISTERED_ONCHAIN"].includes(existingEvent.type) &&
-            ["REGISTERED", "REGISTERED_ONCHAIN"].includes(event.type));
-
-        if (!isSameType) return false;
-
-        // Criterion 2: Actor match
-        if (existingEvent.actor !== event.actor) return false;
-
-        // Criterion 3: Timestamp similarity (within 10 seconds)
-        const existingTimestamp = new Date(existingEvent.timestamp).getTime();
-        const timeDiff = Math.abs(existingTimestamp - eventTimestamp);
-
-        if (timeDiff > 10000) return false;
-
-        // Criterion 4: For status events, check transitions
-        if (["STATUS_UPDATED", "TRANSFER", "ATTESTED"].includes(event.type)) {
-          // Must have same statusFrom AND statusTo
-          if (existingEvent.statusFrom !== event.statusFrom) return false;
-          if (existingEvent.statusTo !== event.statusTo) return false;
-        }
-
-        return true; // All criteria matched
-      });
-
-      if (isDuplicate) {
-        console.log(
-          `[Store] Duplicate blocked: ${event.type} for product ${id}`
-        );
-        return null;
-      }
+      // Replays (resync, reloadProductEvents) hit this for every known log: stay quiet
+      if (!eventDedup.claim(toRaw(product), event)) return null;
 
       product.events.push(event);
       return event;
@@ -188,6 +219,13 @@ export const useProductsStore = defineStore("products", {
       };
 
       this.products.push(newProduct);
+      this.productsById.set(nextId, newProduct);
+      indexAdd(this.idsByStatus, newProduct.status, nextId);
+      indexAdd(
+        this.idsByHolder,
+        holderKey(newProduct.currentHolderAddress),
+        nextId
+      );
       return newProduct;
     },
   },
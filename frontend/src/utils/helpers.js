@@ -29,3 +29,32 @@ export function hashAddress(address) {
   }
   return ethers.keccak256(ethers.toUtf8Bytes(address.toLowerCase().trim()));
 }
+
+/**
+ * Limit how many async tasks run at once
+ * @param {number} concurrency - Max tasks in flight
+ * @returns {Function} limit(task) → Promise of task()'s result
+ */
+export function createLimiter(concurrency) {
+  const queue = [];
+  let active = 0;
+
+  function next() {
+    if (active >= concurrency || queue.length === 0) return;
+    active++;
+    const { task, resolve, reject } = queue.shift();
+    Promise.resolve()
+      .then(task)
+      .then(resolve, reject)
+      .finally(() => {
+        active--;
+        next();
+      });
+  }
+
+  return (task) =>
+    new Promise((resolve, reject) => {
+      queue.push({ task, resolve, reject });
+      next();
+    });
+}
@@ -0,0 +1,118 @@
+/**
+ * Windowing math for virtual lists (tables, timelines)
+ *
+ * Row heights:
+ * - Every row starts at an estimated height; rendered rows report their real
+ *   height and only that row's entry changes
+ * - Stored in a Fenwick (binary indexed) tree, so the offset of a row and the
+ *   row under a scroll offset are both O(log n); nothing is re-summed when a
+ *   single row is measured or the list grows
+ *
+ * No Vue imports: composables/useVirtualList.js wraps this for components and
+ * scripts/bench-virtual-list.mjs runs it under plain Node
+ */
+
+export function createHeightIndex(estimate) {
+  let count = 0;
+  let capacity = 0;
+  let heights = new Float64Array(0);
+  let tree = new Float64Array(1); // 1-based
+
+  function rebuild(newCapacity) {
+    const old = heights;
+    heights = new Float64Array(newCapacity).fill(estimate);
+    heights.set(old.subarray(0, count));
+    capacity = newCapacity;
+    // O(n) build: every node pushes its sum to its parent once
+    tree = new Float64Array(capacity + 1);
+    for (let i = 1; i <= capacity; i++) {
+      tree[i] += heights[i - 1];
+      const parent = i + (i & -i);
+      if (parent <= capacity) tree[parent] += tree[i];
+    }
+  }
+
+  function add(index, delta) {
+    for (let i = index + 1; i <= capacity; i += i & -i) tree[i] += delta;
+  }
+
+  // Sum of heights of rows [0, index)
+  function prefix(index) {
+    let sum = 0;
+    for (let i = index; i > 0; i -= i & -i) sum += tree[i];
+    return sum;
+  }
+
+  return {
+    get count() {
+      return count;
+    },
+
+    /** Grow or shrink to n rows; new rows start at the estimate */
+    resize(n) {
+      if (n > capacity) rebuild(Math.max(n, capacity * 2, 64));
+      for (let i = n; i < count; i++) {
+        add(i, estimate - heights[i]);
+        heights[i] = estimate;
+      }
+      count = n;
+    },
+
+    /** Record a rendered row's height; false if nothing changed */
+    set(index, height) {
+      if (index >= count || heights[index] === height) return false;
+      add(index, height - heights[index]);
+      heights[index] = height;
+      return true;
+    },
+
+    offsetOf(index) {
+      return prefix(Math.min(index, count));
+    },
+
+    total() {
+      return prefix(count);
+    },
+
+    /** Row containing offset (clamped to the last row) */
+    indexAt(offset) {
+      if (count === 0) return 0;
+      let index = 0;
+      let step = 1;
+      while (step * 2 <= capacity) step *= 2;
+      for (; step > 0; step >>= 1) {
+        const next = index + step;
+        if (next <= capacity && tree[next] <= offset) {
+          index = next;
+          offset -= tree[next];
+        }
+      }
+      return Math.min(index, count - 1);
+    },
+  };
+}
+
+/**
+ * Rows to render for a viewport, with padding for the rows outside it.
+ * @param {object} heights - createHeightIndex() instance
+ * @param {number} scrollTop - Viewport scroll offset in px
+ * @param {number} viewportHeight - Viewport height in px
+ * @param {number} overscan - Extra rows rendered above and below
+ * @returns {{start: number, end: number, padTop: number, padBottom: number}}
+ */
+export function visibleRange(heights, scrollTop, viewportHeight, overscan = 4) {
+  const count = heights.count;
+  if (count === 0) return { start: 0, end: 0, padTop: 0, padBottom: 0 };
+
+  const first = heights.indexAt(Math.max(0, scrollTop));
+  const last = heights.indexAt(Math.max(0, scrollTop + viewportHeight));
+  const start = Math.max(0, first - overscan);
+  const end = Math.min(count, last + 1 + overscan);
+  const padTop = heights.offsetOf(start);
+  return {
+    start,
+    end,
+    padTop,
+    padBottom: heights.total() - heights.offsetOf(end),
+  };
+}
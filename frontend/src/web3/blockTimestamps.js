@@ -0,0 +1,114 @@
+/**
+ * Block number → timestamp cache
+ *
+ * - Bounded LRU (Map insertion order), one per chain
+ * - Persisted to localStorage so a reload does not refetch known blocks
+ *   (memory only inside the sync worker, which has no localStorage)
+ * - getBlockTimestamps() dedupes block numbers and fetches misses concurrently
+ */
+
+const MAX_ENTRIES = 5000;
+const FETCH_CONCURRENCY = 8;
+const STORAGE_PREFIX = "agrichain_block_ts_";
+const PERSIST_DELAY_MS = 500;
+
+const caches = new Map(); // chainId → Map(blockNumber → timestamp)
+const persistTimers = new Map();
+const canPersist = typeof localStorage !== "undefined";
+
+export const blockTimestampStats = { hits: 0, fetches: 0 };
+
+function remember(cache, blockNumber, timestamp) {
+  cache.delete(blockNumber);
+  cache.set(blockNumber, timestamp);
+  while (cache.size > MAX_ENTRIES) {
+    cache.delete(cache.keys().next().value);
+  }
+}
+
+function cacheFor(chainId) {
+  if (caches.has(chainId)) return caches.get(chainId);
+
+  const cache = new Map();
+  caches.set(chainId, cache);
+  if (!canPersist) return cache;
+  try {
+    const stored = JSON.parse(
+      localStorage.getItem(STORAGE_PREFIX + chainId) || "[]"
+    );
+    for (const [blockNumber, timestamp] of stored) {
+      remember(cache, blockNumber, timestamp);
+    }
+  } catch (error) {
+    console.warn("[blockTimestamps] Ignoring corrupt cache:", error.message);
+  }
+  return cache;
+}
+
+function schedulePersist(chainId) {
+  if (!canPersist || persistTimers.has(chainId)) return;
+  persistTimers.set(
+    chainId,
+    setTimeout(() => {
+      persistTimers.delete(chainId);
+      try {
+        localStorage.setItem(
+          STORAGE_PREFIX + chainId,
+          JSON.stringify([...cacheFor(chainId)])
+        );
+      } catch (error) {
+        console.warn("[blockTimestamps] Persist failed:", error.message);
+      }
+    }, PERSIST_DELAY_MS)
+  );
+}
+
+/**
+ * Resolve timestamps for many blocks: one getBlock per distinct unknown block,
+ * at most FETCH_CONCURRENCY in flight. Returns Map(blockNumber → seconds).
+ */
+export async function getBlockTimestamps(provider, blockNumbers) {
+  const chainId = (await provider.getNetwork()).chainId.toString();
+  const cache = cacheFor(chainId);
+  const result = new Map();
+  const missing = [];
+
+  for (const blockNumber of new Set(blockNumbers)) {
+    if (cache.has(blockNumber)) {
+      const timestamp = cache.get(blockNumber);
+      remember(cache, blockNumber, timestamp);
+      result.set(blockNumber, timestamp);
+      blockTimestampStats.hits++;
+    } else {
+      missing.push(blockNumber);
+    }
+  }
+
+  let next = 0;
+  async function worker() {
+    while (next < missing.length) {
+      const blockNumber = missing[next++];
+      const block = await provider.getBlock(blockNumber);
+      blockTimestampStats.fetches++;
+      remember(cache, blockNumber, block.timestamp);
+      result.set(blockNumber, block.timestamp);
+    }
+  }
+  await Promise.all(
+    Array.from({ length: Math.min(FETCH_CONCURRENCY, missing.length) }, worker)
+  );
+
+  if (missing.length > 0) schedulePersist(chainId);
+  return result;
+}
+
+// Local chain reset: block numbers now point at different blocks
+export function clearBlockTimestamps(chainId) {
+  const key = chainId.toString();
+  caches.delete(key);
+  try {
+    localStorage.removeItem(STORAGE_PREFIX + key);
+  } catch {
+    // Nothing persisted
+  }
+}
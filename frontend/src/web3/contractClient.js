@@ -5,6 +5,9 @@ if (!CONTRACT_ADDRESS || !CONTRACT_ABI) {
   throw new Error("CONTRACT_ADDRESS hoặc CONTRACT_ABI chưa được cấu hình.");
 }
 
+const RECALLED_STATUS = 7;
+const QUARANTINE_VAULT = "0x000000000000000000000000000000000000dead";
+
 let cachedProvider = null;
 let cachedReadOnlyContract = null; // 👈 THÊM: Cache contract instance
 
@@ -101,3 +104,99 @@ export async function checkProductExists(id) {
     return false;
   }
 }
+
+export async function getOwnedTokenIds(owner) {
+  try {
+    const contract = getReadOnlyContract();
+    // ✅ ERC721Enumerable: walk the owner's index instead of scanning every token
+    const balance = Number(await contract.balanceOf(owner));
+    const ids = await Promise.all(
+      Array.from({ length: balance }, (_, i) =>
+        contract.tokenOfOwnerByIndex(owner, i)
+      )
+    );
+    return ids.map(Number);
+  } catch (error) {
+    console.error("[web3] Lỗi getOwnedTokenIds:", error);
+    throw error;
+  }
+}
+
+export async function getBatchesWithStatus(status) {
+  try {
+    const contract = getReadOnlyContract();
+    // ✅ Per-status set: k reads for a work queue instead of scanning every batch
+    const [total, pageSize] = await Promise.all([
+      contract.statusBatchCount(status),
+      contract.get_MAX_BATCH_PAGE(),
+    ]);
+    const batches = [];
+    for (let offset = 0; offset < Number(total); offset += Number(pageSize)) {
+      const page = await contract.getBatchesByStatus(status, offset, pageSize);
+      for (const b of page) {
+        batches.push({
+          id: Number(b.id),
+          owner: b.owner,
+          status: Number(b.status),
+          uri: b.uri,
+        });
+      }
+    }
+    return batches;
+  } catch (error) {
+    console.error("[web3] Lỗi getBatchesWithStatus:", error);
+    throw error;
+  }
+}
+
+// Quarantine keeps the RECALLED status, so the RECALLED set also holds batches
+// already in the vault: the work queue is the ones still owned elsewhere
+export async function getRecalledAwaitingQuarantine() {
+  const recalled = await getBatchesWithStatus(RECALLED_STATUS);
+  return recalled.filter(
+    (batch) => batch.owner.toLowerCase() !== QUARANTINE_VAULT
+  );
+}
+
+// calls: [{ method: "tokenURI", args: [1] }, ...] → decoded values (null if reverted)
+// contract: any read-only AgriChain instance (the sync worker passes its own)
+export async function multicallRead(calls, contract = getReadOnlyContract()) {
+  try {
+    const iface = contract.interface;
+    const chunkSize = Number(await contract.get_MAX_MULTICALL());
+    const results = [];
+    for (let start = 0; start < calls.length; start += chunkSize) {
+      const chunk = calls.slice(start, start + chunkSize);
+      const responses = await contract.multicall(
+        chunk.map(({ method, args = [] }) =>
+          iface.encodeFunctionData(method, args)
+        )
+      );
+      responses.forEach((response, i) => {
+        if (!response.success) {
+          results.push(null);
+          return;
+        }
+        const decoded = iface.decodeFunctionResult(
+          chunk[i].method,
+          response.returnData
+        );
+        results.push(decoded.length === 1 ? decoded[0] : decoded);
+      });
+    }
+    return results;
+  } catch (error) {
+    console.error("[web3] Lỗi multicallRead:", error);
+    throw error;
+  }
+}
+
+// Current owner/status/uri of arbitrary batch ids in one multicall
+// (getBatchesInRange(id, 1) per id); unknown ids are skipped
+export async function getBatchesByIds(ids, contract = getReadOnlyContract()) {
+  const views = await multicallRead(
+    ids.map((id) => ({ method: "getBatchesInRange", args: [id, 1] })),
+    contract
+  );
+  return views.filter((view) => view && view.length > 0).map((view) => view[0]);
+}
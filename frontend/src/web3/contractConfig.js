@@ -265,6 +265,50 @@ export const CONTRACT_ABI = [
     ],
     "outputs": []
   },
+  {
+    "type": "function",
+    "name": "grantRoles",
+    "stateMutability": "nonpayable",
+    "inputs": [
+      {
+        "name": "_assignments",
+        "type": "tuple[]",
+        "components": [
+          {
+            "name": "role",
+            "type": "bytes32"
+          },
+          {
+            "name": "account",
+            "type": "address"
+          }
+        ]
+      }
+    ],
+    "outputs": []
+  },
+  {
+    "type": "function",
+    "name": "revokeRoles",
+    "stateMutability": "nonpayable",
+    "inputs": [
+      {
+        "name": "_assignments",
+        "type": "tuple[]",
+        "components": [
+          {
+            "name": "role",
+            "type": "bytes32"
+          },
+          {
+            "name": "account",
+            "type": "address"
+          }
+        ]
+      }
+    ],
+    "outputs": []
+  },
   {
     "type": "function",
     "name": "hasRole",
@@ -303,6 +347,23 @@ export const CONTRACT_ABI = [
       }
     ]
   },
+  {
+    "type": "function",
+    "name": "mintBatches",
+    "stateMutability": "nonpayable",
+    "inputs": [
+      {
+        "name": "_uris",
+        "type": "string[]"
+      }
+    ],
+    "outputs": [
+      {
+        "name": "",
+        "type": "uint256[]"
+      }
+    ]
+  },
   {
     "type": "function",
     "name": "markBatchInspected",
@@ -331,6 +392,18 @@ export const CONTRACT_ABI = [
     ],
     "outputs": []
   },
+  {
+    "type": "function",
+    "name": "advanceBatchRetailStatusMany",
+    "stateMutability": "nonpayable",
+    "inputs": [
+      {
+        "name": "_batchIds",
+        "type": "uint256[]"
+      }
+    ],
+    "outputs": []
+  },
   {
     "type": "function",
     "name": "markBatchRecalled",
@@ -427,6 +500,26 @@ export const CONTRACT_ABI = [
     ],
     "outputs": []
   },
+  {
+    "type": "function",
+    "name": "batchTransferFrom",
+    "stateMutability": "nonpayable",
+    "inputs": [
+      {
+        "name": "_from",
+        "type": "address"
+      },
+      {
+        "name": "_to",
+        "type": "address"
+      },
+      {
+        "name": "_tokenIds",
+        "type": "uint256[]"
+      }
+    ],
+    "outputs": []
+  },
   {
     "type": "function",
     "name": "approve",
@@ -531,6 +624,73 @@ export const CONTRACT_ABI = [
       }
     ]
   },
+  {
+    "type": "function",
+    "name": "tokenOwner",
+    "stateMutability": "view",
+    "inputs": [
+      {
+        "name": "_tokenId",
+        "type": "uint256"
+      }
+    ],
+    "outputs": [
+      {
+        "name": "",
+        "type": "address"
+      }
+    ]
+  },
+  {
+    "type": "function",
+    "name": "totalSupply",
+    "stateMutability": "view",
+    "inputs": [],
+    "outputs": [
+      {
+        "name": "",
+        "type": "uint256"
+      }
+    ]
+  },
+  {
+    "type": "function",
+    "name": "tokenByIndex",
+    "stateMutability": "view",
+    "inputs": [
+      {
+        "name": "_index",
+        "type": "uint256"
+      }
+    ],
+    "outputs": [
+      {
+        "name": "",
+        "type": "uint256"
+      }
+    ]
+  },
+  {
+    "type": "function",
+    "name": "tokenOfOwnerByIndex",
+    "stateMutability": "view",
+    "inputs": [
+      {
+        "name": "_owner",
+        "type": "address"
+      },
+      {
+        "name": "_index",
+        "type": "uint256"
+      }
+    ],
+    "outputs": [
+      {
+        "name": "",
+        "type": "uint256"
+      }
+    ]
+  },
   {
     "type": "function",
     "name": "tokenURI",
@@ -692,6 +852,23 @@ export const CONTRACT_ABI = [
       }
     ]
   },
+  {
+    "type": "function",
+    "name": "batchStatus",
+    "stateMutability": "view",
+    "inputs": [
+      {
+        "name": "_batchId",
+        "type": "uint256"
+      }
+    ],
+    "outputs": [
+      {
+        "name": "",
+        "type": "uint256"
+      }
+    ]
+  },
   {
     "type": "function",
     "name": "getBatchStatus",
@@ -709,6 +886,175 @@ export const CONTRACT_ABI = [
       }
     ]
   },
+  {
+    "type": "function",
+    "name": "get_MAX_BATCH_PAGE",
+    "stateMutability": "view",
+    "inputs": [],
+    "outputs": [
+      {
+        "name": "",
+        "type": "uint256"
+      }
+    ]
+  },
+  {
+    "type": "function",
+    "name": "get_MAX_MINT_BATCH",
+    "stateMutability": "view",
+    "inputs": [],
+    "outputs": [
+      {
+        "name": "",
+        "type": "uint256"
+      }
+    ]
+  },
+  {
+    "type": "function",
+    "name": "get_MAX_BULK_BATCHES",
+    "stateMutability": "view",
+    "inputs": [],
+    "outputs": [
+      {
+        "name": "",
+        "type": "uint256"
+      }
+    ]
+  },
+  {
+    "type": "function",
+    "name": "get_MAX_MULTICALL",
+    "stateMutability": "view",
+    "inputs": [],
+    "outputs": [
+      {
+        "name": "",
+        "type": "uint256"
+      }
+    ]
+  },
+  {
+    "type": "function",
+    "name": "get_MAX_ROLE_BATCH",
+    "stateMutability": "view",
+    "inputs": [],
+    "outputs": [
+      {
+        "name": "",
+        "type": "uint256"
+      }
+    ]
+  },
+  {
+    "type": "function",
+    "name": "getBatchesInRange",
+    "stateMutability": "view",
+    "inputs": [
+      {
+        "name": "_start",
+        "type": "uint256"
+      },
+      {
+        "name": "_count",
+        "type": "uint256"
+      }
+    ],
+    "outputs": [
+      {
+        "name": "",
+        "type": "tuple[]",
+        "components": [
+          {
+            "name": "id",
+            "type": "uint256"
+          },
+          {
+            "name": "owner",
+            "type": "address"
+          },
+          {
+            "name": "status",
+            "type": "uint256"
+          },
+          {
+            "name": "uri",
+            "type": "string"
+          }
+        ]
+      }
+    ]
+  },
+  {
+    "type": "function",
+    "name": "getBatchesByStatus",
+    "stateMutability": "view",
+    "inputs": [
+      {
+        "name": "_status",
+        "type": "uint256"
+      },
+      {
+        "name": "_offset",
+        "type": "uint256"
+      },
+      {
+        "name": "_count",
+        "type": "uint256"
+      }
+    ],
+    "outputs": [
+      {
+        "name": "",
+        "type": "tuple[]",
+        "components": [
+          {
+            "name": "id",
+            "type": "uint256"
+          },
+          {
+            "name": "owner",
+            "type": "address"
+          },
+          {
+            "name": "status",
+            "type": "uint256"
+          },
+          {
+            "name": "uri",
+            "type": "string"
+          }
+        ]
+      }
+    ]
+  },
+  {
+    "type": "function",
+    "name": "multicall",
+    "stateMutability": "view",
+    "inputs": [
+      {
+        "name": "_calls",
+        "type": "bytes[]"
+      }
+    ],
+    "outputs": [
+      {
+        "name": "",
+        "type": "tuple[]",
+        "components": [
+          {
+            "name": "success",
+            "type": "bool"
+          },
+          {
+            "name": "returnData",
+            "type": "bytes"
+          }
+        ]
+      }
+    ]
+  },
   {
     "type": "function",
     "name": "supportsInterface",
@@ -752,39 +1098,39 @@ export const CONTRACT_ABI = [
   },
   {
     "type": "function",
-    "name": "tokenOwner",
+    "name": "operatorApprovals",
     "stateMutability": "view",
     "inputs": [
       {
         "name": "arg0",
-        "type": "uint256"
+        "type": "address"
+      },
+      {
+        "name": "arg1",
+        "type": "address"
       }
     ],
     "outputs": [
       {
         "name": "",
-        "type": "address"
+        "type": "bool"
       }
     ]
   },
   {
     "type": "function",
-    "name": "operatorApprovals",
+    "name": "statusBatchCount",
     "stateMutability": "view",
     "inputs": [
       {
-        "name": "arg0",
-        "type": "address"
-      },
-      {
-        "name": "arg1",
-        "type": "address"
+        "name": "_status",
+        "type": "uint256"
       }
     ],
     "outputs": [
       {
         "name": "",
-        "type": "bool"
+        "type": "uint256"
       }
     ]
   },
@@ -831,39 +1177,39 @@ export const CONTRACT_ABI = [
   },
   {
     "type": "function",
-    "name": "batchStatus",
+    "name": "roles",
     "stateMutability": "view",
     "inputs": [
       {
         "name": "arg0",
-        "type": "uint256"
+        "type": "bytes32"
+      },
+      {
+        "name": "arg1",
+        "type": "address"
       }
     ],
     "outputs": [
       {
         "name": "",
-        "type": "uint256"
+        "type": "bool"
       }
     ]
   },
   {
     "type": "function",
-    "name": "roles",
+    "name": "roleMask",
     "stateMutability": "view",
     "inputs": [
       {
         "name": "arg0",
-        "type": "bytes32"
-      },
-      {
-        "name": "arg1",
         "type": "address"
       }
     ],
     "outputs": [
       {
         "name": "",
-        "type": "bool"
+        "type": "uint256"
       }
     ]
   },
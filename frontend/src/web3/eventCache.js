@@ -0,0 +1,94 @@
+/**
+ * IndexedDB cache for synced contract logs
+ *
+ * - checkpoints: { key, lastBlock } - last fully processed block per contract
+ * - logs: decoded timeline logs, keyed by contract + txHash + logIndex
+ *
+ * A page of logs and its checkpoint are written in one transaction, so an
+ * interrupted sync resumes at a page boundary without gaps or duplicates.
+ */
+
+const DB_NAME = "agrichain-sync";
+const DB_VERSION = 1;
+const CHECKPOINTS = "checkpoints";
+const LOGS = "logs";
+
+let dbPromise = null;
+
+function requestToPromise(request) {
+  return new Promise((resolve, reject) => {
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+function transactionDone(tx) {
+  return new Promise((resolve, reject) => {
+    tx.oncomplete = () => resolve();
+    tx.onabort = () => reject(tx.error);
+    tx.onerror = () => reject(tx.error);
+  });
+}
+
+function openDb() {
+  if (dbPromise) return dbPromise;
+
+  if (typeof indexedDB === "undefined") {
+    return Promise.reject(new Error("IndexedDB not available"));
+  }
+
+  const request = indexedDB.open(DB_NAME, DB_VERSION);
+  request.onupgradeneeded = () => {
+    const db = request.result;
+    if (!db.objectStoreNames.contains(CHECKPOINTS)) {
+      db.createObjectStore(CHECKPOINTS, { keyPath: "key" });
+    }
+    if (!db.objectStoreNames.contains(LOGS)) {
+      const logs = db.createObjectStore(LOGS, { keyPath: "id" });
+      logs.createIndex("byContract", "contract");
+    }
+  };
+  dbPromise = requestToPromise(request).catch((error) => {
+    dbPromise = null;
+    throw error;
+  });
+  return dbPromise;
+}
+
+export async function loadCheckpoint(contractKey) {
+  const db = await openDb();
+  const tx = db.transaction(CHECKPOINTS, "readonly");
+  const row = await requestToPromise(tx.objectStore(CHECKPOINTS).get(contractKey));
+  return row ? row.lastBlock : null;
+}
+
+export async function loadCachedLogs(contractKey) {
+  const db = await openDb();
+  const tx = db.transaction(LOGS, "readonly");
+  const index = tx.objectStore(LOGS).index("byContract");
+  return requestToPromise(index.getAll(contractKey));
+}
+
+// Persist one page of logs together with the block it was synced up to
+export async function saveSyncPage(contractKey, logs, lastBlock) {
+  const db = await openDb();
+  const tx = db.transaction([LOGS, CHECKPOINTS], "readwrite");
+  const logStore = tx.objectStore(LOGS);
+  for (const log of logs) {
+    logStore.put({ ...log, contract: contractKey });
+  }
+  tx.objectStore(CHECKPOINTS).put({ key: contractKey, lastBlock });
+  await transactionDone(tx);
+}
+
+export async function clearContractCache(contractKey) {
+  const db = await openDb();
+  const tx = db.transaction([LOGS, CHECKPOINTS], "readwrite");
+  const index = tx.objectStore(LOGS).index("byContract");
+  const keys = await requestToPromise(index.getAllKeys(contractKey));
+  for (const key of keys) {
+    tx.objectStore(LOGS).delete(key);
+  }
+  tx.objectStore(CHECKPOINTS).delete(contractKey);
+  await transactionDone(tx);
+}
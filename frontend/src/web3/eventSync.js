@@ -0,0 +1,238 @@
+import { clearBlockTimestamps, getBlockTimestamps } from "./blockTimestamps";
+import {
+  clearContractCache,
+  loadCachedLogs,
+  loadCheckpoint,
+  saveSyncPage,
+} from "./eventCache";
+
+/**
+ * Incremental, checkpointed log sync
+ *
+ * - First run walks the whole history from VITE_CONTRACT_DEPLOY_BLOCK (default 0)
+ * - One eth_getLogs per page: contract address + OR of the timeline event topics,
+ *   decoded through the contract ABI into a single (block, logIndex) ordered stream
+ * - Every page is persisted with its checkpoint, so later runs fetch only the delta
+ * - Page size adapts: halves on provider "too many results" errors, grows back after
+ * - Falls back to an in-memory cache when IndexedDB is unavailable
+ */
+
+export const TIMELINE_EVENTS = [
+  "BatchMinted",
+  "BatchInspected",
+  "StatusUpdated",
+  "BatchRecalled",
+  "Transfer",
+];
+
+const DEPLOY_BLOCK = Number(import.meta.env.VITE_CONTRACT_DEPLOY_BLOCK || 0);
+const INITIAL_CHUNK = 5000;
+const MAX_CHUNK = 100000;
+
+let chunkSize = INITIAL_CHUNK;
+let chunkCeiling = MAX_CHUNK; // largest range the provider has accepted
+const inFlight = new Map();
+const memoryCache = new Map(); // contractKey → { lastBlock, logs }
+
+function isRangeLimitError(error) {
+  const code = error?.error?.code ?? error?.info?.error?.code;
+  const text = [
+    error?.message,
+    error?.error?.message,
+    error?.info?.error?.message,
+  ]
+    .filter(Boolean)
+    .join(" ")
+    .toLowerCase();
+  return (
+    code === -32005 ||
+    /too many|limit exceeded|block range|range is too|more than|response size/.test(
+      text
+    )
+  );
+}
+
+function serializeArgs(fragment, args) {
+  const out = {};
+  fragment.inputs.forEach((input, i) => {
+    const value = args[i];
+    out[input.name] = typeof value === "bigint" ? value.toString() : value;
+  });
+  return out;
+}
+
+function toRecord(contractKey, log, parsed, timestamp) {
+  return {
+    id: `${contractKey}:${log.transactionHash}:${log.index}`,
+    eventName: parsed.name,
+    blockNumber: log.blockNumber,
+    logIndex: log.index,
+    transactionHash: log.transactionHash,
+    args: serializeArgs(parsed.fragment, parsed.args),
+    timestamp,
+  };
+}
+
+export function compareLogs(a, b) {
+  return a.blockNumber - b.blockNumber || a.logIndex - b.logIndex;
+}
+
+// Single request for every timeline event in the range, in chain order
+async function queryRange(contract, address, fromBlock, toBlock) {
+  const iface = contract.interface;
+  const topics = TIMELINE_EVENTS.map((name) => iface.getEvent(name).topicHash);
+  const logs = await contract.runner.provider.getLogs({
+    address,
+    topics: [topics],
+    fromBlock,
+    toBlock,
+  });
+
+  const decoded = [];
+  for (const log of logs) {
+    const parsed = iface.parseLog(log);
+    if (parsed) decoded.push({ log, parsed });
+  }
+  // Nodes return logs in order already; sort anyway so the stream never depends on it
+  return decoded.sort(
+    (a, b) => a.log.blockNumber - b.log.blockNumber || a.log.index - b.log.index
+  );
+}
+
+// IndexedDB first, in-memory fallback (private windows, old browsers)
+const cache = {
+  async checkpoint(key) {
+    try {
+      return await loadCheckpoint(key);
+    } catch {
+      return memoryCache.get(key)?.lastBlock ?? null;
+    }
+  },
+  async logs(key) {
+    try {
+      return await loadCachedLogs(key);
+    } catch {
+      return memoryCache.get(key)?.logs ?? [];
+    }
+  },
+  async save(key, logs, lastBlock) {
+    try {
+      await saveSyncPage(key, logs, lastBlock);
+    } catch (error) {
+      console.warn("[eventSync] IndexedDB unavailable, caching in memory:", error.message);
+      const entry = memoryCache.get(key) || { lastBlock: null, logs: [] };
+      entry.logs.push(...logs);
+      entry.lastBlock = lastBlock;
+      memoryCache.set(key, entry);
+    }
+  },
+  async clear(key) {
+    memoryCache.delete(key);
+    try {
+      await clearContractCache(key);
+    } catch {
+      // Nothing persisted
+    }
+  },
+};
+
+async function runSync(
+  contract,
+  address,
+  chainId,
+  contractKey,
+  head,
+  onProgress
+) {
+  const provider = contract.runner.provider;
+  let checkpoint = await cache.checkpoint(contractKey);
+  if (checkpoint !== null && checkpoint > head) {
+    // Local chain was reset under the same contract address
+    console.warn(`[eventSync] Checkpoint ${checkpoint} is past head ${head}, resyncing`);
+    await cache.clear(contractKey);
+    clearBlockTimestamps(chainId);
+    checkpoint = null;
+  }
+
+  const fresh = [];
+  let start = checkpoint === null ? DEPLOY_BLOCK : checkpoint + 1;
+
+  while (start <= head) {
+    const end = Math.min(head, start + chunkSize - 1);
+    let events;
+    try {
+      events = await queryRange(contract, address, start, end);
+    } catch (error) {
+      if (isRangeLimitError(error) && chunkSize > 1) {
+        chunkSize = Math.max(1, Math.floor(chunkSize / 2));
+        chunkCeiling = chunkSize;
+        console.warn(`[eventSync] Range too large, retrying with ${chunkSize} blocks`);
+        continue;
+      }
+      throw error;
+    }
+
+    // One getBlock per distinct block (cached across pages and sessions)
+    const timestamps = await getBlockTimestamps(
+      provider,
+      events.map(({ log }) => log.blockNumber)
+    );
+    const records = events.map(({ log, parsed }) =>
+      toRecord(contractKey, log, parsed, timestamps.get(log.blockNumber))
+    );
+    await cache.save(contractKey, records, end);
+    fresh.push(...records);
+
+    if (onProgress) {
+      onProgress({ fromBlock: start, toBlock: end, head, logs: records.length });
+    }
+    start = end + 1;
+    chunkSize = Math.min(chunkCeiling, chunkSize * 2);
+  }
+
+  return { fresh, lastBlock: head };
+}
+
+/**
+ * Bring the local log cache up to the chain head and return every cached log
+ * in (blockNumber, logIndex) order. Concurrent callers share one sync per
+ * contract, so a checkpoint is never walked twice and no log is returned twice.
+ * includeCached: false returns only the logs fetched by that sync (the delta
+ * since the checkpoint), without reading the whole cache back.
+ */
+export async function syncContractEvents(
+  contract,
+  { onProgress, includeCached = true } = {}
+) {
+  const provider = contract.runner.provider;
+  const [network, head, address] = await Promise.all([
+    provider.getNetwork(),
+    provider.getBlockNumber(),
+    contract.getAddress(),
+  ]);
+  const contractKey = `${network.chainId}:${address.toLowerCase()}`;
+
+  if (!inFlight.has(contractKey)) {
+    const sync = runSync(
+      contract,
+      address,
+      network.chainId,
+      contractKey,
+      head,
+      onProgress
+    ).finally(() => inFlight.delete(contractKey));
+    inFlight.set(contractKey, sync);
+  }
+  const { fresh, lastBlock } = await inFlight.get(contractKey);
+
+  // The full view is read back once the shared sync has saved its pages
+  const logs = includeCached
+    ? [...(await cache.logs(contractKey))].sort(compareLogs)
+    : fresh;
+  return {
+    logs,
+    cachedCount: logs.length - fresh.length,
+    freshCount: fresh.length,
+    lastBlock,
+  };
+}
@@ -0,0 +1,107 @@
+import { reactive } from "vue";
+
+/**
+ * Content-addressed IPFS cache (IndexedDB)
+ *
+ * IPFS content never changes for a given CID, so entries are never
+ * invalidated or refetched. A session Map sits in front of IndexedDB and
+ * concurrent requests for the same CID share one fetch.
+ */
+
+const DB_NAME = "agrichain-ipfs";
+const DB_VERSION = 1;
+const METADATA = "metadata";
+
+export const ipfsCacheStats = reactive({ hits: 0, misses: 0 });
+
+const memory = new Map(); // path → metadata
+const pending = new Map(); // path → Promise
+let dbPromise = null;
+
+function requestToPromise(request) {
+  return new Promise((resolve, reject) => {
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+function openDb() {
+  if (dbPromise) return dbPromise;
+
+  if (typeof indexedDB === "undefined") {
+    return Promise.reject(new Error("IndexedDB not available"));
+  }
+
+  const request = indexedDB.open(DB_NAME, DB_VERSION);
+  request.onupgradeneeded = () => {
+    request.result.createObjectStore(METADATA, { keyPath: "cid" });
+  };
+  dbPromise = requestToPromise(request).catch((error) => {
+    dbPromise = null;
+    throw error;
+  });
+  return dbPromise;
+}
+
+async function readEntry(cid) {
+  try {
+    const db = await openDb();
+    const tx = db.transaction(METADATA, "readonly");
+    const row = await requestToPromise(tx.objectStore(METADATA).get(cid));
+    return row ? row.value : undefined;
+  } catch {
+    return undefined;
+  }
+}
+
+async function writeEntry(cid, value) {
+  try {
+    const db = await openDb();
+    const tx = db.transaction(METADATA, "readwrite");
+    tx.objectStore(METADATA).put({ cid, value, storedAt: Date.now() });
+  } catch (error) {
+    console.warn("[IPFS cache] Persist failed:", error.message);
+  }
+}
+
+// "ipfs://<cid>[/path]" → "<cid>[/path]" (the path is content-addressed too)
+export function cidKey(uri) {
+  return uri.replace("ipfs://", "");
+}
+
+/**
+ * Return cached content for cid, or run fetcher() once and cache its result.
+ * Failed fetches are not cached.
+ */
+export async function getOrFetchByCid(cid, fetcher) {
+  if (memory.has(cid)) {
+    ipfsCacheStats.hits++;
+    return memory.get(cid);
+  }
+  if (pending.has(cid)) {
+    ipfsCacheStats.hits++;
+    return pending.get(cid);
+  }
+
+  const lookup = (async () => {
+    const stored = await readEntry(cid);
+    if (stored !== undefined) {
+      ipfsCacheStats.hits++;
+      return stored;
+    }
+
+    ipfsCacheStats.misses++;
+    const value = await fetcher();
+    await writeEntry(cid, value);
+    return value;
+  })();
+
+  pending.set(cid, lookup);
+  try {
+    const value = await lookup;
+    memory.set(cid, value);
+    return value;
+  } finally {
+    pending.delete(cid);
+  }
+}
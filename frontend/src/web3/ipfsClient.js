@@ -4,6 +4,9 @@
  * Pinata API Documentation: https://docs.pinata.cloud/
  */
 
+import { cidKey, getOrFetchByCid } from "./ipfsCache";
+import { ipfsGateways } from "./ipfsGateways";
+
 const PINATA_API_KEY = import.meta.env.VITE_PINATA_API_KEY;
 const PINATA_API_SECRET = import.meta.env.VITE_PINATA_API_SECRET;
 const PINATA_JWT = import.meta.env.VITE_PINATA_JWT;
@@ -72,7 +75,7 @@ export async function uploadMetadataToIPFS(metadata) {
 }
 
 /**
- * Fetch metadata từ IPFS
+ * Fetch metadata từ IPFS (cached by CID - content never changes)
  * @param {string} uri - URI dạng ipfs://CID
  * @returns {Promise<Object>} Metadata object
  */
@@ -81,20 +84,15 @@ export async function fetchMetadataFromIPFS(uri) {
     throw new Error("Invalid IPFS URI");
   }
 
-  try {
-    const cid = uri.replace("ipfs://", "");
-    const url = `${IPFS_GATEWAY}/ipfs/${cid}`;
-
-    console.log("[IPFS] Fetching metadata from:", url);
-
-    const response = await fetch(url);
-
-    if (!response.ok) {
-      throw new Error(`Failed to fetch from IPFS: ${response.statusText}`);
-    }
+  const cid = cidKey(uri);
+  return getOrFetchByCid(cid, () => fetchMetadataFromGateway(cid));
+}
 
+async function fetchMetadataFromGateway(cid) {
+  try {
+    const { response, gateway } = await ipfsGateways.fetchPath(cid);
     const metadata = await response.json();
-    console.log("[IPFS] ✅ Fetched metadata:", metadata);
+    console.log("[IPFS] ✅ Fetched metadata from:", gateway, metadata);
 
     return metadata;
   } catch (error) {
@@ -259,7 +257,7 @@ export async function uploadImageToIPFS(file, onProgress = null) {
 }
 
 /**
- * Fetch image từ IPFS với fallback gateways
+ * Fetch image từ IPFS (gateway racing + health scoring)
  * @param {string} cid - IPFS CID (có hoặc không có ipfs:// prefix)
  * @returns {Promise<Blob>} Image blob
  */
@@ -267,36 +265,15 @@ export async function fetchImageFromIPFS(cid) {
   // Remove ipfs:// prefix if exists
   const cleanCID = cid.replace("ipfs://", "");
 
-  const FALLBACK_GATEWAYS = [
-    "https://gateway.pinata.cloud/ipfs/",
-    "https://ipfs.io/ipfs/",
-    "https://cloudflare-ipfs.com/ipfs/",
-    "https://dweb.link/ipfs/",
-  ];
-
   console.log("[IPFS] Fetching image from IPFS:", cleanCID);
 
-  for (const gateway of FALLBACK_GATEWAYS) {
-    try {
-      const url = gateway + cleanCID;
-      const controller = new AbortController();
-      const timeoutId = setTimeout(() => controller.abort(), 10000); // 10s timeout
-
-      const response = await fetch(url, { signal: controller.signal });
-      clearTimeout(timeoutId);
-
-      if (response.ok) {
-        const blob = await response.blob();
-        console.log("[IPFS] ✅ Image fetched successfully from:", gateway);
-        return blob;
-      }
-    } catch (error) {
-      console.warn(`[IPFS] Gateway ${gateway} failed:`, error.message);
-      // Continue to next gateway
-    }
-  }
-
-  throw new Error("All IPFS gateways failed to fetch image");
+  // Healthiest gateways raced in parallel, losers aborted
+  const { response, gateway } = await ipfsGateways.fetchPath(cleanCID, {
+    timeoutMs: 10000,
+  });
+  const blob = await response.blob();
+  console.log("[IPFS] ✅ Image fetched successfully from:", gateway);
+  return blob;
 }
 
 /**
@@ -411,7 +388,7 @@ export async function uploadPDFToIPFS(file, onProgress = null) {
 }
 
 /**
- * Fetch PDF từ IPFS với fallback gateways
+ * Fetch PDF từ IPFS (gateway racing + health scoring)
  * @param {string} cid - IPFS CID (có hoặc không có ipfs:// prefix)
  * @returns {Promise<Blob>} PDF blob
  */
@@ -419,34 +396,13 @@ export async function fetchPDFFromIPFS(cid) {
   // Remove ipfs:// prefix if exists
   const cleanCID = cid.replace("ipfs://", "");
 
-  const FALLBACK_GATEWAYS = [
-    "https://gateway.pinata.cloud/ipfs/",
-    "https://ipfs.io/ipfs/",
-    "https://cloudflare-ipfs.com/ipfs/",
-    "https://dweb.link/ipfs/",
-  ];
-
   console.log("[IPFS] Fetching PDF from IPFS:", cleanCID);
 
-  for (const gateway of FALLBACK_GATEWAYS) {
-    try {
-      const url = gateway + cleanCID;
-      const controller = new AbortController();
-      const timeoutId = setTimeout(() => controller.abort(), 15000); // 15s timeout for PDF
-
-      const response = await fetch(url, { signal: controller.signal });
-      clearTimeout(timeoutId);
-
-      if (response.ok) {
-        const blob = await response.blob();
-        console.log("[IPFS] ✅ PDF fetched successfully from:", gateway);
-        return blob;
-      }
-    } catch (error) {
-      console.warn(`[IPFS] Gateway ${gateway} failed:`, error.message);
-      // Continue to next gateway
-    }
-  }
-
-  throw new Error("All IPFS gateways failed to fetch PDF");
+  // Healthiest gateways raced in parallel, losers aborted
+  const { response, gateway } = await ipfsGateways.fetchPath(cleanCID, {
+    timeoutMs: 15000,
+  });
+  const blob = await response.blob();
+  console.log("[IPFS] ✅ PDF fetched successfully from:", gateway);
+  return blob;
 }
@@ -0,0 +1,148 @@
+/**
+ * IPFS gateway manager
+ *
+ * - Races the top-k healthiest gateways; the first OK response wins and the
+ *   others are aborted via AbortController
+ * - Keeps rolling (EWMA) latency and error scores per gateway and re-ranks
+ *   after every request, so a slow or failing gateway sinks automatically
+ * - Gateways and fetch are injectable, so it runs against local HTTP stand-ins
+ */
+
+const DEFAULT_GATEWAYS = [
+  "https://gateway.pinata.cloud/ipfs/",
+  "https://ipfs.io/ipfs/",
+  "https://cloudflare-ipfs.com/ipfs/",
+  "https://dweb.link/ipfs/",
+];
+
+const EWMA_ALPHA = 0.3;
+const ERROR_PENALTY = 4; // an always-failing gateway ranks as 5x slower
+
+function normalizeGateway(url) {
+  const trimmed = url.replace(/\/+$/, "");
+  return trimmed.endsWith("/ipfs") ? `${trimmed}/` : `${trimmed}/ipfs/`;
+}
+
+function ewma(previous, sample) {
+  return previous === null ? sample : previous + EWMA_ALPHA * (sample - previous);
+}
+
+export function createGatewayManager({
+  gateways = DEFAULT_GATEWAYS,
+  raceWidth = 2,
+  timeoutMs = 10000,
+  fetchImpl = (...args) => fetch(...args),
+  now = () => performance.now(),
+} = {}) {
+  const health = new Map();
+  [...new Set(gateways.map(normalizeGateway))].forEach((gateway, order) => {
+    health.set(gateway, { gateway, order, latency: null, errorRate: 0, requests: 0 });
+  });
+
+  function score(entry) {
+    // Untried gateways keep their configured order ahead of measured slow ones
+    const latency = entry.latency ?? entry.order;
+    return latency * (1 + ERROR_PENALTY * entry.errorRate);
+  }
+
+  function ranked() {
+    return [...health.values()].sort((a, b) => score(a) - score(b));
+  }
+
+  function recordSuccess(entry, elapsed) {
+    entry.requests++;
+    entry.latency = ewma(entry.latency, elapsed);
+    entry.errorRate = ewma(entry.errorRate, 0);
+  }
+
+  // Aborted race loser: it was at least this slow, error rate unknown
+  function recordLoss(entry, elapsed) {
+    entry.requests++;
+    entry.latency = ewma(entry.latency, elapsed);
+  }
+
+  function recordFailure(entry, elapsed) {
+    entry.requests++;
+    entry.latency = ewma(entry.latency, elapsed);
+    entry.errorRate = ewma(entry.errorRate, 1);
+  }
+
+  // Race one group of gateways; resolves with the first OK response
+  function race(entries, path, requestTimeout) {
+    return new Promise((resolve, reject) => {
+      const controllers = entries.map(() => new AbortController());
+      const finished = entries.map(() => false);
+      let settled = false;
+      let failures = 0;
+      const start = now();
+
+      entries.forEach((entry, i) => {
+        const controller = controllers[i];
+        const timer = setTimeout(() => controller.abort(), requestTimeout);
+
+        fetchImpl(entry.gateway + path, { signal: controller.signal })
+          .then((response) => {
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            if (settled) return;
+            settled = true;
+            finished[i] = true;
+            recordSuccess(entry, now() - start);
+            controllers.forEach((other, j) => {
+              if (j === i || finished[j]) return;
+              recordLoss(entries[j], now() - start);
+              other.abort();
+            });
+            resolve({ response, gateway: entry.gateway });
+          })
+          .catch((error) => {
+            if (settled) return; // aborted loser, already scored
+            finished[i] = true;
+            recordFailure(entry, now() - start);
+            console.warn(`[IPFS] Gateway ${entry.gateway} failed:`, error.message);
+            if (++failures === entries.length) {
+              reject(new Error("All raced gateways failed"));
+            }
+          })
+          .finally(() => clearTimeout(timer));
+      });
+    });
+  }
+
+  /**
+   * Fetch "<cid>[/path]" from the healthiest gateways, raceWidth at a time.
+   * @returns {Promise<{response: Response, gateway: string}>}
+   */
+  async function fetchPath(path, options = {}) {
+    const width = options.raceWidth ?? raceWidth;
+    const requestTimeout = options.timeoutMs ?? timeoutMs;
+    const order = ranked();
+
+    for (let i = 0; i < order.length; i += width) {
+      try {
+        return await race(order.slice(i, i + width), path, requestTimeout);
+      } catch {
+        // Next group
+      }
+    }
+    throw new Error("All IPFS gateways failed");
+  }
+
+  function stats() {
+    return ranked().map(({ gateway, latency, errorRate, requests }) => ({
+      gateway,
+      latency: latency === null ? null : Math.round(latency),
+      errorRate: Math.round(errorRate * 100) / 100,
+      requests,
+    }));
+  }
+
+  return { fetchPath, stats };
+}
+
+// Shared instance: configured gateway first, public gateways as fallbacks
+const configuredGateway = import.meta.env.VITE_IPFS_GATEWAY;
+export const ipfsGateways = createGatewayManager({
+  gateways: configuredGateway
+    ? [configuredGateway, ...DEFAULT_GATEWAYS]
+    : DEFAULT_GATEWAYS,
+});
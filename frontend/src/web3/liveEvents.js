@@ -0,0 +1,213 @@
+/**
+ * Real-time contract log stream with per-batch coalescing and gap backfill
+ *
+ * - One log subscription (contract address + OR of the live event topics)
+ *   instead of one contract.on handler per event
+ * - Logs are buffered for `windowMs` and coalesced per batch id: a batch that
+ *   is minted, inspected and transferred inside one window is read once
+ * - Each flush reads every affected batch in one batched call (readBatches)
+ * - The last seen block is tracked; when the tab wakes up, the browser comes
+ *   back online or the wallet provider reconnects, the subscription is
+ *   re-installed and [lastBlock, head] is backfilled with eth_getLogs
+ * - Logs are deduped on (transactionHash, logIndex), so backfill overlapping
+ *   live delivery is harmless
+ */
+
+export const LIVE_EVENTS = [
+  "BatchMinted",
+  "BatchInspected",
+  "StatusUpdated",
+  "BatchRecalled",
+  "BatchArchived",
+  "Transfer",
+];
+
+const DEFAULT_WINDOW_MS = 250;
+const BACKFILL_CHUNK = 2000; // blocks per eth_getLogs during backfill
+const MAX_SEEN_LOGS = 10000;
+
+export const liveEventStats = {
+  received: 0,
+  duplicates: 0,
+  flushes: 0,
+  batchesRead: 0,
+  backfills: 0,
+  backfilledLogs: 0,
+};
+
+function logKey(log) {
+  return `${log.transactionHash}:${log.index ?? log.logIndex}`;
+}
+
+/**
+ * @param {object} contract - ethers Contract (read-only)
+ * @param {object} options
+ * @param {Function} options.readBatches - async (ids) → batch views, one call
+ * @param {Function} options.onFlush - ({ batches, logsByBatch }) per window
+ * @param {number} options.windowMs - Coalescing window
+ * @returns {{start: Function, stop: Function, backfill: Function, flush: Function}}
+ */
+export function createLiveEventStream(
+  contract,
+  { readBatches, onFlush, windowMs = DEFAULT_WINDOW_MS } = {}
+) {
+  const iface = contract.interface;
+  const provider = contract.runner.provider;
+  const topics = LIVE_EVENTS.map((name) => iface.getEvent(name).topicHash);
+
+  let filter = null;
+  let lastBlock = null;
+  let timer = null;
+  let backfilling = null;
+  let flushing = Promise.resolve();
+  let stopped = true;
+  const pending = new Map(); // batchId → decoded logs, in arrival order
+  const seen = new Set(); // recent logKeys (Set keeps insertion order)
+
+  function remember(key) {
+    seen.add(key);
+    if (seen.size > MAX_SEEN_LOGS) seen.delete(seen.values().next().value);
+  }
+
+  function enqueue(log) {
+    liveEventStats.received++;
+    if (log.removed) return;
+    const key = logKey(log);
+    if (seen.has(key)) {
+      liveEventStats.duplicates++;
+      return;
+    }
+    remember(key);
+    if (lastBlock === null || log.blockNumber > lastBlock) {
+      lastBlock = log.blockNumber;
+    }
+
+    const parsed = iface.parseLog(log);
+    if (!parsed) return;
+    const batchId = Number(parsed.args.batchId ?? parsed.args.tokenId);
+    if (!pending.has(batchId)) pending.set(batchId, []);
+    pending.get(batchId).push({ name: parsed.name, args: parsed.args, log });
+
+    if (timer === null) timer = setTimeout(flush, windowMs);
+  }
+
+  // Drain the buffer: one batched read for every batch touched in the window.
+  // Flushes are chained so a slow read never reorders two windows
+  function flush() {
+    if (timer !== null) clearTimeout(timer);
+    timer = null;
+    if (pending.size === 0) return flushing;
+
+    const logsByBatch = new Map(pending);
+    pending.clear();
+    flushing = flushing.then(async () => {
+      try {
+        const batches = await readBatches([...logsByBatch.keys()]);
+        liveEventStats.flushes++;
+        liveEventStats.batchesRead += logsByBatch.size;
+        await onFlush({ batches, logsByBatch });
+      } catch (error) {
+        console.error("[liveEvents] Flush failed:", error);
+      }
+    });
+    return flushing;
+  }
+
+  /** Replay logs emitted since the last seen block (missed while asleep) */
+  function backfill() {
+    if (backfilling) return backfilling;
+    backfilling = (async () => {
+      try {
+        const head = await provider.getBlockNumber();
+        if (lastBlock === null) {
+          lastBlock = head;
+          return 0;
+        }
+        const address = await contract.getAddress();
+        let count = 0;
+        // lastBlock itself is re-read: its remaining logs may not have arrived
+        for (let from = lastBlock; from <= head; from += BACKFILL_CHUNK) {
+          const to = Math.min(head, from + BACKFILL_CHUNK - 1);
+          const logs = await provider.getLogs({
+            address,
+            topics: [topics],
+            fromBlock: from,
+            toBlock: to,
+          });
+          for (const log of logs) enqueue(log);
+          count += logs.length;
+        }
+        lastBlock = Math.max(lastBlock, head);
+        liveEventStats.backfills++;
+        liveEventStats.backfilledLogs += count;
+        if (count > 0) {
+          console.log(`[liveEvents] Backfilled ${count} logs up to block ${head}`);
+        }
+        return count;
+      } catch (error) {
+        console.error("[liveEvents] Backfill failed:", error);
+        return 0;
+      } finally {
+        backfilling = null;
+      }
+    })();
+    return backfilling;
+  }
+
+  async function subscribe() {
+    if (filter) await provider.off(filter, enqueue);
+    filter = { address: await contract.getAddress(), topics: [topics] };
+    await provider.on(filter, enqueue);
+  }
+
+  // Wallet filters expire while the tab sleeps and die with the connection:
+  // re-install the subscription, then fetch what was missed
+  async function resume() {
+    if (stopped) return;
+    try {
+      await subscribe();
+    } catch (error) {
+      console.error("[liveEvents] Resubscribe failed:", error);
+    }
+    await backfill();
+  }
+
+  function onVisibilityChange() {
+    if (document.visibilityState === "visible") resume();
+  }
+
+  return {
+    /** Subscribe; logs after fromBlock (default: current head) are delivered */
+    async start(fromBlock = null) {
+      if (!stopped) return;
+      stopped = false;
+      lastBlock = fromBlock;
+      await subscribe();
+      await backfill();
+      if (typeof document !== "undefined") {
+        document.addEventListener("visibilitychange", onVisibilityChange);
+      }
+      if (typeof window !== "undefined") {
+        window.addEventListener("online", resume);
+        window.ethereum?.on?.("connect", resume);
+      }
+    },
+
+    async stop() {
+      stopped = true;
+      if (typeof document !== "undefined") {
+        document.removeEventListener("visibilitychange", onVisibilityChange);
+      }
+      if (typeof window !== "undefined") {
+        window.removeEventListener("online", resume);
+        window.ethereum?.removeListener?.("connect", resume);
+      }
+      if (filter) await provider.off(filter, enqueue);
+      filter = null;
+      await flush();
+    },
+
+    backfill,
+    flush,
+  };
+}
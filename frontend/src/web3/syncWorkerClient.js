@@ -0,0 +1,133 @@
+/**
+ * Tab side of the chain sync SharedWorker (workers/chainSync.worker.js)
+ *
+ * - Used when the browser has SharedWorker and VITE_RPC_URL is set (the
+ *   worker cannot reach MetaMask, it talks to the RPC endpoint directly);
+ *   otherwise useProductSync keeps syncing in the tab
+ * - One connection per tab; snapshot / delta messages go to the handlers
+ *   registered by connectSyncWorker
+ * - Tells the worker when the tab wakes up so missed blocks are backfilled
+ * - If the first snapshot fails, the connection is dropped and the worker is
+ *   reported unsupported for the rest of the tab's life: the tab syncs itself
+ */
+
+const RPC_URL = import.meta.env.VITE_RPC_URL || "";
+
+let client = null;
+let failed = false;
+
+export function isSyncWorkerSupported() {
+  return (
+    !failed &&
+    typeof SharedWorker !== "undefined" &&
+    /^(https?|wss?):\/\//.test(RPC_URL)
+  );
+}
+
+/**
+ * Connect this tab to the shared sync worker (once; later calls return the
+ * same client).
+ * @param {object} handlers
+ * @param {Function} handlers.onSnapshot - ({ batches, entries }) per snapshot
+ *   page on connect; firstSnapshot resolves after the last one
+ * @param {Function} handlers.onDelta - ({ batches, entries }) per live window
+ * @returns {{ firstSnapshot: Promise, sync: Function }|null} null if unsupported
+ */
+export function connectSyncWorker({ onSnapshot, onDelta } = {}) {
+  if (client) return client;
+  if (!isSyncWorkerSupported()) return null;
+
+  const worker = new SharedWorker(
+    new URL("../workers/chainSync.worker.js", import.meta.url),
+    { type: "module", name: "agrichain-chain-sync" }
+  );
+  const port = worker.port;
+  const requests = new Map(); // requestId → { resolve, reject }
+  let nextRequestId = 1;
+  let resolveSnapshot;
+  let rejectSnapshot;
+  const firstSnapshot = new Promise((resolve, reject) => {
+    resolveSnapshot = resolve;
+    rejectSnapshot = reject;
+  });
+
+  async function handle(data) {
+    switch (data.type) {
+      case "snapshot":
+        try {
+          await onSnapshot?.(data);
+          if (data.done) resolveSnapshot();
+        } catch (error) {
+          rejectSnapshot(error);
+        }
+        break;
+      case "delta":
+        await onDelta?.(data);
+        break;
+      case "synced":
+        requests.get(data.requestId)?.resolve();
+        requests.delete(data.requestId);
+        break;
+      case "error":
+        console.error("[syncWorker]", data.message);
+        if (data.requestId !== undefined) {
+          requests.get(data.requestId)?.reject(new Error(data.message));
+          requests.delete(data.requestId);
+        } else {
+          rejectSnapshot(new Error(data.message));
+        }
+        break;
+      default:
+        break;
+    }
+  }
+
+  // Apply messages one at a time: a delta never lands mid-snapshot
+  let queue = Promise.resolve();
+  port.onmessage = ({ data }) => {
+    queue = queue.then(() => handle(data)).catch((error) => {
+      console.error("[syncWorker] Failed to apply message:", error);
+    });
+  };
+  port.start();
+
+  document.addEventListener("visibilitychange", () => {
+    if (document.visibilityState === "visible") {
+      port.postMessage({ type: "resume" });
+    }
+  });
+  window.addEventListener("online", () => port.postMessage({ type: "resume" }));
+  window.addEventListener("pagehide", () => port.postMessage({ type: "close" }));
+  // Back from the bfcache: any message re-registers the port
+  window.addEventListener("pageshow", (event) => {
+    if (event.persisted) port.postMessage({ type: "resume" });
+  });
+
+  firstSnapshot.catch((error) => {
+    failed = true;
+    client = null;
+    for (const { reject } of requests.values()) reject(error);
+    requests.clear();
+    port.postMessage({ type: "close" });
+    port.close();
+  });
+
+  client = {
+    firstSnapshot,
+
+    /** Ask the worker to pick up new blocks now; resolves after their delta */
+    sync() {
+      const requestId = nextRequestId++;
+      return new Promise((resolve, reject) => {
+        requests.set(requestId, { resolve, reject });
+        port.postMessage({ type: "sync", requestId });
+      });
+    },
+  };
+  return client;
+}
+
+/** The tab's worker client, if connectSyncWorker succeeded */
+export function getSyncWorkerClient() {
+  return client;
+}
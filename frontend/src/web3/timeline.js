@@ -0,0 +1,127 @@
+/**
+ * Contract log → product timeline mapping
+ *
+ * Pure functions shared by the tab (useProductSync) and the chain sync
+ * worker, which rebuilds timelines off the main thread: no Vue, no window
+ */
+
+const ZERO_ADDRESS = "0x0000000000000000000000000000000000000000";
+
+export const STATUS_MAP = {
+  0: "NOT_EXIST",
+  1: "HARVESTED",
+  2: "INSPECTING",
+  3: "IN_TRANSIT",
+  4: "DELIVERED",
+  5: "RETAILED",
+  6: "CONSUMED",
+  7: "RECALLED",
+};
+
+function determineEventType(oldStatusNum, newStatusNum) {
+  if (oldStatusNum === 1 && newStatusNum === 2) return "ATTESTED";
+  if (oldStatusNum === 2 && newStatusNum === 3) return "TRANSFER";
+  if (oldStatusNum === 3 && newStatusNum === 4) return "TRANSFER";
+  if (oldStatusNum === 4 && newStatusNum === 5) return "STATUS_UPDATED";
+  if (oldStatusNum === 5 && newStatusNum === 6) return "STATUS_UPDATED";
+  if (newStatusNum === 7) return "RECALL";
+  return "STATUS_UPDATED";
+}
+
+export function batchIdFromLog(log) {
+  return Number(log.args.batchId ?? log.args.tokenId);
+}
+
+// Map a cached contract log to a product timeline entry (null = not shown).
+// Without product (sync worker) REGISTERED gets no location; the tab fills it
+// from the product's metadata when applying the entry
+export function timelineEntryFromLog(log, product = null) {
+  const args = log.args;
+  const base = {
+    timestamp: new Date(log.timestamp * 1000).toISOString(),
+    txHash: log.transactionHash,
+    logIndex: log.logIndex,
+    blockNumber: log.blockNumber,
+  };
+
+  switch (log.eventName) {
+    case "BatchMinted":
+      if (!args.farmer) return null;
+      return {
+        ...base,
+        type: "REGISTERED",
+        actor: args.farmer.toLowerCase(),
+        statusTo: "HARVESTED",
+        location: product?.metadata?.location || "",
+      };
+
+    case "BatchInspected":
+      if (!args.inspector) return null;
+      return {
+        ...base,
+        type: "ATTESTED",
+        actor: args.inspector.toLowerCase(),
+        statusFrom: "HARVESTED",
+        statusTo: "INSPECTING",
+        location: "Certificate attached via Inspector",
+      };
+
+    case "StatusUpdated": {
+      if (
+        args.updater === undefined ||
+        args.oldStatus === undefined ||
+        args.newStatus === undefined
+      ) {
+        return null;
+      }
+      return {
+        ...base,
+        type: determineEventType(Number(args.oldStatus), Number(args.newStatus)),
+        actor: args.updater.toLowerCase(),
+        statusFrom: STATUS_MAP[Number(args.oldStatus)],
+        statusTo: STATUS_MAP[Number(args.newStatus)],
+        location: `Status updated by ${args.updater.slice(0, 10)}...`,
+      };
+    }
+
+    case "Transfer":
+      // Skip mint transfers (from 0x0)
+      if (!args._from || !args._to || args._from === ZERO_ADDRESS) return null;
+      return {
+        ...base,
+        type: "TRANSFER",
+        actor: args._to.toLowerCase(),
+        location: `Transferred from ${args._from.slice(
+          0,
+          10
+        )}... to ${args._to.slice(0, 10)}...`,
+      };
+
+    case "BatchRecalled":
+      if (!args.caller) return null;
+      return {
+        ...base,
+        type: "RECALL",
+        actor: args.caller.toLowerCase(),
+        statusTo: "RECALLED",
+        reasonHash: args.reasonHash,
+        location: "Product recalled by admin",
+      };
+
+    default:
+      return null;
+  }
+}
+
+// Apply logs to a products store's timelines (getById / addEvent); logs for
+// batches the store does not know are skipped, duplicates are the store's job
+export function applyTimelineLogs(productsStore, logs) {
+  for (const log of logs) {
+    const batchId = batchIdFromLog(log);
+    const product = productsStore.getById(batchId);
+    if (!product) continue;
+
+    const entry = timelineEntryFromLog(log, product);
+    if (entry) productsStore.addEvent(batchId, entry);
+  }
+}
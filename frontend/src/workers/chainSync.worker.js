@@ -0,0 +1,205 @@
+/**
+ * Chain sync SharedWorker: one per browser, shared by every tab and view
+ *
+ * - Owns the log cursor and cache (eventSync: IndexedDB checkpoint + logs)
+ *   and the live log stream (liveEvents), over its own JSON-RPC provider:
+ *   MetaMask's window.ethereum is not available inside workers
+ * - Reads current batch state with getBatchesInRange pages, decodes logs and
+ *   rebuilds timeline entries here, off the tabs' main threads
+ * - A tab that connects gets the snapshot (all batches + entries) in pages of
+ *   at most SNAPSHOT_PAGE items, batches first; only then does it join the
+ *   broadcast set, and every coalesced live window reaches it as a "delta"
+ *
+ * Messages to tabs:
+ *   { type: "snapshot" | "delta", batches: [{ id, owner, status, uri }],
+ *     entries: [[batchId, timelineEntry], ...] }
+ *     (snapshot pages also carry done: true on the last one)
+ *   { type: "synced", requestId } / { type: "error", message, requestId? }
+ * Messages from tabs:
+ *   { type: "sync", requestId }  backfill + flush now, answer "synced"
+ *   { type: "resume" }           tab woke up: backfill missed blocks
+ *   { type: "close" }            tab is going away
+ */
+
+import { ethers } from "ethers";
+import { CONTRACT_ABI, CONTRACT_ADDRESS } from "../web3/contractConfig";
+import { getBatchesByIds } from "../web3/contractClient";
+import { syncContractEvents } from "../web3/eventSync";
+import { createLiveEventStream } from "../web3/liveEvents";
+import { batchIdFromLog, timelineEntryFromLog } from "../web3/timeline";
+import { createLimiter } from "../utils/helpers";
+
+const RPC_URL = import.meta.env.VITE_RPC_URL;
+const LOAD_CONCURRENCY = Number(import.meta.env.VITE_LOAD_CONCURRENCY || 8);
+const SNAPSHOT_PAGE = 2000; // batches or timeline entries per snapshot message
+
+const provider = new ethers.JsonRpcProvider(RPC_URL);
+const contract = new ethers.Contract(CONTRACT_ADDRESS, CONTRACT_ABI, provider);
+
+const ports = new Set(); // tabs that have their snapshot: deltas go here
+const snapshotted = new WeakSet(); // every port ever sent a full snapshot
+const batches = new Map(); // batch id → { id, owner, status, uri }
+const entries = new Map(); // batch id → timeline entries, chain order
+let ready = null; // initial sync, shared by every connecting tab
+let stream = null;
+
+function plainBatch(view) {
+  return {
+    id: Number(view.id),
+    owner: view.owner.toLowerCase(),
+    status: Number(view.status),
+    uri: view.uri,
+  };
+}
+
+function broadcast(message) {
+  for (const port of ports) port.postMessage(message);
+}
+
+// Timeline entries for logs, recorded per batch; returns them as [id, entry]
+function addEntries(logs) {
+  const added = [];
+  for (const log of logs) {
+    const entry = timelineEntryFromLog(log);
+    if (!entry) continue;
+    const id = batchIdFromLog(log);
+    if (!entries.has(id)) entries.set(id, []);
+    entries.get(id).push(entry);
+    added.push([id, entry]);
+  }
+  return added;
+}
+
+// Post the whole state to one tab, page by page, then add it to the broadcast
+// set. Synchronous, so no delta can land between the pages
+function sendSnapshot(port) {
+  const post = (page, done = false) =>
+    port.postMessage({ type: "snapshot", batches: [], entries: [], ...page, done });
+
+  const views = [...batches.values()];
+  for (let start = 0; start < views.length; start += SNAPSHOT_PAGE) {
+    post({ batches: views.slice(start, start + SNAPSHOT_PAGE) });
+  }
+  let page = [];
+  for (const [id, list] of entries) {
+    for (const entry of list) {
+      page.push([id, entry]);
+      if (page.length === SNAPSHOT_PAGE) {
+        post({ entries: page });
+        page = [];
+      }
+    }
+  }
+  post({ entries: page }, true);
+
+  snapshotted.add(port);
+  ports.add(port);
+}
+
+// One coalesced live window: state already read back, fetch the log delta
+// (persisted to the cache, checkpoint advanced) and send both to every tab
+async function applyFlush({ batches: views }) {
+  const changed = views.map(plainBatch);
+  for (const batch of changed) batches.set(batch.id, batch);
+  const { logs } = await syncContractEvents(contract, { includeCached: false });
+  broadcast({ type: "delta", batches: changed, entries: addEntries(logs) });
+}
+
+async function initialSync() {
+  const start = performance.now();
+  const limit = createLimiter(LOAD_CONCURRENCY);
+  const timeline = syncContractEvents(contract);
+  timeline.catch(() => {}); // awaited below
+
+  const [tokenCounter, pageSize] = (
+    await Promise.all([contract.tokenCounter(), contract.get_MAX_BATCH_PAGE()])
+  ).map(Number);
+  const pageStarts = [];
+  for (let first = 1; first <= tokenCounter; first += pageSize) {
+    pageStarts.push(first);
+  }
+  const pages = await Promise.all(
+    pageStarts.map((first) =>
+      limit(() => contract.getBatchesInRange(first, pageSize))
+    )
+  );
+  for (const view of pages.flat()) {
+    if (Number(view.status) !== 0) batches.set(Number(view.id), plainBatch(view));
+  }
+
+  const { logs, cachedCount, freshCount, lastBlock } = await timeline;
+  addEntries(logs);
+  console.log(
+    `[chainSync] ${batches.size} batches, ${cachedCount} cached + ` +
+      `${freshCount} new logs in ${Math.round(performance.now() - start)} ms`
+  );
+
+  stream = createLiveEventStream(contract, {
+    readBatches: (ids) => getBatchesByIds(ids, contract),
+    onFlush: applyFlush,
+  });
+  await stream.start(lastBlock);
+}
+
+function ensureSynced() {
+  if (!ready) {
+    ready = initialSync().catch((error) => {
+      ready = null; // next tab / request retries
+      throw error;
+    });
+  }
+  return ready;
+}
+
+async function handleMessage(port, message) {
+  // Any message but "close" re-registers a port that already has its
+  // snapshot, e.g. after the bfcache
+  if (message?.type !== "close" && snapshotted.has(port)) ports.add(port);
+
+  switch (message?.type) {
+    case "sync":
+      try {
+        await ensureSynced();
+        await stream.backfill();
+        await stream.flush();
+        port.postMessage({ type: "synced", requestId: message.requestId });
+      } catch (error) {
+        port.postMessage({
+          type: "error",
+          message: error.message,
+          requestId: message.requestId,
+        });
+      }
+      break;
+    case "resume":
+      if (stream) {
+        stream
+          .backfill()
+          .then(() => stream.flush())
+          .catch((error) => {
+            console.error("[chainSync] Resume backfill failed:", error);
+            broadcast({ type: "error", message: error.message });
+          });
+      }
+      break;
+    case "close":
+      ports.delete(port);
+      break;
+    default:
+      break;
+  }
+}
+
+self.onconnect = (event) => {
+  const port = event.ports[0];
+  port.onmessage = ({ data }) => handleMessage(port, data);
+  port.start();
+
+  ensureSynced().then(
+    () => sendSnapshot(port),
+    (error) => {
+      console.error("[chainSync] Initial sync failed:", error);
+      port.postMessage({ type: "error", message: error.message });
+    }
+  );
+};
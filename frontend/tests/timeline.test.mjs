@@ -0,0 +1,79 @@
+/**
+ * reloadProductEvents applies the sync delta through applyTimelineLogs. The
+ * delta covers every batch since the shared checkpoint, so a reload for one
+ * product must still land the other batches' logs on their timelines.
+ *
+ * Usage:
+ *   npm test
+ */
+
+import assert from "node:assert/strict";
+import test from "node:test";
+
+import { createEventDedup } from "../src/stores/productIndex.js";
+import { applyTimelineLogs } from "../src/web3/timeline.js";
+
+const FARMER = "0x1111111111111111111111111111111111111111";
+const LOGISTICS = "0x3333333333333333333333333333333333333333";
+
+// getById / addEvent as useProductsStore does them, on plain objects
+function createStore(ids) {
+  const products = new Map(ids.map((id) => [id, { id, events: [] }]));
+  const dedup = createEventDedup();
+  return {
+    getById: (id) => products.get(Number(id)),
+    addEvent(id, event) {
+      const product = products.get(id);
+      if (!dedup.claim(product, event)) return null;
+      product.events.push(event);
+      return event;
+    },
+  };
+}
+
+function transferLog(tokenId, blockNumber, logIndex) {
+  return {
+    eventName: "Transfer",
+    blockNumber,
+    logIndex,
+    transactionHash: `0x${blockNumber.toString(16).padStart(64, "0")}`,
+    timestamp: 1735689600 + blockNumber,
+    args: { _from: FARMER, _to: LOGISTICS, tokenId: String(tokenId) },
+  };
+}
+
+test("a one-product reload delta reaches every batch it touches", () => {
+  const store = createStore([1, 2]);
+  const known = transferLog(2, 10, 0);
+  applyTimelineLogs(store, [known]);
+
+  // Reloading product 1 after its transfer; batch 2 moved in the same range
+  const delta = [transferLog(1, 11, 0), transferLog(2, 11, 1)];
+  applyTimelineLogs(store, delta);
+
+  assert.deepEqual(
+    store.getById(1).events.map((e) => [e.blockNumber, e.logIndex]),
+    [[11, 0]]
+  );
+  assert.deepEqual(
+    store.getById(2).events.map((e) => [e.blockNumber, e.logIndex]),
+    [[10, 0], [11, 1]]
+  );
+});
+
+test("replaying logs already on a timeline adds nothing", () => {
+  const store = createStore([1]);
+  const logs = [transferLog(1, 10, 0), transferLog(1, 11, 0)];
+  applyTimelineLogs(store, logs);
+  applyTimelineLogs(store, logs);
+
+  assert.equal(store.getById(1).events.length, 2);
+});
+
+test("logs for batches the store does not hold are skipped", () => {
+  const store = createStore([1]);
+  applyTimelineLogs(store, [transferLog(3, 10, 0)]);
+
+  assert.equal(store.getById(1).events.length, 0);
+  assert.equal(store.getById(3), undefined);
+});